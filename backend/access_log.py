@@ -0,0 +1,111 @@
+import os
+import sys
+import json
+import atexit
+import queue
+import random
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+ACCESS_LOGGER = "portfolio.access"
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue records untouched; formatting happens on the listener thread"""
+
+    def prepare(self, record):
+        return record
+
+class JSONLineFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {"ts": round(record.created, 3)}
+        entry.update(record.msg if isinstance(record.msg, dict) else {"message": record.getMessage()})
+        return json.dumps(entry, separators=(",", ":"), ensure_ascii=False)
+
+class AccessLog:
+    """Structured access log written by a background listener thread.
+
+    Successful GETs are sampled at `sample_rate`; errors (status >= 400) and
+    requests slower than `slow_ms` are always written.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, slow_ms: float = 500.0):
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.logger = logging.getLogger(ACCESS_LOGGER)
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def should_log(self, method: str, status: int, duration_ms: float) -> bool:
+        if status >= 400 or duration_ms >= self.slow_ms:
+            return True
+        if method != "GET" or self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate
+
+    def record(self, method: str, path: str, status: int, duration: float, request_id: str,
+               client: Optional[str] = None):
+        duration_ms = duration * 1000
+        if not self.should_log(method, status, duration_ms):
+            return
+        self.logger.info({
+            "method": method,
+            "path": path,
+            "status": status,
+            "duration_ms": round(duration_ms, 3),
+            "request_id": request_id,
+            "client": client
+        })
+
+_listener: Optional[QueueListener] = None
+
+def setup_logging(level=logging.INFO, access_stream=None) -> QueueListener:
+    """Route application and access logs through a queue to a listener thread.
+
+    Callers on the event loop only enqueue records; formatting and stream
+    writes happen on the listener thread.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.SimpleQueue()
+
+    app_handler = logging.StreamHandler()
+    app_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    # Only route access records to the JSON handler; app records go to the default one.
+    app_handler.addFilter(lambda record: record.name != ACCESS_LOGGER)
+
+    access_handler = logging.StreamHandler(access_stream or sys.stdout)
+    access_handler.setFormatter(JSONLineFormatter())
+    access_handler.addFilter(lambda record: record.name == ACCESS_LOGGER)
+
+    queue_handler = _DeferredQueueHandler(log_queue)
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+    logging.getLogger(ACCESS_LOGGER).addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, app_handler, access_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    os.register_at_fork(before=_pause_listener, after_in_parent=_resume_listener,
+                        after_in_child=_resume_listener)
+    return _listener
+
+def _pause_listener():
+    # A listener thread caught mid-write at fork would leave the child's
+    # stream locks held, so drain and stop it first; both sides restart it.
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+def _resume_listener():
+    if _listener is not None and _listener._thread is None:
+        _listener.start()
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,99 @@
+from typing import Annotated, Callable, Optional
+
+from pydantic import TypeAdapter
+
+from models import ProfileData, Experience, Project
+from storage import item_keys
+
+LIST_MODELS = {
+    "experience": Experience,
+    "projects": Project
+}
+
+class KeyConflict(ValueError):
+    """The change would rename an entry onto, or shift, another entry's key"""
+
+def _merge(current, patch):
+    if not isinstance(current, dict) or not isinstance(patch, dict):
+        raise ValueError("PATCH needs a JSON object for an object-valued entry; use PUT to replace it")
+    return {**current, **patch}
+
+def change_profile(snapshot, store, name: str, operation: str, payload=None,
+                   expand: Optional[Callable] = None) -> tuple[dict, Optional[str]]:
+    """Validate and persist a change to one profile field.
+
+    `expand` is the ImageManifest.expand a full reload applies; the stored
+    value stays unexpanded. Returns the new normalized profile and the field
+    name (None once deleted). Raises LookupError for unknown fields,
+    ValueError for bad changes and pydantic.ValidationError when the value
+    does not fit the field.
+    """
+    model_field = ProfileData.model_fields.get(name)
+    if model_field is None:
+        raise LookupError(f"Unknown profile field: {name}")
+    # Keep Annotated validators, such as the path shorthand for pictures
+    adapter = TypeAdapter(Annotated[(model_field.annotation, *model_field.metadata)] if model_field.metadata
+                          else model_field.annotation)
+    if operation == "delete":
+        if model_field.is_required():
+            raise ValueError(f"Profile field {name} is required and cannot be deleted")
+        store.delete("profile", name)
+        # A full reload dumps a missing optional field as its default, such as null
+        value, result = adapter.dump_python(model_field.get_default(call_default_factory=True), mode="json"), None
+    else:
+        raw = _merge(store.read_item("profile", name), payload) if operation == "patch" else payload
+        expanded = expand({name: raw}, [])[0][name] if expand else raw
+        value = adapter.dump_python(adapter.validate_python(expanded), mode="json")
+        store.put("profile", name, raw)
+        result = name
+    # Rebuild in model field order so the rendered profile matches a full reload
+    profile = {**snapshot.profile, name: value}
+    return {key: profile[key] for key in ProfileData.model_fields if key in profile}, result
+
+def change_entry(snapshot, store, section: str, key: str, operation: str, payload=None,
+                 expand: Optional[Callable] = None) -> tuple[tuple, Optional[str]]:
+    """Validate and persist a change to one experience or project entry.
+
+    PUT replaces the entry or appends a new one, PATCH merges into the stored
+    entry. Only the changed entry is validated, after the same `expand` as
+    change_profile. Entries are keyed by the slug of their title (or company
+    and role), so an edit that changes it moves the entry to a new key; the
+    key is returned (None once deleted).
+    """
+    items = list(getattr(snapshot, section))
+    keys = list(snapshot.keys[section])
+    position = keys.index(key) if key in keys else None
+
+    if operation == "delete":
+        if position is None:
+            raise LookupError(f"No {section} entry with key {key}")
+        del items[position], keys[position]
+        if item_keys(section, items) != keys:
+            raise KeyConflict(f"Deleting {key} would change the keys of other {section} entries")
+        store.delete(section, key)
+        return tuple(items), None
+
+    if operation == "patch":
+        if position is None:
+            raise LookupError(f"No {section} entry with key {key}")
+        raw = _merge(store.read_item(section, key), payload)
+    elif not isinstance(payload, dict):
+        raise ValueError(f"A {section} entry must be a JSON object")
+    else:
+        raw = payload
+
+    expanded = expand({}, [raw])[1][0] if expand and section == "projects" else raw
+    item = LIST_MODELS[section].model_validate(expanded).model_dump(mode="json")
+    if position is None:
+        items.append(item)
+        position = len(keys)
+    else:
+        items[position] = item
+    new_keys = item_keys(section, items)
+    if new_keys[:position] + new_keys[position + 1:] != keys[:position] + keys[position + 1:]:
+        raise KeyConflict(f"{new_keys[position]} would collide with another {section} entry")
+    if key not in snapshot.keys[section] and new_keys[position] != key:
+        raise ValueError(f"A new entry with this content must be created at key {new_keys[position]}")
+
+    store.put(section, new_keys[position], raw, previous_key=key)
+    return tuple(items), new_keys[position]
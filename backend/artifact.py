@@ -0,0 +1,94 @@
+import os
+import json
+import mmap
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+from jsonenc import dumps
+
+# Layout: MAGIC, one JSON header line, then the section bodies back to back.
+# The header maps each section to [offset, length] within the body area, so a
+# reader can hand out a section's ready-to-send JSON bytes without parsing it.
+MAGIC = b"PORTFOLIO-DATA/1\n"
+SECTIONS = ("profile", "experience", "projects", "portfolio")
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def build_artifact(profile_data, experience_data, projects_data, source_hash: str) -> bytes:
+    bodies = {
+        "profile": dumps(profile_data),
+        "experience": dumps(experience_data),
+        "projects": dumps(projects_data),
+        "portfolio": dumps({
+            "profile": profile_data,
+            "experience": experience_data,
+            "projects": projects_data
+        })
+    }
+
+    offsets, position = {}, 0
+    for name in SECTIONS:
+        offsets[name] = [position, len(bodies[name])]
+        position += len(bodies[name])
+
+    header = {
+        "source_hash": source_hash,
+        "content_hash": hashlib.sha256(bodies["portfolio"]).hexdigest(),
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "sections": offsets
+    }
+    return MAGIC + json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n" + b"".join(
+        bodies[name] for name in SECTIONS
+    )
+
+def write_artifact(path: str, content: bytes):
+    """Write atomically so a running reader never sees a partial file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+class PortfolioArtifact:
+    """Read-only, memory-mapped view of a compiled data artifact"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a portfolio data artifact")
+        header_end = self._mm.find(b"\n", len(MAGIC))
+        self.header = json.loads(self._mm[len(MAGIC):header_end])
+        self._base = header_end + 1
+        self._sections = {}
+
+    @property
+    def source_hash(self) -> str:
+        return self.header["source_hash"]
+
+    def body(self, name: str) -> bytes:
+        """Pre-rendered JSON bytes for one section"""
+        offset, length = self.header["sections"][name]
+        start = self._base + offset
+        return self._mm[start:start + length]
+
+    def section(self, name: str):
+        if name not in self._sections:
+            self._sections[name] = json.loads(self.body(name))
+        return self._sections[name]
+
+    def close(self):
+        self._mm.close()
+
+def load_current_artifact(path: str, source_path: str) -> Optional[PortfolioArtifact]:
+    """Open the artifact only if it was compiled from the current source file"""
+    if not os.path.exists(path):
+        return None
+    artifact = PortfolioArtifact(path)
+    if artifact.source_hash != file_hash(source_path):
+        artifact.close()
+        return None
+    return artifact
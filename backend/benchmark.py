@@ -0,0 +1,495 @@
+"""Benchmark the FastAPI app in-process (ASGI) and over a real uvicorn socket.
+
+    python benchmark.py [--mode asgi|socket|both] [--requests 2000] [--concurrency 32]
+                        [--endpoints profile,contact,...] [--save-baseline FILE]
+                        [--compare FILE] [--threshold 0.2]
+
+Contact messages are delivered to a local SMTP sink started by the benchmark,
+and the outbox and rate-limit state live in a temporary directory. CPU per
+request is measured from the server process: in ASGI mode that process also
+runs the client, so its figures include client overhead. With --compare the
+run exits non-zero when any endpoint's req/s or p95 regresses past the
+threshold.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import socket
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+from typing import Optional
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ENDPOINTS = {
+    "profile": ("GET", "/api/profile"),
+    "experience": ("GET", "/api/experience"),
+    "projects": ("GET", "/api/projects"),
+    "portfolio": ("GET", "/api/portfolio"),
+    "health": ("GET", "/api/health"),
+    "metrics": ("GET", "/api/metrics"),
+    "contact": ("POST", "/api/contact"),
+    "reload": ("POST", "/api/reload")
+}
+
+REQUEST_HEADERS = [(b"accept-encoding", b"gzip, br"), (b"content-type", b"application/json")]
+
+def contact_body(i: int) -> bytes:
+    # Unique messages so every request is queued rather than deduplicated
+    return json.dumps({
+        "name": "Benchmark",
+        "email": "bench@example.com",
+        "message": f"Benchmark message {i} at {time.time()}"
+    }).encode("utf-8")
+
+def request_body(endpoint: str, i: int) -> bytes:
+    return contact_body(i) if endpoint == "contact" else b""
+
+class SMTPSink:
+    """Minimal SMTP server that accepts AUTH and counts delivered messages"""
+
+    def __init__(self):
+        self.messages = 0
+        self.connections = 0
+        self.server = None
+        self.port = None
+
+    async def start(self, host: str = "127.0.0.1"):
+        self.server = await asyncio.start_server(self._handle, host, 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        reply = lambda line: writer.write(line.encode("ascii") + b"\r\n")
+        reply("220 benchmark-sink ESMTP")
+        in_data = False
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if in_data:
+                    if line.rstrip(b"\r\n") == b".":
+                        in_data = False
+                        self.messages += 1
+                        reply("250 OK queued")
+                        await writer.drain()
+                    continue
+                command = line.decode("ascii", "replace").strip().upper()
+                if command.startswith(("EHLO", "HELO")):
+                    for ext in ("250-benchmark-sink", "250-AUTH PLAIN LOGIN", "250 8BITMIME"):
+                        reply(ext)
+                elif command.startswith("AUTH"):
+                    reply("235 Authentication successful")
+                elif command.startswith("DATA"):
+                    reply("354 End data with <CR><LF>.<CR><LF>")
+                    in_data = True
+                elif command.startswith("QUIT"):
+                    reply("221 Bye")
+                    await writer.drain()
+                    break
+                else:
+                    reply("250 OK")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+def server_env(workdir: str, smtp_port: int) -> dict:
+    return {
+        "SMTP_HOST": "127.0.0.1",
+        "SMTP_PORT": str(smtp_port),
+        "SMTP_STARTTLS": "false",
+        "SMTP_USERNAME": "benchmark",
+        "SMTP_PASSWORD": "benchmark",
+        "SMTP_FROM_EMAIL": "benchmark@localhost",
+        "SMTP_TO_EMAIL": "benchmark@localhost",
+        "OUTBOX_PATH": os.path.join(workdir, "outbox.db"),
+        "RATE_LIMIT_DB": os.path.join(workdir, "ratelimit.db"),
+        # Measure the handlers, not the abuse limits
+        "CONTACT_BURST": "1000000000",
+        "CONTACT_RATE_PER_MINUTE": "1000000000",
+        "CONTACT_GLOBAL_LIMIT": "0",
+        "ACCESS_LOG_SAMPLE_RATE": "0",
+        "ACCESS_LOG_SLOW_MS": "1000000",
+        "DATA_WATCH_INTERVAL": "3600",
+        "DEBUG": "false"
+    }
+
+class ASGITarget:
+    """Drive the app in this process through its ASGI interface"""
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan = None
+        self._receive = asyncio.Queue()
+        self._send = asyncio.Queue()
+
+    async def start(self):
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._lifespan = asyncio.create_task(self.app(scope, self._receive.get, self._send.put))
+        await self._receive.put({"type": "lifespan.startup"})
+        message = await self._send.get()
+        if message["type"] != "lifespan.startup.complete":
+            raise RuntimeError(f"App startup failed: {message}")
+
+    async def stop(self):
+        await self._receive.put({"type": "lifespan.shutdown"})
+        await self._send.get()
+        await self._lifespan
+
+    def cpu_seconds(self) -> float:
+        return time.process_time()
+
+    def connect(self):
+        return self
+
+    async def close(self):
+        pass
+
+    async def request(self, method: str, path: str, body: bytes) -> int:
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": method, "scheme": "http", "path": path, "raw_path": path.encode(),
+            "query_string": b"", "root_path": "", "headers": REQUEST_HEADERS,
+            "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000), "state": {}
+        }
+        received = False
+        status = 0
+
+        async def receive():
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await asyncio.Event().wait()
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await self.app(scope, receive, send)
+        return status
+
+class HTTPConnection:
+    """Keep-alive HTTP/1.1 client connection over asyncio streams"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method: str, path: str, body: bytes) -> int:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        head = (
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Accept-Encoding: gzip, br\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode("ascii")
+        self.writer.write(head + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        status = int(status_line.split()[1])
+        length, chunked, close = 0, False, False
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding" and "chunked" in value:
+                chunked = True
+            elif name == "connection" and value == "close":
+                close = True
+
+        if chunked:
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif length:
+            await self.reader.readexactly(length)
+        if close:
+            await self.close()
+        return status
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+class SocketTarget:
+    """Run uvicorn in a child process and drive it over TCP"""
+
+    def __init__(self, env: dict, workdir: str, host: str = "127.0.0.1", port: int = 8765):
+        self.env = {**os.environ, **env}
+        self.workdir = workdir
+        self.host = host
+        self.port = port
+        self.process = None
+
+    def _check_port_free(self):
+        # Otherwise the readiness probe could pass against whatever already listens there
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            try:
+                probe.bind((self.host, self.port))
+            except OSError as e:
+                raise RuntimeError(f"Port {self.port} on {self.host} is already in use ({e}); pick another with --port")
+
+    async def start(self):
+        self._check_port_free()
+        log = open(os.path.join(self.workdir, "uvicorn.log"), "wb")
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", self.host, "--port", str(self.port),
+             "--no-access-log", "--log-level", "warning"],
+            cwd=BACKEND_DIR, env=self.env, stdout=log, stderr=subprocess.STDOUT
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited early; see {log.name}")
+            connection = HTTPConnection(self.host, self.port)
+            try:
+                if await connection.request("GET", "/api/health", b"") == 200:
+                    return
+            except (OSError, EOFError, ValueError, IndexError):
+                # Not listening yet, or a half-written or malformed response
+                pass
+            finally:
+                await connection.close()
+            await asyncio.sleep(0.1)
+        raise RuntimeError("uvicorn did not become healthy within 30s")
+
+    async def stop(self):
+        self.process.terminate()
+        try:
+            await asyncio.to_thread(self.process.wait, 15)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+    def cpu_seconds(self) -> Optional[float]:
+        # utime + stime of the server process; Linux only
+        try:
+            with open(f"/proc/{self.process.pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def connect(self):
+        return HTTPConnection(self.host, self.port)
+
+def percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+async def drive(target, endpoint: str, indices: range, concurrency: int,
+                latencies: Optional[list] = None, statuses: Optional[dict] = None):
+    """Send one request per index from `concurrency` workers, each on its own connection"""
+    method, path = ENDPOINTS[endpoint]
+    counter = iter(indices)
+
+    async def worker():
+        connection = target.connect()
+        try:
+            for i in counter:
+                body = request_body(endpoint, i)
+                started = time.perf_counter()
+                status = await connection.request(method, path, body)
+                if latencies is not None:
+                    latencies.append(time.perf_counter() - started)
+                    statuses[status] = statuses.get(status, 0) + 1
+        finally:
+            await connection.close()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+async def run_endpoint(target, endpoint: str, requests: int, concurrency: int, warmup: int) -> dict:
+    await drive(target, endpoint, range(warmup), concurrency)
+
+    latencies, statuses = [], {}
+    cpu_before = target.cpu_seconds()
+    started = time.perf_counter()
+    await drive(target, endpoint, range(warmup, warmup + requests), concurrency, latencies, statuses)
+    elapsed = time.perf_counter() - started
+    cpu_after = target.cpu_seconds()
+
+    latencies.sort()
+    count = len(latencies)
+    errors = sum(n for status, n in statuses.items() if status >= 400)
+    cpu_per_request = None
+    if cpu_before is not None and cpu_after is not None and count:
+        cpu_per_request = round((cpu_after - cpu_before) / count * 1000, 4)
+    return {
+        "requests": count,
+        "concurrency": concurrency,
+        "errors": errors,
+        "status": {str(status): n for status, n in sorted(statuses.items())},
+        "rps": round(count / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "cpu_ms_per_request": cpu_per_request
+    }
+
+async def wait_for_delivery(sink: SMTPSink, expected: int, timeout: float = 60.0) -> Optional[float]:
+    """Seconds until the sink has received `expected` messages, or None on timeout"""
+    started = time.perf_counter()
+    while sink.messages < expected:
+        if time.perf_counter() - started > timeout:
+            return None
+        await asyncio.sleep(0.05)
+    return round(time.perf_counter() - started, 3)
+
+async def run_mode(mode: str, endpoints: list, args, sink: SMTPSink, workdir: str) -> dict:
+    env = server_env(os.path.join(workdir, mode), sink.port)
+    os.makedirs(os.path.join(workdir, mode), exist_ok=True)
+    if mode == "asgi":
+        os.environ.update(env)
+        if BACKEND_DIR not in sys.path:
+            sys.path.insert(0, BACKEND_DIR)
+        import logging
+        import main
+        from access_log import ACCESS_LOGGER
+        # Keep per-request log lines out of the report
+        logging.getLogger().setLevel(logging.WARNING)
+        logging.getLogger(ACCESS_LOGGER).setLevel(logging.WARNING)
+        target = ASGITarget(main.app)
+    else:
+        target = SocketTarget(env, os.path.join(workdir, mode), port=args.port)
+
+    await target.start()
+    results = {}
+    try:
+        for endpoint in endpoints:
+            delivered_before = sink.messages
+            result = await run_endpoint(target, endpoint, args.requests, args.concurrency, args.warmup)
+            if endpoint == "contact":
+                accepted = result["status"].get("202", 0) + args.warmup
+                result["delivery_seconds"] = await wait_for_delivery(sink, delivered_before + accepted)
+                result["delivered"] = sink.messages - delivered_before
+            results[endpoint] = result
+            print_result(mode, endpoint, result)
+    finally:
+        await target.stop()
+    return results
+
+def print_result(mode: str, endpoint: str, result: dict):
+    cpu = result["cpu_ms_per_request"]
+    line = (
+        f"{mode:6} {endpoint:10} {result['rps']:>9.1f} req/s  "
+        f"p50 {result['p50_ms']:>8.3f}  p95 {result['p95_ms']:>8.3f}  p99 {result['p99_ms']:>8.3f} ms  "
+        f"cpu {cpu if cpu is not None else '-':>7} ms/req  errors {result['errors']}"
+    )
+    if "delivery_seconds" in result:
+        line += f"  delivered {result['delivered']} in {result['delivery_seconds']}s"
+    print(line, flush=True)
+
+def compare(results: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list[str]:
+    """Describe every endpoint whose throughput or p95 regressed past the threshold"""
+    regressions = []
+    for mode, endpoints in results["results"].items():
+        for endpoint, current in endpoints.items():
+            previous = baseline.get("results", {}).get(mode, {}).get(endpoint)
+            if previous is None:
+                continue
+            name = f"{mode} {endpoint}"
+            if current["rps"] < previous["rps"] * (1 - threshold):
+                regressions.append(f"{name}: {current['rps']} req/s vs baseline {previous['rps']}")
+            p95_delta = current["p95_ms"] - previous["p95_ms"]
+            if current["p95_ms"] > previous["p95_ms"] * (1 + threshold) and p95_delta > min_delta_ms:
+                regressions.append(f"{name}: p95 {current['p95_ms']} ms vs baseline {previous['p95_ms']} ms")
+            if current["errors"] > previous["errors"]:
+                regressions.append(f"{name}: {current['errors']} errors vs baseline {previous['errors']}")
+    return regressions
+
+async def benchmark(args) -> dict:
+    endpoints = args.endpoints.split(",") if args.endpoints else list(ENDPOINTS)
+    unknown = [name for name in endpoints if name not in ENDPOINTS]
+    if unknown:
+        raise SystemExit(f"Unknown endpoints: {', '.join(unknown)}")
+    modes = ["asgi", "socket"] if args.mode == "both" else [args.mode]
+
+    sink = SMTPSink()
+    await sink.start()
+    results = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "results": {}
+    }
+    try:
+        with tempfile.TemporaryDirectory(prefix="portfolio-bench-") as workdir:
+            # Socket mode first: once main is imported for ASGI mode its
+            # environment is fixed for the rest of the process.
+            for mode in sorted(modes, key=lambda m: m != "socket"):
+                results["results"][mode] = await run_mode(mode, endpoints, args, sink, workdir)
+    finally:
+        await sink.close()
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=("asgi", "socket", "both"), default="both")
+    parser.add_argument("--requests", type=int, default=2000, help="Measured requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests per endpoint")
+    parser.add_argument("--endpoints", help=f"Comma-separated subset of: {','.join(ENDPOINTS)}")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the uvicorn server in socket mode")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write results to FILE as the new baseline")
+    parser.add_argument("--compare", metavar="FILE", help="Fail if results regress against baseline FILE")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative regression in req/s and p95 (default 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Ignore p95 increases smaller than this (default 1.0)")
+    parser.add_argument("--output", metavar="FILE", help="Also write results to FILE")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(benchmark(args))
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {path}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("concurrency") != results["concurrency"]:
+            print(f"⚠️  Baseline was run at concurrency {baseline.get('concurrency')}, "
+                  f"this run at {results['concurrency']}")
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) past {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print(f"✅ No regressions past {args.threshold:.0%} against {args.compare}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
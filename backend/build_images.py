@@ -0,0 +1,153 @@
+"""Generate responsive AVIF and WebP variants of the frontend's raster images.
+
+    python build_images.py [--source ../frontend/public] [--out ../frontend/public/img] [--quality 70]
+
+Every PNG or JPEG in the source directory larger than --min-bytes is resized
+to the standard breakpoints it can fill and encoded in each format, under
+content-hashed names. The manifest maps each image's public path to its
+variants; the API turns it into srcset metadata for `photo` and `image`
+fields. Entries are cached by source hash and settings, so a rebuild only
+re-encodes images that changed.
+
+Needs Pillow. AVIF also needs Pillow 11.3+ (or pillow-avif-plugin); without
+it only WebP variants are written.
+"""
+import io
+import os
+import sys
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = None
+
+from images import FORMATS
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(os.path.dirname(BACKEND_DIR), "frontend", "public")
+
+BREAKPOINTS = (160, 320, 640, 960, 1280, 1920)
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+HASH_LENGTH = 10
+
+def available_formats() -> tuple:
+    return tuple(fmt for fmt in FORMATS if features.check(fmt))
+
+def target_widths(width: int, breakpoints=BREAKPOINTS) -> list[int]:
+    """Breakpoints narrower than the source, plus the source width capped at the largest"""
+    return sorted({w for w in breakpoints if w < width} | {min(width, max(breakpoints))})
+
+def encode_image(source_path: str, out_dir: str, url_prefix: str, formats: tuple, quality: int) -> dict:
+    """Resize and encode one image; returns its manifest entry (runs in a worker process)"""
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+    width, height = image.size
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    variants = {fmt: [] for fmt in formats}
+    for target in target_widths(width):
+        resized = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))), Image.Resampling.LANCZOS
+        )
+        for fmt in formats:
+            buffer = io.BytesIO()
+            if fmt == "webp":
+                resized.save(buffer, "WEBP", quality=quality, method=6)
+            else:
+                resized.save(buffer, "AVIF", quality=quality, speed=6)
+            content = buffer.getvalue()
+            name = f"{stem}-{target}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}.{fmt}"
+            path = os.path.join(out_dir, name)
+            if not os.path.exists(path):
+                with open(path, "wb") as f:
+                    f.write(content)
+            variants[fmt].append({"src": f"{url_prefix}/{name}", "width": target, "bytes": len(content)})
+    return {"width": width, "height": height, "variants": variants}
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def build_images(source_dir: str, out_dir: str, quality: int, min_bytes: int, jobs: int) -> dict:
+    formats = available_formats()
+    if "avif" not in formats:
+        print("⚠️  This Pillow build cannot encode AVIF; writing WebP only")
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    url_prefix = "/" + os.path.relpath(out_dir, source_dir).replace(os.sep, "/")
+    settings = {"breakpoints": list(BREAKPOINTS), "formats": list(formats), "quality": quality}
+
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f).get("images", {})
+    except (OSError, ValueError):
+        previous = {}
+
+    images, pending = {}, {}
+    for filename in sorted(os.listdir(source_dir)):
+        path = os.path.join(source_dir, filename)
+        if not filename.lower().endswith(SOURCE_EXTENSIONS) or os.path.getsize(path) < min_bytes:
+            continue
+        public_path = f"/{filename}"
+        source_hash = file_hash(path)
+        cached = previous.get(public_path)
+        if cached and cached.get("source_hash") == source_hash and cached.get("settings") == settings and all(
+            os.path.exists(os.path.join(out_dir, variant["src"].rsplit("/", 1)[1]))
+            for variants in cached["variants"].values() for variant in variants
+        ):
+            images[public_path] = cached
+            print(f"  {public_path}: unchanged")
+        else:
+            pending[public_path] = (path, source_hash)
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            public_path: pool.submit(encode_image, path, out_dir, url_prefix, formats, quality)
+            for public_path, (path, _) in pending.items()
+        }
+        for public_path, future in futures.items():
+            path, source_hash = pending[public_path]
+            images[public_path] = {"source_hash": source_hash, "settings": settings, **future.result()}
+            largest = ", ".join(
+                f"{fmt} {variants[-1]['bytes']}" for fmt, variants in images[public_path]["variants"].items()
+            )
+            print(f"✅ {public_path}: {os.path.getsize(path)} bytes; largest variant {largest}")
+
+    # Remove variants no image refers to any more
+    referenced = {
+        variant["src"].rsplit("/", 1)[1]
+        for entry in images.values() for variants in entry["variants"].values() for variant in variants
+    }
+    for filename in os.listdir(out_dir):
+        if filename != "manifest.json" and filename not in referenced:
+            os.remove(os.path.join(out_dir, filename))
+
+    manifest = {"generated_at": datetime.now(timezone.utc).isoformat(), "images": dict(sorted(images.items()))}
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default=PUBLIC_DIR)
+    parser.add_argument("--out", default=os.path.join(PUBLIC_DIR, "img"))
+    parser.add_argument("--quality", type=int, default=70)
+    parser.add_argument("--min-bytes", type=int, default=32 * 1024,
+                        help="Skip smaller sources such as icons")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    if Image is None:
+        print("❌ build_images.py needs Pillow: pip install Pillow", file=sys.stderr)
+        return 1
+    build_images(args.source, args.out, args.quality, args.min_bytes, args.jobs)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Compile backend/data.py into the data artifact used by FastAPI and Firebase.
+
+    python compile_data.py [output ...]
+
+Defaults to backend/portfolio_data.bin and functions/portfolio_data.bin.
+Runs as the Firebase Functions predeploy step, so it needs only the standard
+library; the records are validated against the API models when pydantic is
+installed.
+"""
+import os
+import sys
+
+from artifact import build_artifact, file_hash, write_artifact
+from storage import load_source
+from images import ImageManifest
+
+try:
+    from models import ProfileData, Experience, Project
+except ImportError:
+    ProfileData = None
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(BACKEND_DIR, "data.py")
+IMAGE_MANIFEST = os.path.join(BACKEND_DIR, "..", "frontend", "public", "img", "manifest.json")
+DEFAULT_OUTPUTS = [
+    os.path.join(BACKEND_DIR, "portfolio_data.bin"),
+    os.path.join(BACKEND_DIR, "..", "functions", "portfolio_data.bin")
+]
+
+def compile_data(outputs: list[str]) -> str:
+    profile_data, experience_data, projects_data = load_source(DATA_FILE)
+    profile_data, projects_data = ImageManifest(IMAGE_MANIFEST).expand(profile_data, projects_data)
+    # Fail the build on data the API models would reject; the artifact keeps
+    # the raw records so extra fields such as experience metrics survive.
+    if ProfileData is not None:
+        ProfileData.model_validate(profile_data)
+        for item in experience_data:
+            Experience.model_validate(item)
+        for item in projects_data:
+            Project.model_validate(item)
+    else:
+        print("⚠️ pydantic is not installed; skipping model validation")
+
+    content = build_artifact(profile_data, experience_data, projects_data, file_hash(DATA_FILE))
+    for output in outputs:
+        if os.path.isdir(os.path.dirname(os.path.abspath(output))):
+            write_artifact(output, content)
+            print(f"✅ Wrote {os.path.relpath(output)} ({len(content)} bytes)")
+    return content
+
+if __name__ == "__main__":
+    compile_data(sys.argv[1:] or DEFAULT_OUTPUTS)
@@ -6,6 +6,7 @@ profile_data = {
     "phone": "571-471-0563",
     "linkedin": "https://www.linkedin.com/in/arjun-bojja/",
     "github_user": "arjunbojja1",
+    "photo": "/headshot.png",
     "about": {
         "passion": "Software Engineering Intern at Microsoft (Teams), building autonomous AI diagnostic infrastructure for Teams Meeting Copilot, including a Text-to-KQL translation layer powered by LLMs and deterministic safety rails for production database protection. Backend and distributed systems engineer focused on LLM-powered pipelines, event-driven architectures, observability, and low-latency systems. Previously at Capital One, built a distributed monitoring system on AWS (Lambda, ECS, DynamoDB) to automate health checks, improve telemetry, and accelerate incident response for production systems.",
         "seeking": "Seeking full-time roles in distributed systems, backend infrastructure, or AI systems engineering where I can ship reliable software, own operational excellence, and work at the intersection of systems and AI."
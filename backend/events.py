@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+from jsonenc import dumps
+
+logger = logging.getLogger(__name__)
+
+class Broadcaster:
+    """Fans out data-version changes to Server-Sent Events subscribers.
+
+    Each publish encodes its frames once and wakes every waiting subscriber
+    through a single shared event, so idle connections cost nothing per
+    version. A subscriber that falls behind only ever receives the latest
+    version when it catches up, which bounds per-connection buffering.
+    """
+
+    def __init__(self, heartbeat_interval: float = 15.0, max_subscribers: int = 10000, retry_ms: int = 5000):
+        self.heartbeat_interval = heartbeat_interval
+        self.max_subscribers = max_subscribers
+        self.retry_ms = retry_ms
+        self.subscribers = 0
+        self._version: Optional[int] = None
+        self._notify_frame = b""
+        self._payload_frame = b""
+        self._changed = asyncio.Event()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def full(self) -> bool:
+        return self.subscribers >= self.max_subscribers
+
+    def publish(self, snapshot):
+        """Encode the frames for a new snapshot and wake all subscribers once"""
+        if snapshot.version == self._version:
+            return
+        notice = dumps({"version": snapshot.version, "content_hash": snapshot.content_hash})
+        self._notify_frame = b"id: %d\nevent: data-changed\ndata: %s\n\n" % (snapshot.version, notice)
+        self._payload_frame = b"id: %d\nevent: data-changed\ndata: %s\n\n" % (
+            snapshot.version, snapshot.payloads["portfolio"].body
+        )
+        self._version = snapshot.version
+
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def close(self):
+        """End every open stream; used from the lifespan shutdown"""
+        self._closed = True
+        self._changed.set()
+
+    async def subscribe(self, last_event_id: Optional[str] = None, include_payload: bool = False) -> AsyncIterator[bytes]:
+        """Yield SSE frames for one client until the broadcaster closes"""
+        self.subscribers += 1
+        try:
+            seen = self._version
+            frame = b"retry: %d\n" % self.retry_ms
+            if last_event_id is not None and last_event_id != str(self._version):
+                # Reconnected after missing a change: deliver it right away.
+                yield frame + (self._payload_frame if include_payload else self._notify_frame)
+            else:
+                yield frame + b"id: %d\nevent: version\ndata: %d\n\n" % (seen or 0, seen or 0)
+
+            while not self._closed:
+                # Checked before every wait: a version published while this
+                # client was paused at a yield has already replaced the event
+                if self._version != seen:
+                    seen = self._version
+                    yield self._payload_frame if include_payload else self._notify_frame
+                    continue
+                changed = self._changed
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+        finally:
+            self.subscribers -= 1
@@ -0,0 +1,100 @@
+"""Export the read API as static files for Firebase Hosting or nginx.
+
+    python export_static.py [--out ../frontend/build/api] [--db portfolio.db] [--precompress]
+
+Run after the frontend build. Each endpoint body, as the FastAPI models
+serialize it, is written under a content-hashed name and as <endpoint>.json,
+next to a manifest.json. The fixed /api/<endpoint> rewrites in firebase.json
+point at the unhashed copies, so Hosting serves reads from the CDN and the
+functions are only needed for the contact form. --precompress adds .gz and
+.br siblings for nginx; Hosting compresses on its own and ignores them.
+"""
+import os
+import sys
+import json
+import argparse
+from datetime import datetime, timezone
+
+from rendering import RenderedPayload
+from snapshot import build_snapshot
+from storage import SQLiteDataStore, load_source, SECTIONS
+from images import ImageManifest
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BACKEND_DIR)
+DEFAULT_OUT = os.path.join(ROOT_DIR, "frontend", "build", "api")
+IMAGE_MANIFEST = os.path.join(ROOT_DIR, "frontend", "public", "img", "manifest.json")
+
+ENDPOINTS = ("profile", "experience", "projects", "portfolio")
+HASH_LENGTH = 12
+
+def _write(path: str, content: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def export(payloads: dict[str, RenderedPayload], out_dir: str, precompress: bool = False) -> dict:
+    """Write hashed files, their aliases and the manifest; returns the manifest"""
+    os.makedirs(out_dir, exist_ok=True)
+    endpoints, written = {}, {"manifest.json"}
+    for name in ENDPOINTS:
+        payload = payloads[name]
+        filename = f"{name}.{payload.digest[:HASH_LENGTH]}.json"
+        sizes = {}
+        # Hosting and nginx serve /api/<endpoint> from the unhashed copy
+        for target in (filename, f"{name}.json"):
+            _write(os.path.join(out_dir, target), payload.body)
+            written.add(target)
+            for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+                content = payload.variant(encoding) if precompress else None
+                if content is not None:
+                    _write(os.path.join(out_dir, target + suffix), content)
+                    written.add(target + suffix)
+                    sizes[encoding] = len(content)
+        endpoints[name] = {
+            "path": f"/api/{name}",
+            "file": f"/api/{filename}",
+            "etag": payload.etag(None),
+            "bytes": len(payload.body),
+            "encodings": sizes
+        }
+
+    # Drop files from earlier exports so stale versions are not deployed
+    for filename in os.listdir(out_dir):
+        if filename not in written and filename.split(".", 1)[0] in ENDPOINTS:
+            os.remove(os.path.join(out_dir, filename))
+
+    manifest = {
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "endpoints": endpoints
+    }
+    _write(os.path.join(out_dir, "manifest.json"), json.dumps(manifest, indent=2).encode("utf-8"))
+    return manifest
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=DEFAULT_OUT)
+    parser.add_argument("--db", help="Export from this SQLite data store instead of data.py")
+    parser.add_argument("--precompress", action="store_true",
+                        help="Also write .gz and .br files, for servers such as nginx that send them as is")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        store = SQLiteDataStore(args.db)
+        sections = tuple(store.read_section(section) for section in SECTIONS)
+    else:
+        sections = load_source(os.path.join(BACKEND_DIR, "data.py"))
+    profile_data, experience_data, projects_data = sections
+    profile_data, projects_data = ImageManifest(IMAGE_MANIFEST).expand(profile_data, projects_data)
+    # Validates against the API models and renders the bodies FastAPI serves
+    snapshot = build_snapshot(0, profile_data, experience_data, projects_data)
+
+    manifest = export(snapshot.payloads, args.out, precompress=args.precompress)
+    for name, entry in manifest["endpoints"].items():
+        sizes = ", ".join(f"{encoding} {size}" for encoding, size in entry["encodings"].items())
+        print(f"✅ {entry['path']} -> {entry['file']} ({entry['bytes']} bytes{'; ' + sizes if sizes else ''})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import os
+import mmap
+import fcntl
+import struct
+
+_COUNTER = struct.Struct("<Q")
+
+class SharedGeneration:
+    """Data generation counter in a memory-mapped file shared by worker processes.
+
+    A worker that publishes a new snapshot bumps the counter; the others see
+    the new value on their next poll and reload. Bumps take a POSIX record
+    lock, which unlike flock is held per process and so still excludes
+    workers that inherited the same file descriptor across fork.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self._fd).st_size < _COUNTER.size:
+            os.ftruncate(self._fd, _COUNTER.size)
+        self._mm = mmap.mmap(self._fd, _COUNTER.size)
+
+    @property
+    def value(self) -> int:
+        return _COUNTER.unpack_from(self._mm)[0]
+
+    def bump(self) -> int:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            value = self.value + 1
+            _COUNTER.pack_into(self._mm, 0, value)
+            return value
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def close(self):
+        self._mm.close()
+        os.close(self._fd)
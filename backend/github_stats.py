@@ -0,0 +1,261 @@
+import os
+import json
+import time
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+import metrics as m
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT = 1
+
+class RateLimited(Exception):
+    """GitHub refused the request until its rate limit resets"""
+
+def repo_name(url: Optional[str]) -> Optional[str]:
+    """`owner/repo` for a github.com repository URL, else None"""
+    parsed = urlparse(url or "")
+    if parsed.hostname not in ("github.com", "www.github.com"):
+        return None
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) < 2:
+        return None
+    return f"{parts[0]}/{parts[1].removesuffix('.git')}"
+
+def _languages(byte_counts: dict) -> list[dict]:
+    total = sum(byte_counts.values())
+    return [
+        {"name": name, "percent": round(100 * count / total, 1)}
+        for name, count in sorted(byte_counts.items(), key=lambda item: -item[1])
+    ] if total else []
+
+# Each part of the stats is one API request, revalidated with its own ETag
+PARTS = {
+    "repo": (
+        "/repos/{repo}", None,
+        lambda body: {
+            "stars": body["stargazers_count"],
+            "forks": body["forks_count"],
+            "open_issues": body["open_issues_count"],
+            "archived": body.get("archived", False)
+        }
+    ),
+    "languages": ("/repos/{repo}/languages", None, _languages),
+    "last_commit": (
+        "/repos/{repo}/commits", {"per_page": "1"},
+        lambda body: body[0]["commit"]["committer"]["date"] if body else None
+    )
+}
+
+class GitHubStats:
+    """Stale-while-revalidate cache of repository stats from the GitHub API.
+
+    `get` always answers from the cache, even when the entry has expired or
+    does not exist yet; expired and missing entries are refreshed in the
+    background, at most `max_concurrency` upstream requests at a time over a
+    pooled HTTP client. Refreshes send the ETags from the previous response,
+    so unchanged data costs a 304 that GitHub does not count against the
+    rate limit. The cache is written to `cache_path` and survives restarts.
+    """
+
+    def __init__(self, api_url: str = "https://api.github.com", token: Optional[str] = None,
+                 cache_path: Optional[str] = None, ttl: float = 3600.0, max_concurrency: int = 4,
+                 timeout: float = 10.0, error_backoff: float = 300.0):
+        self.api_url = api_url.rstrip("/")
+        self.token = token
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.error_backoff = error_backoff
+        self._entries: dict[str, dict] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._paused_until = 0.0
+        self._dirty = False
+
+    async def start(self):
+        await asyncio.to_thread(self._load)
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "portfolio-api"
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        self._client = httpx.AsyncClient(
+            base_url=self.api_url,
+            headers=headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_concurrency,
+                                max_keepalive_connections=self.max_concurrency)
+        )
+        logger.info(f"GitHub stats enabled ({self.api_url}, {len(self._entries)} cached repos)")
+
+    async def close(self):
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.to_thread(self._save)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _load(self):
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable GitHub stats cache {self.cache_path}: {e}")
+            return
+        # Cached entries from another API (such as a local fake) are not reused
+        if cache.get("format") == CACHE_FORMAT and cache.get("api_url") == self.api_url:
+            self._entries = cache.get("repos", {})
+
+    def _save(self):
+        if not self.cache_path or not self._dirty:
+            return
+        self._dirty = False
+        cache = {"format": CACHE_FORMAT, "api_url": self.api_url, "repos": self._entries}
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self._dirty = True
+            logger.warning(f"Could not write GitHub stats cache {self.cache_path}: {e}")
+
+    def _is_stale(self, entry: Optional[dict], now: float) -> bool:
+        if entry is None:
+            return True
+        return now >= entry.get("retry_at", entry["checked_at"] + self.ttl)
+
+    def get(self, repo: str) -> Optional[dict]:
+        """Cached stats for `owner/repo` right away; refreshes them in the background when stale"""
+        entry = self._entries.get(repo)
+        stale = self._is_stale(entry, time.time())
+        m.GITHUB_STATS_LOOKUPS.inc("miss" if entry is None else "stale" if stale else "fresh")
+        if stale:
+            self._schedule(repo)
+        return entry["stats"] if entry else None
+
+    def prefetch(self, repos: Iterable[str]):
+        """Refresh every stale repo in the background, e.g. when projects change"""
+        now = time.time()
+        for repo in repos:
+            if self._is_stale(self._entries.get(repo), now):
+                self._schedule(repo)
+
+    def _schedule(self, repo: str):
+        if self._client is None or repo in self._refreshing or time.time() < self._paused_until:
+            return
+        task = asyncio.create_task(self._refresh(repo))
+        self._refreshing[repo] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(repo, None))
+
+    async def _fetch(self, repo: str, part: str, entry: dict):
+        """One stats part: (value, etag), reusing the cached value on 304"""
+        path, params, extract = PARTS[part]
+        headers = {}
+        etag = entry["etags"].get(part)
+        if etag and part in entry["parts"]:
+            headers["If-None-Match"] = etag
+        async with self._slots:
+            response = await self._client.get(path.format(repo=repo), params=params, headers=headers)
+
+        if response.status_code == 304:
+            m.GITHUB_REQUESTS.inc("not_modified")
+            return entry["parts"][part], etag
+        if response.status_code in (403, 429) and (
+            response.headers.get("retry-after") or response.headers.get("x-ratelimit-remaining") == "0"
+        ):
+            m.GITHUB_REQUESTS.inc("rate_limited")
+            retry_after = response.headers.get("retry-after")
+            reset = response.headers.get("x-ratelimit-reset")
+            self._paused_until = (
+                time.time() + float(retry_after) if retry_after
+                else float(reset) if reset else time.time() + self.error_backoff
+            )
+            raise RateLimited(f"rate limited until {datetime.fromtimestamp(self._paused_until, timezone.utc).isoformat()}")
+        if response.status_code == 409 and part == "last_commit":
+            # An empty repository has no commits
+            m.GITHUB_REQUESTS.inc("ok")
+            return None, None
+        response.raise_for_status()
+        m.GITHUB_REQUESTS.inc("ok")
+        return extract(response.json()), response.headers.get("etag")
+
+    async def _refresh(self, repo: str):
+        previous = self._entries.get(repo) or {"stats": None, "parts": {}, "etags": {}, "checked_at": 0}
+        now = time.time()
+        try:
+            results = await asyncio.gather(*(self._fetch(repo, part, previous) for part in PARTS))
+        except asyncio.CancelledError:
+            raise
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                m.GITHUB_REQUESTS.inc("error")
+                entry = self._failed(repo, previous, now, f"HTTP {e.response.status_code}")
+            else:
+                m.GITHUB_REQUESTS.inc("not_found")
+                # A missing repository is an answer too: no stats until the next check
+                entry = {"stats": None, "parts": {}, "etags": {}, "checked_at": now, "error": "not found"}
+        except (httpx.HTTPError, RateLimited, KeyError, TypeError, ValueError) as e:
+            if not isinstance(e, RateLimited):
+                m.GITHUB_REQUESTS.inc("error")
+            entry = self._failed(repo, previous, now, str(e) or type(e).__name__)
+        else:
+            parts = {part: value for part, (value, _) in zip(PARTS, results)}
+            entry = {
+                "stats": {
+                    **parts["repo"],
+                    "languages": parts["languages"],
+                    "last_commit": parts["last_commit"],
+                    "fetched_at": datetime.fromtimestamp(now, timezone.utc).isoformat()
+                },
+                "parts": parts,
+                "etags": {part: etag for part, (_, etag) in zip(PARTS, results) if etag},
+                "checked_at": now
+            }
+            if entry["parts"] == previous["parts"] and previous["stats"] is not None:
+                # Revalidated without changes: keep when the data was fetched
+                entry["stats"]["fetched_at"] = previous["stats"]["fetched_at"]
+
+        self._entries[repo] = entry
+        self._dirty = True
+        await self._save_when_idle(repo)
+
+    def _failed(self, repo: str, previous: dict, now: float, error: str) -> dict:
+        # Keep serving the last good stats and try again after a backoff
+        logger.warning(f"GitHub stats refresh for {repo} failed: {error}")
+        return {**previous, "retry_at": now + self.error_backoff, "error": error}
+
+    async def _save_when_idle(self, repo: str):
+        # Batch the disk write: the last refresh of a burst writes the cache
+        if all(other == repo for other in self._refreshing):
+            await asyncio.to_thread(self._save)
+
+    def summary(self) -> dict:
+        now = time.time()
+        return {
+            "api_url": self.api_url,
+            "repos": len(self._entries),
+            "stale": sum(self._is_stale(entry, now) for entry in self._entries.values()),
+            "refreshing": len(self._refreshing),
+            "errors": {repo: entry["error"] for repo, entry in self._entries.items() if entry.get("error")},
+            "paused_until": datetime.fromtimestamp(self._paused_until, timezone.utc).isoformat()
+            if self._paused_until > now else None
+        }
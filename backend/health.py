@@ -0,0 +1,132 @@
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from metrics import HEALTH_PROBE_UP, uptime_seconds
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Probe:
+    name: str
+    check: Callable[[], Awaitable[dict]]
+    interval: float
+    critical: bool = True
+    timeout: float = 5.0
+    next_run: float = 0.0
+
+@dataclass
+class ProbeResult:
+    ok: bool
+    critical: bool
+    checked_at: datetime
+    latency_ms: float
+    detail: dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+class HealthProbes:
+    """Runs dependency checks in the background and caches their results.
+
+    Each probe runs on its own interval, so a readiness request only reads
+    the cache. Readiness stays "starting" until every critical probe has
+    run once; non-critical probes that have not run yet do not hold it back.
+    A failing critical probe makes the service not ready; a failing
+    non-critical probe only marks it degraded.
+    """
+
+    def __init__(self, tick: float = 1.0):
+        self._probes: list[Probe] = []
+        self._tick = tick
+        self._task: Optional[asyncio.Task] = None
+        self.results: dict[str, ProbeResult] = {}
+
+    def add(self, name: str, check: Callable[[], Awaitable[dict]], interval: float,
+            critical: bool = True, timeout: float = 5.0):
+        """Register `check`, a coroutine function that returns details or raises on failure"""
+        self._probes.append(Probe(name, check, interval, critical, timeout))
+
+    @property
+    def warmed_up(self) -> bool:
+        return all(probe.name in self.results for probe in self._probes if probe.critical)
+
+    async def _run(self, probe: Probe):
+        started = time.perf_counter()
+        detail, error = {}, None
+        try:
+            detail = await asyncio.wait_for(probe.check(), probe.timeout) or {}
+        except asyncio.TimeoutError:
+            error = f"Timed out after {probe.timeout}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        previous = self.results.get(probe.name)
+        if error and (previous is None or previous.ok):
+            logger.warning(f"Health probe {probe.name} failing: {error}")
+        elif not error and previous is not None and not previous.ok:
+            logger.info(f"Health probe {probe.name} recovered")
+        self.results[probe.name] = ProbeResult(
+            ok=error is None,
+            critical=probe.critical,
+            checked_at=datetime.now(timezone.utc),
+            latency_ms=round((time.perf_counter() - started) * 1000, 3),
+            detail=detail,
+            error=error
+        )
+        HEALTH_PROBE_UP.set(probe.name, value=0 if error else 1)
+
+    async def run_due(self):
+        """Run every probe whose interval has elapsed, concurrently"""
+        now = time.monotonic()
+        due = [probe for probe in self._probes if probe.next_run <= now]
+        for probe in due:
+            probe.next_run = now + probe.interval
+        if due:
+            await asyncio.gather(*(self._run(probe) for probe in due))
+
+    async def _loop(self):
+        while True:
+            await self.run_due()
+            await asyncio.sleep(self._tick)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def report(self) -> tuple[str, dict]:
+        """Overall status ("starting", "ready", "degraded" or "not_ready") and per-probe results"""
+        checks = {
+            name: {
+                "ok": result.ok,
+                "critical": result.critical,
+                "checked_at": result.checked_at.isoformat(),
+                "latency_ms": result.latency_ms,
+                **({"error": result.error} if result.error else {}),
+                **result.detail
+            }
+            for name, result in self.results.items()
+        }
+        if not self.warmed_up:
+            status = "starting"
+        elif any(not r.ok and r.critical for r in self.results.values()):
+            status = "not_ready"
+        elif any(not r.ok for r in self.results.values()):
+            status = "degraded"
+        else:
+            status = "ready"
+        return status, {
+            "status": status,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "uptime_seconds": round(uptime_seconds(), 3),
+            "checks": checks
+        }
@@ -0,0 +1,69 @@
+import os
+import json
+import threading
+from typing import Optional
+
+# Variant formats, best first; browsers take the first <source> they support
+FORMATS = ("avif", "webp")
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+class ImageManifest:
+    """The manifest written by build_images.py, reloaded when the file changes.
+
+    Maps each public image path (such as /headshot.png) to its size and
+    responsive variants. A missing manifest leaves images as plain paths.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._images: dict = {}
+
+    @property
+    def images(self) -> dict:
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return {}
+        with self._lock:
+            if mtime != self._mtime:
+                with open(self.path, encoding="utf-8") as f:
+                    self._images = json.load(f).get("images", {})
+                self._mtime = mtime
+            return self._images
+
+    def picture(self, src: str) -> dict:
+        """`<picture>` metadata for a public path: fallback, size and srcsets"""
+        entry = self.images.get(src)
+        if entry is None:
+            return {"src": src}
+        return {
+            "src": src,
+            "width": entry["width"],
+            "height": entry["height"],
+            "sources": [
+                {
+                    "type": MIME_TYPES[fmt],
+                    "srcset": ", ".join(f"{variant['src']} {variant['width']}w" for variant in entry["variants"][fmt])
+                }
+                for fmt in FORMATS if entry["variants"].get(fmt)
+            ]
+        }
+
+    def _expand(self, value):
+        if isinstance(value, dict) and "src" in value:
+            value = value["src"]
+        return self.picture(value) if isinstance(value, str) else value
+
+    def expand(self, profile_data: dict, projects_data: list) -> tuple[dict, list]:
+        """Copies of the profile and projects with `photo` and `image` paths
+        replaced by picture metadata. Already expanded values are refreshed.
+        """
+        if profile_data.get("photo"):
+            profile_data = {**profile_data, "photo": self._expand(profile_data["photo"])}
+        projects_data = [
+            {**project, "image": self._expand(project["image"])} if project.get("image") else project
+            for project in projects_data
+        ]
+        return profile_data, projects_data
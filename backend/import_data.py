@@ -0,0 +1,42 @@
+"""Migrate backend/data.py into the SQLite data store.
+
+    python import_data.py [--source data.py] [--db portfolio.db]
+
+The data is validated against the API models first and then replaces the
+store's contents in one transaction. Run the API with DATA_STORE=sqlite to
+serve from the database; a running server picks the change up on its own.
+"""
+import os
+import sys
+import argparse
+
+from snapshot import build_snapshot
+from storage import SQLiteDataStore, load_source, item_keys, SECTIONS
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def import_data(source: str, db: str) -> dict:
+    profile_data, experience_data, projects_data = load_source(source)
+    # Refuse data the API would reject rather than storing it
+    build_snapshot(0, profile_data, experience_data, projects_data)
+    store = SQLiteDataStore(db)
+    store.replace(profile_data, experience_data, projects_data)
+    return {
+        section: len(item_keys(section, data))
+        for section, data in zip(SECTIONS, (profile_data, experience_data, projects_data))
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default=os.path.join(BACKEND_DIR, "data.py"))
+    parser.add_argument("--db", default=os.getenv("DATA_DB", os.path.join(BACKEND_DIR, "portfolio.db")))
+    args = parser.parse_args(argv)
+    counts = import_data(args.source, args.db)
+    print(
+        f"✅ Imported {os.path.relpath(args.source)} into {os.path.relpath(args.db)}: "
+        f"{counts['profile']} profile fields, {counts['experience']} experiences, {counts['projects']} projects"
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import re
+import base64
+import binascii
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Optional
+
+from jsonenc import dumps
+
+MAX_PAGE_SIZE = 100
+
+# Sort keys per section; prefix with "-" for descending
+SORT_FIELDS = {
+    "projects": ("title", "start", "end"),
+    "experience": ("company", "role", "start", "end")
+}
+
+MONTHS = {
+    name: number for number, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"), start=1
+    )
+}
+_MONTH_YEAR = re.compile(r"^(?:([a-z]+)\.?\s+)?(\d{4})$")
+_ISO_MONTH = re.compile(r"^(\d{4})(?:-(\d{1,2}))?$")
+ONGOING = ("present", "current", "now")
+
+def _month_index(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+def parse_month(value: str, end: bool = False) -> int:
+    """`YYYY-MM` or `YYYY` as a month index; a bare year covers Jan..Dec"""
+    match = _ISO_MONTH.match(value.strip())
+    if not match or not 1 <= int(match.group(2) or 1) <= 12:
+        raise ValueError(f"Invalid date: {value} (expected YYYY-MM or YYYY)")
+    year, month = int(match.group(1)), match.group(2)
+    return _month_index(year, int(month) if month else (12 if end else 1))
+
+def _parse_point(text: str, end: bool) -> Optional[int]:
+    match = _MONTH_YEAR.match(text.strip().lower())
+    if not match:
+        return None
+    name, year = match.groups()
+    if name is None:
+        return _month_index(int(year), 12 if end else 1)
+    # Accept full and three-letter month names
+    month = MONTHS.get(name) or next((n for full, n in MONTHS.items() if full.startswith(name[:3])), None)
+    return _month_index(int(year), month) if month else None
+
+def parse_duration(duration: Optional[str]) -> Optional[tuple[int, Optional[int]]]:
+    """"June 2024 - June 2025" as (start, end) month indexes; end is None while ongoing"""
+    if not duration:
+        return None
+    parts = re.split(r"\s*[-–—]\s*|\s+to\s+", duration.strip(), maxsplit=1)
+    start = _parse_point(parts[0], end=False)
+    if start is None:
+        return None
+    if len(parts) == 1:
+        return start, _parse_point(parts[0], end=True)
+    if parts[1].strip().lower() in ONGOING:
+        return start, None
+    end = _parse_point(parts[1], end=True)
+    return (start, end) if end is not None else None
+
+def encode_cursor(version: str, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{version}:{offset}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, version: str) -> int:
+    """Offset stored in a cursor; cursors are only valid for the data version that issued them"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        cursor_version, _, offset = raw.partition(":")
+        offset = int(offset)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if cursor_version != version:
+        raise ValueError("Cursor is from an older data version; restart from the first page")
+    if offset < 0:
+        raise ValueError("Invalid cursor")
+    return offset
+
+@dataclass(frozen=True)
+class ListQuery:
+    """Normalized filters, sort and page size for a list endpoint"""
+    technologies: tuple = ()
+    featured: Optional[bool] = None
+    company: Optional[str] = None
+    date_from: Optional[int] = None
+    date_to: Optional[int] = None
+    sort: Optional[str] = None
+    limit: Optional[int] = None
+
+    @property
+    def filtered(self) -> bool:
+        return bool(self.technologies or self.company) or self.featured is not None or \
+            self.date_from is not None or self.date_to is not None
+
+def parse_list_query(section: str, technologies: Optional[str] = None, featured: Optional[bool] = None,
+                     company: Optional[str] = None, date_from: Optional[str] = None,
+                     date_to: Optional[str] = None, sort: Optional[str] = None,
+                     limit: Optional[int] = None) -> ListQuery:
+    """Validate list parameters into a hashable query; raises ValueError on bad input"""
+    if sort:
+        field_name = sort[1:] if sort.startswith("-") else sort
+        if field_name not in SORT_FIELDS[section]:
+            raise ValueError(f"Unknown sort field: {field_name} (expected one of {', '.join(SORT_FIELDS[section])})")
+    if limit is not None and not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    start = parse_month(date_from) if date_from else None
+    end = parse_month(date_to, end=True) if date_to else None
+    if start is not None and end is not None and start > end:
+        raise ValueError("from must not be after to")
+    return ListQuery(
+        technologies=tuple(sorted({t.strip().casefold() for t in (technologies or "").split(",") if t.strip()})),
+        featured=featured,
+        company=company.strip().casefold() if company and company.strip() else None,
+        date_from=start,
+        date_to=end,
+        sort=sort or None,
+        limit=limit
+    )
+
+def _mask_ids(mask: int) -> list[int]:
+    """Positions of the set bits, ascending, in time proportional to the count"""
+    bits = bin(mask)[:1:-1]
+    ids, position = [], bits.find("1")
+    while position != -1:
+        ids.append(position)
+        position = bits.find("1", position + 1)
+    return ids
+
+class SectionIndex:
+    """Lookup structures for one list section, built once per data version.
+
+    Items are pre-rendered to JSON so a page is assembled by joining bytes.
+    Technology, company and featured postings are bitsets over item
+    positions, dated items are kept sorted by start month for range queries,
+    and each sort field has a precomputed rank per item.
+    """
+
+    def __init__(self, section: str, items: tuple, bodies: Optional[list[bytes]] = None):
+        self.section = section
+        self.size = len(items)
+        # Callers that already hold rendered items (see derive_snapshot) pass them in
+        self.bodies = bodies if bodies is not None else [dumps(item) for item in items]
+        self.everything = (1 << self.size) - 1
+
+        technologies, companies, featured, spans = {}, {}, [], []
+        for position, item in enumerate(items):
+            for technology in item.get("technologies") or ():
+                technologies.setdefault(technology.casefold(), []).append(position)
+            if item.get("company"):
+                companies.setdefault(item["company"].casefold(), []).append(position)
+            if item.get("featured"):
+                featured.append(position)
+            spans.append(parse_duration(item.get("duration")))
+
+        self.technologies = {key: self._mask(positions) for key, positions in technologies.items()}
+        self.companies = {key: self._mask(positions) for key, positions in companies.items()}
+        self.featured = self._mask(featured)
+        self.spans = spans
+        self.by_start = sorted((span[0], position) for position, span in enumerate(spans) if span)
+        self._starts = [start for start, _ in self.by_start]
+
+        ongoing = max((s[1] for s in spans if s and s[1] is not None), default=0) + 1
+        sort_values = {
+            "title": [(item.get("title") or "").casefold() for item in items],
+            "company": [(item.get("company") or "").casefold() for item in items],
+            "role": [(item.get("role") or "").casefold() for item in items],
+            # Undated items sort last ascending; ongoing items have the latest end
+            "start": [s[0] if s else float("inf") for s in spans],
+            "end": [(s[1] if s[1] is not None else ongoing) if s else float("inf") for s in spans]
+        }
+        self.ranks = {}
+        for name in SORT_FIELDS[section]:
+            values = sort_values[name]
+            rank = [0] * self.size
+            for order, position in enumerate(sorted(range(self.size), key=lambda i: (values[i], i))):
+                rank[position] = order
+            self.ranks[name] = rank
+
+    def _mask(self, positions: list[int]) -> int:
+        # Pack into bytes first; OR-ing bits one at a time into an int is quadratic
+        buffer = bytearray((self.size + 7) // 8)
+        for position in positions:
+            buffer[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(buffer, "little")
+
+    def _date_mask(self, date_from: Optional[int], date_to: Optional[int]) -> int:
+        # Items overlapping [date_from, date_to]; only items starting before
+        # date_to are visited.
+        stop = bisect_right(self._starts, date_to) if date_to is not None else len(self.by_start)
+        return self._mask([
+            position for _, position in self.by_start[:stop]
+            if date_from is None or self.spans[position][1] is None or self.spans[position][1] >= date_from
+        ])
+
+    def select(self, query: ListQuery) -> list[int]:
+        """Positions of matching items in the requested order"""
+        mask = self.everything
+        for technology in query.technologies:
+            mask &= self.technologies.get(technology, 0)
+        if query.featured is not None:
+            mask &= self.featured if query.featured else ~self.featured
+        if query.company:
+            # Substring match over the distinct company names only
+            mask &= sum(bits for name, bits in self.companies.items() if query.company in name)
+        if mask and (query.date_from is not None or query.date_to is not None):
+            mask &= self._date_mask(query.date_from, query.date_to)
+
+        positions = _mask_ids(mask & self.everything)
+        if query.sort:
+            descending = query.sort.startswith("-")
+            rank = self.ranks[query.sort.lstrip("-")]
+            positions.sort(key=rank.__getitem__, reverse=descending)
+        return positions
+
+    def render(self, positions: list[int]) -> bytes:
+        return b"[" + b",".join(self.bodies[position] for position in positions) + b"]"
@@ -1,23 +1,43 @@
 import os
 import ssl
+import time
+import asyncio
+import hmac
+import hashlib
+import secrets
+import uuid
 import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response, Header, Depends, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import StreamingResponse, JSONResponse, PlainTextResponse
 from dotenv import load_dotenv
-import importlib
-import sys
+from pydantic import ValidationError
 import logging
 from datetime import datetime
 from typing import Optional
 from contextlib import asynccontextmanager
+from models import ProfileData, Experience, Project, ContactForm
+from snapshot import SnapshotManager, parse_fieldset
+from listing import parse_list_query, encode_cursor, decode_cursor
+from rendering import payload_response, render_body, dumps, DYNAMIC_BR_QUALITY
+from events import Broadcaster
+from outbox import Outbox, DeliveryWorkers
+from smtp_pool import SMTPPool
+from storage import ModuleStore, SQLiteDataStore, CachedStore
+from images import ImageManifest
+from generation import SharedGeneration
+from health import HealthProbes
+from search import SearchIndex
+from github_stats import GitHubStats, repo_name
+from spam import SpamFilter, DuplicateFilter
+from admin import change_profile, change_entry, KeyConflict
+import metrics as m
+from access_log import AccessLog, setup_logging
+from ratelimit import RateLimiter, MemoryStore, SQLiteStore
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+setup_logging(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -37,6 +57,88 @@ SMTP_USERNAME = os.getenv("SMTP_USERNAME")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
 SMTP_FROM_EMAIL = os.getenv("SMTP_FROM_EMAIL")
 SMTP_TO_EMAIL = os.getenv("SMTP_TO_EMAIL", "arjunbojja1@gmail.com")
+# Disable only for local SMTP sinks that do not offer STARTTLS
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "True").lower() == "true"
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "2"))
+SMTP_KEEPALIVE_INTERVAL = float(os.getenv("SMTP_KEEPALIVE_INTERVAL", "30"))
+SMTP_MAX_IDLE = float(os.getenv("SMTP_MAX_IDLE", "240"))
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+OUTBOX_PATH = os.getenv("OUTBOX_PATH", os.path.join(BACKEND_DIR, "outbox.db"))
+OUTBOX_WORKERS = int(os.getenv("OUTBOX_WORKERS", "2"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "6"))
+# Seconds to keep sent messages (and their idempotency keys) before pruning
+OUTBOX_RETENTION = float(os.getenv("OUTBOX_RETENTION", "604800"))
+DATA_FILE = os.path.join(BACKEND_DIR, "data.py")
+DATA_ARTIFACT = os.getenv("DATA_ARTIFACT", os.path.join(BACKEND_DIR, "portfolio_data.bin"))
+DATA_WATCH_INTERVAL = float(os.getenv("DATA_WATCH_INTERVAL", "2"))
+# "module" reads data.py (or its compiled artifact); "sqlite" reads DATA_DB,
+# which import_data.py fills from data.py
+DATA_STORE = os.getenv("DATA_STORE", "module")
+DATA_DB = os.getenv("DATA_DB", os.path.join(BACKEND_DIR, "portfolio.db"))
+DATA_CACHE_SIZE = int(os.getenv("DATA_CACHE_SIZE", "256"))
+# Written by build_images.py; adds srcset metadata to profile and project images
+IMAGE_MANIFEST = os.getenv(
+    "IMAGE_MANIFEST", os.path.join(BACKEND_DIR, "..", "frontend", "public", "img", "manifest.json")
+)
+# Shared counter that multi-worker serving (serve.py) uses to spread reloads
+DATA_GENERATION_FILE = os.getenv("DATA_GENERATION_FILE")
+
+# Fraction of successful GETs written to the access log; errors and slow
+# requests are always logged.
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+ACCESS_LOG_SLOW_MS = float(os.getenv("ACCESS_LOG_SLOW_MS", "500"))
+
+# Cache-Control per read route; "no-cache" lets browsers keep a copy but
+# revalidate it with If-None-Match, which is answered with a cheap 304.
+DEFAULT_CACHE_CONTROL = os.getenv("CACHE_CONTROL_DEFAULT", "no-cache")
+CACHE_CONTROL = {
+    route: os.getenv(f"CACHE_CONTROL_{route.upper()}", DEFAULT_CACHE_CONTROL)
+    for route in ("profile", "experience", "projects", "portfolio")
+}
+
+EVENTS_HEARTBEAT_INTERVAL = float(os.getenv("EVENTS_HEARTBEAT_INTERVAL", "15"))
+EVENTS_MAX_SUBSCRIBERS = int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "10000"))
+
+# Readiness probes run in the background; /api/health/ready reads their cache
+HEALTH_SNAPSHOT_INTERVAL = float(os.getenv("HEALTH_SNAPSHOT_INTERVAL", "5"))
+HEALTH_OUTBOX_INTERVAL = float(os.getenv("HEALTH_OUTBOX_INTERVAL", "15"))
+HEALTH_SMTP_INTERVAL = float(os.getenv("HEALTH_SMTP_INTERVAL", "300"))
+HEALTH_SMTP_TIMEOUT = float(os.getenv("HEALTH_SMTP_TIMEOUT", "10"))
+# Undelivered contact messages older than this mark the service degraded
+OUTBOX_MAX_PENDING_AGE = float(os.getenv("OUTBOX_MAX_PENDING_AGE", "900"))
+
+# Contact rate limits: a per-client token bucket plus a global cap across
+# all clients. RATE_LIMIT_STORE=sqlite shares the limits between workers.
+RATE_LIMIT_STORE = os.getenv("RATE_LIMIT_STORE", "memory")
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB", os.path.join(BACKEND_DIR, "ratelimit.db"))
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+CONTACT_RATE_PER_MINUTE = float(os.getenv("CONTACT_RATE_PER_MINUTE", "1"))
+CONTACT_BURST = int(os.getenv("CONTACT_BURST", "5"))
+CONTACT_GLOBAL_LIMIT = int(os.getenv("CONTACT_GLOBAL_LIMIT", "100"))
+CONTACT_GLOBAL_WINDOW = float(os.getenv("CONTACT_GLOBAL_WINDOW", "3600"))
+
+# Duplicate and spam filter in front of the outbox. serve.py workers inherit
+# the generated secret; set it when separate processes issue and check tokens.
+CONTACT_TOKEN_SECRET = os.getenv("CONTACT_TOKEN_SECRET", "").encode("utf-8") or secrets.token_bytes(32)
+CONTACT_MIN_FILL_SECONDS = float(os.getenv("CONTACT_MIN_FILL_SECONDS", "3"))
+CONTACT_DUPLICATE_WINDOW = float(os.getenv("CONTACT_DUPLICATE_WINDOW", "3600"))
+CONTACT_MAX_LINKS = int(os.getenv("CONTACT_MAX_LINKS", "2"))
+CONTACT_SPAM_THRESHOLD = int(os.getenv("CONTACT_SPAM_THRESHOLD", "3"))
+# Only trust X-Forwarded-For when running behind a proxy that sets it
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "False").lower() == "true"
+
+# Bearer token for the /api/admin write endpoints; unset disables them
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+# GitHub repository stats for /api/projects?stats=true (opt-in)
+GITHUB_STATS = os.getenv("GITHUB_STATS", "False").lower() == "true"
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GITHUB_STATS_TTL = float(os.getenv("GITHUB_STATS_TTL", "3600"))
+GITHUB_CONCURRENCY = int(os.getenv("GITHUB_CONCURRENCY", "4"))
+GITHUB_CACHE_PATH = os.getenv("GITHUB_CACHE_PATH", os.path.join(BACKEND_DIR, "github_cache.json"))
 
 # Lifespan event handler
 @asynccontextmanager
@@ -46,8 +148,26 @@ async def lifespan(app: FastAPI):
     logger.info(f"📊 Debug mode: {DEBUG}")
     logger.info(f"🔐 CORS origins: {ALLOWED_ORIGINS}")
     logger.info(f"📧 Email configured: {bool(SMTP_USERNAME and SMTP_PASSWORD)}")
+    if github_stats:
+        # Before the first snapshot, whose listener prefetches stale repos
+        await github_stats.start()
+    await snapshots.load_initial()
+    snapshots.start()
+    await asyncio.to_thread(outbox.open)
+    smtp_pool.start()
+    delivery_workers.start()
+    # Readiness reports "starting" until each critical probe has run once
+    probes.start()
     yield
     # Shutdown
+    await probes.stop()
+    broadcaster.close()
+    await delivery_workers.stop()
+    await smtp_pool.close()
+    await asyncio.to_thread(outbox.close)
+    await snapshots.stop()
+    if github_stats:
+        await github_stats.close()
     logger.info("🛑 Portfolio API shutting down...")
 
 # Create app with lifespan
@@ -68,45 +188,62 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+access_log = AccessLog(sample_rate=ACCESS_LOG_SAMPLE_RATE, slow_ms=ACCESS_LOG_SLOW_MS)
+
 @app.middleware("http")
 async def log_requests(request, call_next):
-    start_time = datetime.now()
-    response = await call_next(request)
-    process_time = (datetime.now() - start_time).total_seconds()
-    
-    logger.info(
-        f"{request.method} {request.url.path} - "
-        f"Status: {response.status_code} - "
-        f"Time: {process_time:.3f}s"
-    )
-    return response
+    start_time = time.perf_counter()
+    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
+    status_code = 500
+    m.HTTP_IN_FLIGHT.inc()
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        response.headers["X-Request-ID"] = request_id
+        return response
+    finally:
+        m.HTTP_IN_FLIGHT.dec()
+        process_time = time.perf_counter() - start_time
+        # Label by route template, not raw path, to keep cardinality bounded
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "unmatched")
+        m.HTTP_REQUESTS.inc(request.method, route_path, str(status_code))
+        m.HTTP_LATENCY.observe(process_time, request.method, route_path)
+        access_log.record(
+            request.method,
+            request.url.path,
+            status_code,
+            process_time,
+            request_id,
+            request.client.host if request.client else None
+        )
+
+def create_data_store():
+    if DATA_STORE == "sqlite":
+        store = SQLiteDataStore(DATA_DB)
+    elif DATA_STORE == "module":
+        store = ModuleStore(DATA_FILE, artifact_path=DATA_ARTIFACT)
+    else:
+        raise ValueError(f"Unknown DATA_STORE: {DATA_STORE} (expected module or sqlite)")
+    return CachedStore(store, max_items=DATA_CACHE_SIZE)
+
+data_store = create_data_store()
+image_manifest = ImageManifest(IMAGE_MANIFEST)
 
 def reload_data():
-    """Reload data from data.py file - allows for hot updates!"""
-    try:
-        # Ensure backend directory is in path for data module import
-        backend_dir = os.path.dirname(os.path.abspath(__file__))
-        if backend_dir not in sys.path:
-            sys.path.insert(0, backend_dir)
-        
-        if 'data' in sys.modules:
-            importlib.reload(sys.modules['data'])
-            logger.info("Data module reloaded successfully")
-        else:
-            import data
-            logger.info("Data module imported for the first time")
-        
-        from data import profile_data, experience_data, projects_data
-        
-        if not profile_data or not isinstance(profile_data, dict):
-            raise ValueError("Invalid profile_data structure")
-        
-        logger.info(f"Data loaded: {len(experience_data)} experiences, {len(projects_data)} projects")
-        return profile_data, experience_data, projects_data
-        
-    except Exception as e:
-        logger.error(f"Error reloading data: {e}")
-        return get_fallback_data()
+    """Load the raw data sections from the configured store.
+
+    Sections whose revision is unchanged come from the read-through cache.
+    Runs in a worker thread from the snapshot manager; errors propagate so
+    the previous snapshot stays live.
+    """
+    profile_data, experience_data, projects_data = data_store.load()
+    profile_data, projects_data = image_manifest.expand(profile_data, projects_data)
+    logger.info(
+        f"Data loaded from {data_store.store.source}: "
+        f"{len(experience_data)} experiences, {len(projects_data)} projects"
+    )
+    return profile_data, experience_data, projects_data
 
 def get_fallback_data():
     """Fallback data in case data.py has issues"""
@@ -135,13 +272,133 @@ def get_fallback_data():
         }
     }, [], []
 
-async def send_email(name: str, email: str, message: str):
+snapshots = SnapshotManager(
+    loader=reload_data,
+    fallback=get_fallback_data,
+    watch_path=data_store.watch_path,
+    poll_interval=DATA_WATCH_INTERVAL,
+    generation=SharedGeneration(DATA_GENERATION_FILE) if DATA_GENERATION_FILE else None
+)
+
+broadcaster = Broadcaster(
+    heartbeat_interval=EVENTS_HEARTBEAT_INTERVAL,
+    max_subscribers=EVENTS_MAX_SUBSCRIBERS
+)
+snapshots.add_listener(broadcaster.publish)
+
+# Updated in place on each new snapshot; only changed documents are re-indexed
+search_index = SearchIndex()
+snapshots.add_listener(search_index.update_from_snapshot)
+github_stats = GitHubStats(
+    api_url=GITHUB_API_URL,
+    token=GITHUB_TOKEN,
+    cache_path=GITHUB_CACHE_PATH,
+    ttl=GITHUB_STATS_TTL,
+    max_concurrency=GITHUB_CONCURRENCY
+) if GITHUB_STATS else None
+
+def project_repos(projects) -> list[str]:
+    return [repo for repo in (repo_name(project.get("github_link")) for project in projects) if repo]
+
+def with_github_stats(projects: list) -> list:
+    """Projects with the cached stats of their GitHub repository (null until fetched)"""
+    return [
+        {**project, "stats": github_stats.get(repo) if github_stats and repo else None}
+        for project, repo in ((project, repo_name(project.get("github_link"))) for project in projects)
+    ]
+
+if github_stats:
+    snapshots.add_listener(lambda snapshot: github_stats.prefetch(project_repos(snapshot.projects)))
+
+m.REGISTRY.register(m.Gauge(
+    "portfolio_event_subscribers", "Open /api/events streams", collect=lambda: broadcaster.subscribers
+))
+
+def section_response(request: Request, section: str):
+    """Serve one pre-rendered section of the current snapshot with validators"""
+    snapshot = snapshots.current
+    return payload_response(
+        snapshot.payloads[section],
+        request,
+        last_modified=snapshot.loaded_at,
+        cache_control=CACHE_CONTROL[section]
+    )
+
+def list_response(request: Request, section: str, cursor: Optional[str], enrich=None, **params):
+    """Serve a filtered, sorted page of a list section.
+
+    Without parameters the pre-rendered full section is served. Pages carry
+    X-Total-Count and, when more results remain, a Link rel="next" header
+    with a cursor tied to the current data version. `enrich` maps the page's
+    items to what is served; such pages are rendered per request.
+    """
+    if enrich is None and cursor is None and all(value is None for value in params.values()):
+        return section_response(request, section)
+
+    snapshot = snapshots.current
+    try:
+        query = parse_list_query(section, **params)
+        offset = decode_cursor(cursor, snapshot.content_hash[:16]) if cursor else 0
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if enrich is None:
+        payload, total, next_offset = snapshot.list_page(section, query, offset)
+        response = payload_response(
+            payload,
+            request,
+            last_modified=snapshot.loaded_at,
+            cache_control=CACHE_CONTROL[section]
+        )
+    else:
+        positions, total, next_offset = snapshot.page_positions(section, query, offset)
+        items = getattr(snapshot, section)
+        payload = render_body(dumps(enrich([items[i] for i in positions])), br_quality=DYNAMIC_BR_QUALITY)
+        # Enriched data changes without a new snapshot, so revalidate by ETag only
+        response = payload_response(payload, request, cache_control="no-cache")
+    response.headers["X-Total-Count"] = str(total)
+    if next_offset is not None:
+        next_cursor = encode_cursor(snapshot.content_hash[:16], next_offset)
+        response.headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
+
+async def open_smtp_session():
+    """Connect, upgrade with STARTTLS and authenticate a new SMTP session"""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    
+    server = aiosmtplib.SMTP(
+        hostname=SMTP_HOST, 
+        port=SMTP_PORT,
+        tls_context=context,
+        start_tls=False
+    )
+    
+    await server.connect()
+    if SMTP_STARTTLS:
+        await server.starttls(tls_context=context)
+    await server.login(SMTP_USERNAME, SMTP_PASSWORD)
+    return server
+
+smtp_pool = SMTPPool(
+    open_smtp_session,
+    max_size=SMTP_POOL_SIZE,
+    keepalive_interval=SMTP_KEEPALIVE_INTERVAL,
+    max_idle=SMTP_MAX_IDLE
+)
+
+async def send_email(name: str, email: str, message: str, message_id: Optional[str] = None):
     """Send email using SMTP with proper SSL handling"""
     try:
         msg = MIMEMultipart()
         msg['From'] = SMTP_FROM_EMAIL
         msg['To'] = SMTP_TO_EMAIL
         msg['Subject'] = f"Portfolio Contact Form - Message from {name}"
+        if message_id:
+            # Stable across retries so the mail provider can drop duplicates
+            msg['Message-ID'] = message_id
         
         email_body = f"""
 New message from your portfolio contact form:
@@ -157,22 +414,12 @@ This message was sent from your portfolio website.
         
         msg.attach(MIMEText(email_body, 'plain'))
         
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-        
-        server = aiosmtplib.SMTP(
-            hostname=SMTP_HOST, 
-            port=SMTP_PORT,
-            tls_context=context,
-            start_tls=False
-        )
-        
-        await server.connect()
-        await server.starttls(tls_context=context)
-        await server.login(SMTP_USERNAME, SMTP_PASSWORD)
-        await server.send_message(msg)
-        await server.quit()
+        started = time.perf_counter()
+        try:
+            await smtp_pool.send_message(msg)
+        finally:
+            m.SMTP_LATENCY.observe(time.perf_counter() - started)
+        m.SMTP_SENDS.inc("sent")
         
         if DEBUG:
             print(f"✅ Email sent successfully from {name} ({email})")
@@ -180,11 +427,13 @@ This message was sent from your portfolio website.
         return True
         
     except ssl.SSLError as ssl_err:
+        m.SMTP_SENDS.inc("ssl_error")
         if DEBUG:
             print(f"SSL Error: {str(ssl_err)}")
             print("📧 SSL bypassed but still failing - check your email credentials")
         return False
     except aiosmtplib.SMTPAuthenticationError as auth_err:
+        m.SMTP_SENDS.inc("auth_error")
         if DEBUG:
             print(f"🔐 SMTP Authentication Error: {str(auth_err)}")
             print("❌ Your email/password is incorrect. For Gmail:")
@@ -193,6 +442,7 @@ This message was sent from your portfolio website.
             print("   3. Use the app password in your .env file")
         return False
     except Exception as e:
+        m.SMTP_SENDS.inc("error")
         if DEBUG:
             print(f"❌ Email sending error: {str(e)}")
             print(f"📧 SMTP Config: {SMTP_HOST}:{SMTP_PORT}")
@@ -200,76 +450,337 @@ This message was sent from your portfolio website.
             print(f"📧 From: {SMTP_FROM_EMAIL}")
         return False
 
-class Education(BaseModel):
-    degree: str
-    university: str
-    gpa: str
-    grad_year: int
-    awards: list[str]
-    coursework: list[str]
-
-class Experience(BaseModel):
-    role: str
-    company: str
-    duration: str
-    location: str
-    description: list[str]
-
-class Project(BaseModel):
-    title: str
-    github_link: str | None = None
-    external_link: str | None = None
-    technologies: list[str] | None = None
-    description: list[str]
-    challenge: str | None = None
-    featured: bool | None = None
-    metrics: list[str] | None = None
-    duration: str | None = None
-    demo_note: str | None = None
-
-class ProfileData(BaseModel):
-    name: str
-    title: str
-    location: str
-    email: str
-    linkedin: str
-    github_user: str
-    about: dict
-    skills: dict[str, list[str]]
-    education: Education
-    
-class ContactForm(BaseModel):
-    name: str
-    email: EmailStr
-    message: str
+async def deliver_contact(message: dict) -> bool:
+    """Deliver one outbox message; called by the background delivery workers"""
+    form = message["payload"]
+    key_hash = hashlib.sha256(message["idempotency_key"].encode("utf-8")).hexdigest()[:32]
+    return await send_email(
+        form["name"],
+        form["email"],
+        form["message"],
+        message_id=f"<contact-{key_hash}@portfolio-api>"
+    )
+
+outbox = Outbox(OUTBOX_PATH, max_attempts=OUTBOX_MAX_ATTEMPTS, retention=OUTBOX_RETENTION)
+delivery_workers = DeliveryWorkers(outbox, deliver_contact, concurrency=OUTBOX_WORKERS)
+
+def create_rate_limit_store():
+    if RATE_LIMIT_STORE == "sqlite":
+        return SQLiteStore(RATE_LIMIT_DB, max_keys=RATE_LIMIT_MAX_CLIENTS)
+    return MemoryStore(max_keys=RATE_LIMIT_MAX_CLIENTS)
+
+contact_limiter = RateLimiter(
+    create_rate_limit_store(),
+    "contact",
+    rate_per_minute=CONTACT_RATE_PER_MINUTE,
+    burst=CONTACT_BURST,
+    global_limit=CONTACT_GLOBAL_LIMIT,
+    global_window=CONTACT_GLOBAL_WINDOW
+)
+
+spam_filter = SpamFilter(
+    CONTACT_TOKEN_SECRET,
+    min_fill_seconds=CONTACT_MIN_FILL_SECONDS,
+    max_links=CONTACT_MAX_LINKS,
+    threshold=CONTACT_SPAM_THRESHOLD,
+    duplicates=DuplicateFilter(window=CONTACT_DUPLICATE_WINDOW, max_entries=RATE_LIMIT_MAX_CLIENTS)
+)
+
+def client_address(request: Request) -> str:
+    if TRUST_PROXY_HEADERS:
+        # The trusted proxy appends the peer it saw; earlier entries can be forged
+        forwarded = request.headers.get("x-forwarded-for", "").split(",")[-1].strip()
+        if forwarded:
+            return forwarded
+    return request.client.host if request.client else "unknown"
+
+async def limit_contact_rate(request: Request):
+    """Reject with 429 before the body is validated or anything is queued"""
+    limited = await contact_limiter.check(client_address(request))
+    if limited is not None:
+        scope, retry_after = limited
+        m.RATE_LIMITED.inc(scope)
+        logger.warning(f"Contact rate limit ({scope}) hit by {client_address(request)}")
+        raise HTTPException(
+            status_code=429,
+            detail="Too many messages. Please try again later.",
+            headers={"Retry-After": str(retry_after)}
+        )
+
+async def require_admin(authorization: Optional[str] = Header(None)):
+    """Dependency: accept only requests bearing ADMIN_TOKEN"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=503, detail="Admin API is disabled; set ADMIN_TOKEN to enable it")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing admin token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+async def write_entry(section: str, key: str, operation: str, payload=None) -> dict:
+    """Persist one change to the data store and publish it as a derived snapshot"""
+    if section not in ("profile", "experience", "projects"):
+        raise HTTPException(status_code=404, detail=f"Unknown section: {section}")
+    store = data_store.store
+    if not hasattr(store, "put"):
+        raise HTTPException(
+            status_code=503,
+            detail=f"The {store.name} data store is read-only; admin writes need DATA_STORE=sqlite"
+        )
+    if not snapshots.loaded or snapshots.current.is_fallback:
+        raise HTTPException(status_code=503, detail="Data is not loaded yet")
+
+    created, result_key = False, None
+
+    def write(snapshot):
+        nonlocal result_key, created
+        created = key not in snapshot.keys[section]
+        if section == "profile":
+            data, result_key = change_profile(snapshot, store, key, operation, payload, image_manifest.expand)
+        else:
+            data, result_key = change_entry(snapshot, store, section, key, operation, payload,
+                                            image_manifest.expand)
+        return section, data
+
+    try:
+        snapshot = await snapshots.apply(write)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    except KeyConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Admin {operation} of {section}/{key} failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to write {section}/{key}: {str(e)}")
+
+    m.DATA_WRITES.inc(section, operation)
+    logger.info(f"Admin {operation} of {section}/{key} published data v{snapshot.version}")
+    return {
+        "section": section,
+        "key": result_key,
+        "created": created and operation == "put",
+        "data_version": snapshot.version
+    }
+
+async def probe_snapshot() -> dict:
+    if not snapshots.loaded:
+        raise RuntimeError("No data snapshot loaded yet")
+    snapshot = snapshots.current
+    if snapshot.is_fallback:
+        raise RuntimeError(f"Serving fallback data; the {data_store.name} store failed to load")
+    return {
+        "data_version": snapshot.version,
+        "data_store": data_store.name,
+        "loaded_at": snapshot.loaded_at.isoformat(),
+        "last_reload_error": snapshots.last_error
+    }
+
+async def probe_smtp() -> dict:
+    """Connect and negotiate TLS with the SMTP server without authenticating"""
+    if not SMTP_USERNAME:
+        return {"configured": False}
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    server = aiosmtplib.SMTP(hostname=SMTP_HOST, port=SMTP_PORT, start_tls=False, timeout=HEALTH_SMTP_TIMEOUT)
+    await server.connect()
+    try:
+        if SMTP_STARTTLS:
+            await server.starttls(tls_context=context)
+    finally:
+        try:
+            await server.quit()
+        except aiosmtplib.SMTPException:
+            server.close()
+    return {"configured": True, "host": SMTP_HOST, "port": SMTP_PORT, "tls": SMTP_STARTTLS}
+
+async def probe_outbox() -> dict:
+    if not outbox.is_open:
+        raise RuntimeError("Outbox database is not open")
+    stats = await asyncio.to_thread(outbox.stats)
+    return {"depth": stats["depth"], "dead": stats["dead"]}
+
+async def probe_outbox_backlog() -> dict:
+    if not outbox.is_open:
+        raise RuntimeError("Outbox database is not open")
+    age = (await asyncio.to_thread(outbox.stats))["oldest_pending_age_seconds"]
+    if age > OUTBOX_MAX_PENDING_AGE:
+        raise RuntimeError(f"Oldest undelivered message is {age:.0f}s old")
+    return {"oldest_pending_age_seconds": age}
+
+probes = HealthProbes()
+probes.add("snapshot", probe_snapshot, HEALTH_SNAPSHOT_INTERVAL)
+probes.add("outbox", probe_outbox, HEALTH_OUTBOX_INTERVAL)
+# Contact messages are queued while SMTP is down, so these only degrade readiness
+probes.add("outbox_backlog", probe_outbox_backlog, HEALTH_OUTBOX_INTERVAL, critical=False)
+probes.add("smtp", probe_smtp, HEALTH_SMTP_INTERVAL, critical=False, timeout=HEALTH_SMTP_TIMEOUT + 1)
+
+def contact_fingerprint(form: ContactForm, now: Optional[float] = None) -> str:
+    """Default idempotency key: identical submissions in the same
+    CONTACT_DUPLICATE_WINDOW bucket collapse into one message"""
+    bucket = int((time.time() if now is None else now) // CONTACT_DUPLICATE_WINDOW)
+    normalized = "\n".join([form.name.strip(), form.email.strip().lower(), form.message.strip(), str(bucket)])
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 @app.get("/api/profile", response_model=ProfileData)
-async def get_profile():
+async def get_profile(request: Request):
     try:
-        profile_data, _, _ = reload_data()
-        return profile_data
+        return section_response(request, "profile")
     except Exception as e:
         logger.error(f"Error fetching profile: {e}")
         raise HTTPException(status_code=500, detail="Failed to load profile data")
 
 @app.get("/api/experience", response_model=list[Experience])
-async def get_experience():
+async def get_experience(
+    request: Request,
+    company: Optional[str] = None,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    sort: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+):
+    """
+    Experience entries, optionally filtered by `company` (substring) and a
+    `from`/`to` date range (`YYYY-MM`), sorted by `company`, `role`, `start`
+    or `end` (prefix `-` for descending) and paginated with `limit`/`cursor`.
+    """
     try:
-        _, experience_data, _ = reload_data()
-        return experience_data
+        return list_response(
+            request, "experience", cursor,
+            company=company, date_from=date_from, date_to=date_to, sort=sort, limit=limit
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching experience: {e}")
         raise HTTPException(status_code=500, detail="Failed to load experience data")
 
 @app.get("/api/projects", response_model=list[Project])
-async def get_projects():
+async def get_projects(
+    request: Request,
+    technologies: Optional[str] = None,
+    featured: Optional[bool] = None,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    sort: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    stats: bool = False
+):
+    """
+    Projects, optionally filtered by `technologies` (comma-separated, all
+    must match), `featured` and a `from`/`to` date range (`YYYY-MM`), sorted
+    by `title`, `start` or `end` (prefix `-` for descending) and paginated
+    with `limit`/`cursor`. With `stats=true` each project carries a `stats`
+    object from its GitHub repository (stars, forks, languages, last
+    commit), served from cache and null until first fetched.
+    """
     try:
-        _, _, projects_data = reload_data()
-        return projects_data
+        return list_response(
+            request, "projects", cursor,
+            enrich=with_github_stats if stats else None,
+            technologies=technologies, featured=featured, date_from=date_from, date_to=date_to,
+            sort=sort, limit=limit
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching projects: {e}")
         raise HTTPException(status_code=500, detail="Failed to load projects data")
 
+@app.get("/api/portfolio")
+async def get_portfolio(
+    request: Request,
+    include: Optional[str] = None,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None
+):
+    """
+    Profile, experience and projects in one response.
+    `include` picks sections (e.g. `profile,projects`); `fields` and `exclude`
+    take `section.field` lists (e.g. `exclude=projects.description`).
+    """
+    try:
+        fieldset = parse_fieldset(include, fields, exclude)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        snapshot = snapshots.current
+        return payload_response(
+            snapshot.bundle_payload(fieldset),
+            request,
+            last_modified=snapshot.loaded_at,
+            cache_control=CACHE_CONTROL["portfolio"]
+        )
+    except Exception as e:
+        logger.error(f"Error fetching portfolio: {e}")
+        raise HTTPException(status_code=500, detail="Failed to load portfolio data")
+
+@app.get("/api/search")
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=50),
+    section: Optional[str] = None
+):
+    """
+    Ranked full-text search over profile, experience and projects.
+    Hits carry an HTML-escaped `snippet` with matches wrapped in `<mark>`;
+    `section` restricts results to `profile`, `experience` or `projects`.
+    """
+    if section is not None and section not in ("profile", "experience", "projects"):
+        raise HTTPException(status_code=400, detail=f"Unknown section: {section}")
+    started = time.perf_counter()
+    total, hits = search_index.search(q, limit=limit, section=section)
+    return {
+        "query": q,
+        "total": total,
+        "hits": hits,
+        "data_version": search_index.version,
+        "took_ms": round((time.perf_counter() - started) * 1000, 3)
+    }
+
+@app.get("/api/search/suggest")
+async def search_suggest(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(8, ge=1, le=10)
+):
+    """Type-ahead completions for the last word of `q`"""
+    return {"query": q, "suggestions": search_index.suggest(q, limit=limit)}
+
+@app.get("/api/images")
+async def images():
+    """Responsive variants from build_images.py, as `<picture>` metadata by public path"""
+    return {"images": {src: image_manifest.picture(src) for src in image_manifest.images}}
+
+@app.get("/api/events")
+async def data_events(request: Request, payload: bool = False):
+    """
+    Server-Sent Events stream announcing data version changes.
+    Sends `data-changed` events (with the full portfolio bundle when
+    `payload=true`) and a comment heartbeat while idle.
+    """
+    if broadcaster.closed:
+        raise HTTPException(status_code=503, detail="Server is shutting down")
+    if broadcaster.full:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many event subscribers",
+            headers={"Retry-After": "30"}
+        )
+
+    return StreamingResponse(
+        broadcaster.subscribe(request.headers.get("last-event-id"), include_payload=payload),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/api/health")
 async def health_check():
     """
@@ -277,46 +788,100 @@ async def health_check():
     Returns detailed status including data freshness and email configuration.
     """
     try:
-        profile_data, experience_data, projects_data = reload_data()
+        snapshot = snapshots.current
         return {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
-            "uptime_seconds": 0,  # In production, track actual uptime
+            "uptime_seconds": round(m.uptime_seconds(), 3),
             "checks": {
-                "data_loading": True,
+                "data_loading": not snapshot.is_fallback,
                 "email_configured": bool(SMTP_USERNAME and SMTP_PASSWORD),
                 "cors_enabled": True
             },
             "data_counts": {
-                "experience": len(experience_data),
-                "projects": len(projects_data)
+                "experience": len(snapshot.experience),
+                "projects": len(snapshot.projects)
             },
+            "data_version": snapshot.version,
             "version": "1.0.0"
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
+@app.get("/api/health/live")
+async def liveness():
+    """Liveness probe: constant time, touches no data or dependencies"""
+    return {"status": "alive", "uptime_seconds": round(m.uptime_seconds(), 3)}
+
+@app.get("/api/health/ready")
+async def readiness():
+    """
+    Readiness probe built from cached background checks of the data snapshot,
+    SMTP reachability and the contact outbox. Returns 503 while starting up
+    or when a critical check fails; a failing non-critical check is reported
+    as `degraded`.
+    """
+    status, report = probes.report()
+    return JSONResponse(report, status_code=503 if status in ("starting", "not_ready") else 200)
+
 @app.get("/api/metrics")
-async def metrics():
+async def metrics(format: str = "json"):
     """
     Observability metrics endpoint showing system health and performance.
     Useful for monitoring dashboards and alerting systems.
+    Pass `format=prometheus` for the Prometheus text exposition format.
     """
     try:
-        profile_data, experience_data, projects_data = reload_data()
+        snapshot = snapshots.current
+        outbox_stats = await asyncio.to_thread(outbox.stats) if outbox.is_open else None
+        if outbox_stats is not None:
+            for status in ("pending", "sending", "sent", "dead"):
+                m.OUTBOX_MESSAGES.set(status, value=outbox_stats[status])
+            m.OUTBOX_OLDEST_AGE.set(value=outbox_stats["oldest_pending_age_seconds"])
+
+        if format == "prometheus":
+            return PlainTextResponse(
+                m.REGISTRY.prometheus_text(),
+                media_type="text/plain; version=0.0.4"
+            )
         
-        # In production, metrics would track actual performance data
         return {
             "timestamp": datetime.now().isoformat(),
             "service": "portfolio-api",
             "environment": "production" if not DEBUG else "development",
+            "uptime_seconds": round(m.uptime_seconds(), 3),
             "metrics": {
                 "data_freshness": {
-                    "last_reload": datetime.now().isoformat(),
-                    "experience_count": len(experience_data),
-                    "projects_count": len(projects_data)
+                    "last_reload": snapshot.loaded_at.isoformat(),
+                    "data_version": snapshot.version,
+                    "reload_count": snapshots.reload_count,
+                    "last_reload_error": snapshots.last_error,
+                    "reload_duration": m.DATA_RELOAD_LATENCY.summary(),
+                    "store": data_store.name,
+                    "store_cache": {"hits": data_store.hits, "misses": data_store.misses},
+                    "experience_count": len(snapshot.experience),
+                    "projects_count": len(snapshot.projects)
+                },
+                "requests": {
+                    "in_flight": int(m.HTTP_IN_FLIGHT.values.get((), 0)),
+                    "total": int(m.HTTP_REQUESTS.total()),
+                    "routes": m.request_summary()
+                },
+                "smtp": {
+                    "sends": {result: int(count) for (result,), count in m.SMTP_SENDS.values.items()},
+                    "latency": m.SMTP_LATENCY.summary()
+                },
+                "events": {
+                    "subscribers": broadcaster.subscribers
+                },
+                "github_stats": github_stats.summary() if github_stats else None,
+                "rate_limited": {scope: int(count) for (scope,), count in m.RATE_LIMITED.values.items()},
+                "contact_filter": {
+                    "decisions": {decision: int(count) for (decision,), count in m.CONTACT_FILTER.values.items()},
+                    "recent_fingerprints": len(spam_filter.duplicates)
                 },
+                "outbox": outbox_stats,
                 "configuration": {
                     "debug_mode": DEBUG,
                     "cors_origins_count": len(ALLOWED_ORIGINS),
@@ -328,8 +893,14 @@ async def metrics():
         logger.error(f"Metrics endpoint error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch metrics")
 
-@app.post("/api/contact")
-async def contact(form: ContactForm):
+@app.get("/api/contact")
+async def contact_token():
+    """A submit-time token for the contact form, to send back as `token`"""
+    return JSONResponse({"token": spam_filter.issue_token()}, headers={"Cache-Control": "no-store"})
+
+@app.post("/api/contact", status_code=202, dependencies=[Depends(limit_contact_rate)])
+async def contact(form: ContactForm, idempotency_key: Optional[str] = Header(None)):
+    """Queue a contact message for background delivery and acknowledge it"""
     try:
         logger.info(f"Contact form submission from: {form.name} <{form.email}>")
         
@@ -337,14 +908,47 @@ async def contact(form: ContactForm):
             logger.error("Email configuration incomplete")
             raise HTTPException(status_code=500, detail="Email service not configured")
         
-        email_sent = await send_email(form.name, form.email, form.message)
+        decision = spam_filter.check(
+            form.name, form.email, form.message, honeypot=form.website, token=form.token,
+            # A retry with its own key is answered from the outbox with the original id
+            check_duplicate=idempotency_key is None
+        )
+        m.CONTACT_FILTER.inc(decision)
+        if decision != "accepted":
+            # Acknowledged like any other submission, but never queued or sent
+            logger.info(f"Contact submission from {form.email} dropped by filter: {decision}")
+            return JSONResponse(
+                status_code=202,
+                content={
+                    "message": "Your message has been received! I'll get back to you soon.",
+                    "status": "received"
+                }
+            )
+        
+        key = idempotency_key or contact_fingerprint(form)
+        message_id, created = await asyncio.to_thread(
+            outbox.enqueue,
+            {"name": form.name, "email": form.email, "message": form.message},
+            key
+        )
+        if idempotency_key is None:
+            # Only now: a submission that failed above can be retried as is
+            spam_filter.record(form.email, form.message)
         
-        if email_sent:
-            logger.info(f"Email sent successfully to {form.name}")
-            return {"message": "Your message has been sent successfully! I'll get back to you soon."}
+        if created:
+            delivery_workers.notify()
+            logger.info(f"Contact message {message_id} queued for {form.name}")
         else:
-            logger.error(f"Failed to send email for {form.name}")
-            raise HTTPException(status_code=500, detail="Failed to send email. Please try again later.")
+            logger.info(f"Duplicate contact submission matched message {message_id}")
+        
+        return JSONResponse(
+            status_code=202,
+            content={
+                "message": "Your message has been received! I'll get back to you soon.",
+                "id": message_id,
+                "status": "queued"
+            }
+        )
             
     except HTTPException:
         raise
@@ -352,15 +956,38 @@ async def contact(form: ContactForm):
         logger.error(f"Contact form error: {str(e)}")
         raise HTTPException(status_code=500, detail="An error occurred while sending your message.")
 
+@app.put("/api/admin/{section}/{key}", dependencies=[Depends(require_admin)])
+async def admin_put(section: str, key: str, response: Response, payload=Body(...)):
+    """
+    Create or replace one experience or project, or set one profile field.
+    Only the changed entry is validated; the new data version is published
+    without reloading the rest. Requires `Authorization: Bearer <ADMIN_TOKEN>`.
+    """
+    result = await write_entry(section, key, "put", payload)
+    if result["created"]:
+        response.status_code = 201
+    return result
+
+@app.patch("/api/admin/{section}/{key}", dependencies=[Depends(require_admin)])
+async def admin_patch(section: str, key: str, payload: dict = Body(...)):
+    """Merge fields into one stored experience, project or object-valued profile field"""
+    return await write_entry(section, key, "patch", payload)
+
+@app.delete("/api/admin/{section}/{key}", dependencies=[Depends(require_admin)])
+async def admin_delete(section: str, key: str):
+    """Delete one experience or project, or an optional profile field"""
+    return await write_entry(section, key, "delete")
+
 @app.post("/api/reload")
 async def reload_portfolio_data():
-    """Manually reload data from data.py - useful for development"""
+    """Manually reload data from the data store - useful for development"""
     try:
-        profile_data, experience_data, projects_data = reload_data()
+        snapshot = await snapshots.reload()
         return {
             "message": "Data reloaded successfully",
-            "experience_count": len(experience_data),
-            "projects_count": len(projects_data)
+            "data_version": snapshot.version,
+            "experience_count": len(snapshot.experience),
+            "projects_count": len(snapshot.projects)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to reload data: {str(e)}")
@@ -375,5 +1002,8 @@ if __name__ == "__main__":
         port=8000,
         reload=DEBUG,
         log_level="info" if not DEBUG else "debug",
-        access_log=True
+        # Requests are logged by the log_requests middleware's access log
+        access_log=False,
+        # Bound the wait for open event streams before lifespan shutdown runs
+        timeout_graceful_shutdown=5
     )
\ No newline at end of file
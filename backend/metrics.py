@@ -0,0 +1,230 @@
+import math
+import time
+from bisect import bisect_left
+from typing import Callable, Optional
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow SMTP sends
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+def _format_labels(labelnames: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, help_text, labelnames=()):
+        super().__init__(name, help_text, labelnames)
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def total(self) -> float:
+        return sum(self.values.values())
+
+    def expose(self) -> list[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in self.values.items()
+        ]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labelnames=(), collect: Optional[Callable[[], float]] = None):
+        super().__init__(name, help_text, labelnames)
+        self._collect = collect
+
+    def set(self, *labels, value: float):
+        self.values[labels] = value
+
+    def dec(self, *labels, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def expose(self) -> list[str]:
+        if self._collect is not None:
+            self.values[()] = self._collect()
+        return super().expose()
+
+class _HistogramSeries:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram; quantiles are interpolated within a bucket"""
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets) + (math.inf,)
+        self.series: dict[tuple, _HistogramSeries] = {}
+
+    def observe(self, value: float, *labels):
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = _HistogramSeries(len(self.buckets))
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.total += value
+        series.count += 1
+
+    def quantile(self, q: float, *labels) -> Optional[float]:
+        series = self.series.get(labels)
+        if series is None or series.count == 0:
+            return None
+        rank = q * series.count
+        cumulative, lower = 0, 0.0
+        for bound, count in zip(self.buckets, series.counts):
+            if count and cumulative + count >= rank:
+                if bound == math.inf:
+                    return lower
+                return lower + (bound - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = bound
+        return lower
+
+    def summary(self, *labels) -> dict:
+        series = self.series.get(labels)
+        if series is None or series.count == 0:
+            return {"count": 0}
+        return {
+            "count": series.count,
+            "mean_ms": round(series.total / series.count * 1000, 3),
+            "p50_ms": round(self.quantile(0.50, *labels) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95, *labels) * 1000, 3),
+            "p99_ms": round(self.quantile(0.99, *labels) * 1000, 3)
+        }
+
+    def expose(self) -> list[str]:
+        lines = self.header()
+        for labels, series in self.series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series.counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series.total)}")
+            lines.append(f"{self.name}_count{label_text} {series.count}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self.metrics: list[_Metric] = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def prometheus_text(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+START_TIME = time.monotonic()
+
+def uptime_seconds() -> float:
+    return time.monotonic() - START_TIME
+
+# HTTP, fed by the log_requests middleware
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "portfolio_http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "portfolio_http_request_duration_seconds", "HTTP request latency", ("method", "route")
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "portfolio_http_requests_in_flight", "HTTP requests currently being served"
+))
+
+# Data snapshot reloads
+DATA_RELOADS = REGISTRY.register(Counter(
+    "portfolio_data_reloads_total", "Data snapshot reloads by result", ("result",)
+))
+DATA_RELOAD_LATENCY = REGISTRY.register(Histogram(
+    "portfolio_data_reload_duration_seconds", "Time to load, validate and render a snapshot"
+))
+DATA_WRITES = REGISTRY.register(Counter(
+    "portfolio_data_writes_total", "Admin API writes by section and operation", ("section", "operation")
+))
+
+# GitHub repository stats behind /api/projects?stats=true
+GITHUB_REQUESTS = REGISTRY.register(Counter(
+    "portfolio_github_requests_total", "GitHub API requests by result", ("result",)
+))
+GITHUB_STATS_LOOKUPS = REGISTRY.register(Counter(
+    "portfolio_github_stats_lookups_total", "GitHub stats cache lookups by freshness", ("result",)
+))
+
+# Outgoing mail
+SMTP_SENDS = REGISTRY.register(Counter(
+    "portfolio_smtp_sends_total", "SMTP send attempts by result", ("result",)
+))
+SMTP_LATENCY = REGISTRY.register(Histogram(
+    "portfolio_smtp_send_duration_seconds", "SMTP send latency"
+))
+
+REGISTRY.register(Gauge(
+    "portfolio_uptime_seconds", "Seconds since the process started", collect=uptime_seconds
+))
+
+# Contact outbox, refreshed from the database when metrics are scraped
+OUTBOX_MESSAGES = REGISTRY.register(Gauge(
+    "portfolio_outbox_messages", "Contact outbox messages by status", ("status",)
+))
+OUTBOX_OLDEST_AGE = REGISTRY.register(Gauge(
+    "portfolio_outbox_oldest_pending_age_seconds", "Age of the oldest undelivered contact message"
+))
+
+# Abuse protection on POST /api/contact
+RATE_LIMITED = REGISTRY.register(Counter(
+    "portfolio_rate_limited_total", "Requests rejected with 429 by limiter scope", ("scope",)
+))
+CONTACT_FILTER = REGISTRY.register(Counter(
+    "portfolio_contact_filter_total", "Contact submissions by spam and duplicate filter decision", ("decision",)
+))
+
+# Background dependency checks behind /api/health/ready
+HEALTH_PROBE_UP = REGISTRY.register(Gauge(
+    "portfolio_health_probe_up", "1 if the last run of a health probe passed", ("probe",)
+))
+
+def request_summary() -> dict:
+    """Per-route request counts, status codes and latency quantiles for the JSON view"""
+    routes = {}
+    for (method, route), _ in HTTP_LATENCY.series.items():
+        routes[f"{method} {route}"] = {**HTTP_LATENCY.summary(method, route), "status": {}}
+    for (method, route, status), count in HTTP_REQUESTS.values.items():
+        entry = routes.setdefault(f"{method} {route}", {"count": 0, "status": {}})
+        entry["status"][status] = int(count)
+    return routes
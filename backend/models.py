@@ -0,0 +1,69 @@
+from typing import Annotated
+
+from pydantic import BaseModel, EmailStr, BeforeValidator
+
+class ImageSource(BaseModel):
+    type: str
+    srcset: str
+
+class Picture(BaseModel):
+    """A public image with its responsive variants, if build_images.py has run"""
+    src: str
+    width: int | None = None
+    height: int | None = None
+    sources: list[ImageSource] = []
+
+# data.py may give just the public path of an image
+PictureRef = Annotated[
+    Picture | None,
+    BeforeValidator(lambda value: {"src": value} if isinstance(value, str) else value)
+]
+
+class Education(BaseModel):
+    degree: str
+    university: str
+    gpa: str
+    grad_year: int
+    awards: list[str]
+    coursework: list[str]
+
+class Experience(BaseModel):
+    role: str
+    company: str
+    duration: str
+    location: str
+    description: list[str]
+
+class Project(BaseModel):
+    title: str
+    github_link: str | None = None
+    external_link: str | None = None
+    technologies: list[str] | None = None
+    description: list[str]
+    challenge: str | None = None
+    featured: bool | None = None
+    metrics: list[str] | None = None
+    duration: str | None = None
+    demo_note: str | None = None
+    image: PictureRef = None
+
+class ProfileData(BaseModel):
+    name: str
+    title: str
+    location: str
+    email: str
+    linkedin: str
+    github_user: str
+    about: dict
+    skills: dict[str, list[str]]
+    education: Education
+    photo: PictureRef = None
+    
+class ContactForm(BaseModel):
+    name: str
+    email: EmailStr
+    message: str
+    # Honeypot: hidden from people, so only bots fill it in
+    website: str | None = None
+    # From GET /api/contact when the form is shown
+    token: str | None = None
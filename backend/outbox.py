@@ -0,0 +1,236 @@
+import json
+import time
+import random
+import sqlite3
+import asyncio
+import logging
+import threading
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    locked_until REAL,
+    sent_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (status, next_attempt_at);
+"""
+
+class Outbox:
+    """Durable SQLite queue of contact submissions awaiting SMTP delivery.
+
+    Messages move from `pending` to `sending` while a worker holds a lease,
+    then to `sent`, back to `pending` with exponential backoff, or to `dead`
+    once `max_attempts` is exhausted. `sent` rows, and with them their
+    idempotency keys, are pruned after `retention` seconds. All methods
+    block and are meant to be called through `asyncio.to_thread`.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 6, base_backoff: float = 5.0,
+                 max_backoff: float = 600.0, lease_seconds: float = 120.0, retention: float = 604800.0):
+        self.path = path
+        self.retention = retention
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def open(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        self._conn = conn
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def enqueue(self, payload: dict, idempotency_key: str) -> tuple[int, bool]:
+        """Store a submission; returns (id, created) and ignores repeated keys"""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, payload, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?)",
+                (idempotency_key, json.dumps(payload), now, now)
+            )
+            if cursor.rowcount:
+                return cursor.lastrowid, True
+            row = self._conn.execute(
+                "SELECT id FROM outbox WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone()
+            return row["id"], False
+
+    def claim(self) -> Optional[dict]:
+        """Lease the next due message, including ones whose lease has expired"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM outbox "
+                    "WHERE (status = 'pending' AND next_attempt_at <= ?) "
+                    "OR (status = 'sending' AND locked_until < ?) "
+                    "ORDER BY next_attempt_at LIMIT 1",
+                    (now, now)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE outbox SET status = 'sending', locked_until = ?, attempts = attempts + 1 WHERE id = ?",
+                    (now + self.lease_seconds, row["id"])
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        message = dict(row)
+        message["attempts"] += 1
+        message["payload"] = json.loads(message["payload"])
+        return message
+
+    def mark_sent(self, message_id: int):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'sent', sent_at = ?, locked_until = NULL, last_error = NULL WHERE id = ?",
+                (time.time(), message_id)
+            )
+
+    def mark_failed(self, message_id: int, attempts: int, error: str) -> str:
+        """Schedule a retry with jittered exponential backoff, or dead-letter it"""
+        if attempts >= self.max_attempts:
+            status, next_attempt_at = "dead", time.time()
+        else:
+            delay = min(self.max_backoff, self.base_backoff * 2 ** (attempts - 1))
+            status, next_attempt_at = "pending", time.time() + delay * random.uniform(0.8, 1.2)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, next_attempt_at = ?, locked_until = NULL, last_error = ? WHERE id = ?",
+                (status, next_attempt_at, error[:500], message_id)
+            )
+        return status
+
+    def prune(self) -> int:
+        """Delete messages sent more than `retention` seconds ago; returns how many"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM outbox WHERE status = 'sent' AND sent_at < ?",
+                (time.time() - self.retention,)
+            )
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        now = time.time()
+        with self._lock:
+            counts = dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall())
+            oldest = self._conn.execute(
+                "SELECT MIN(created_at) FROM outbox WHERE status IN ('pending', 'sending')"
+            ).fetchone()[0]
+            last = self._conn.execute(
+                "SELECT sent_at - created_at FROM outbox WHERE status = 'sent' ORDER BY sent_at DESC LIMIT 1"
+            ).fetchone()
+        return {
+            "depth": counts.get("pending", 0) + counts.get("sending", 0),
+            "pending": counts.get("pending", 0),
+            "sending": counts.get("sending", 0),
+            "sent": counts.get("sent", 0),
+            "dead": counts.get("dead", 0),
+            "oldest_pending_age_seconds": round(now - oldest, 3) if oldest else 0.0,
+            "last_delivery_lag_seconds": round(last[0], 3) if last else None
+        }
+
+class DeliveryWorkers:
+    """Background tasks that drain the outbox through `deliver(message)`"""
+
+    def __init__(self, outbox: Outbox, deliver: Callable[[dict], Awaitable[bool]],
+                 concurrency: int = 2, poll_interval: float = 5.0, prune_interval: float = 3600.0):
+        self.outbox = outbox
+        self._deliver = deliver
+        self._concurrency = concurrency
+        self._poll_interval = poll_interval
+        self._prune_interval = prune_interval
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    def notify(self):
+        """Wake idle workers after a new message is enqueued"""
+        self._wakeup.set()
+
+    async def _process(self, message: dict):
+        try:
+            delivered = await self._deliver(message)
+            error = None if delivered else "delivery returned failure"
+        except Exception as e:
+            delivered, error = False, str(e)
+
+        if delivered:
+            await asyncio.to_thread(self.outbox.mark_sent, message["id"])
+            return
+        status = await asyncio.to_thread(self.outbox.mark_failed, message["id"], message["attempts"], error)
+        if status == "dead":
+            logger.error(f"Outbox message {message['id']} dead-lettered after {message['attempts']} attempts: {error}")
+        else:
+            logger.warning(f"Outbox message {message['id']} attempt {message['attempts']} failed: {error}")
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            try:
+                message = await asyncio.to_thread(self.outbox.claim)
+            except Exception as e:
+                logger.error(f"Outbox claim failed: {e}")
+                message = None
+
+            if message is not None:
+                await self._process(message)
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _prune(self):
+        while True:
+            try:
+                pruned = await asyncio.to_thread(self.outbox.prune)
+                if pruned:
+                    logger.info(f"Pruned {pruned} sent outbox messages")
+            except Exception as e:
+                logger.error(f"Outbox prune failed: {e}")
+            await asyncio.sleep(self._prune_interval)
+
+    def start(self):
+        if not self._tasks:
+            loop = asyncio.get_running_loop()
+            self._tasks = [loop.create_task(self._run()) for _ in range(self._concurrency)]
+            self._tasks.append(loop.create_task(self._prune()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        # A message cancelled mid-send keeps its lease and is retried after it expires.
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
@@ -0,0 +1,181 @@
+import os
+import math
+import time
+import sqlite3
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+class MemoryStore:
+    """Per-process limiter state: token buckets in an LRU, plus sliding windows.
+
+    The LRU evicts the least recently seen client once `max_keys` is reached,
+    so memory stays bounded no matter how many addresses hit the endpoint.
+    """
+    blocking = False
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._windows: dict[str, tuple[int, int, int]] = {}
+
+    def take_token(self, key: str, rate: float, capacity: float, now: float) -> float:
+        """Take one token; returns 0 when allowed, else seconds until one is available"""
+        tokens, updated = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def hit_window(self, key: str, limit: int, window: float, now: float) -> float:
+        """Count a hit in a sliding window; returns 0 when allowed, else seconds to wait"""
+        index = int(now // window)
+        current_index, current, previous = self._windows.get(key, (index, 0, 0))
+        if index != current_index:
+            previous = current if index == current_index + 1 else 0
+            current, current_index = 0, index
+        wait = _window_wait(current, previous, limit, window, now)
+        if wait == 0:
+            current += 1
+        self._windows[key] = (current_index, current, previous)
+        return wait
+
+def _window_wait(current: int, previous: int, limit: int, window: float, now: float) -> float:
+    # Sliding-window estimate: weight the previous window by how much of it
+    # still overlaps the last `window` seconds.
+    elapsed = (now % window) / window
+    estimated = previous * (1 - elapsed) + current
+    if estimated < limit:
+        return 0.0
+    if previous == 0:
+        return window - now % window
+    # Time until enough of the previous window slides out to make room.
+    needed = (estimated - limit + 1) / previous
+    return max(0.001, needed * window) if elapsed + needed <= 1 else window - now % window
+
+class SQLiteStore:
+    """Limiter state in a SQLite file so several worker processes share limits.
+
+    Each check is a single short IMMEDIATE transaction on indexed rows; idle
+    buckets beyond `max_keys` are pruned oldest-first.
+    """
+    blocking = True
+
+    def __init__(self, path: str, max_keys: int = 10000):
+        self.path = path
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not cross fork; each worker process opens its own
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS buckets_updated ON buckets (updated);
+            CREATE TABLE IF NOT EXISTS windows (
+                key TEXT PRIMARY KEY, idx INTEGER NOT NULL, current INTEGER NOT NULL, previous INTEGER NOT NULL
+            );
+        """)
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def _transaction(self, fn):
+        with self._lock:
+            self._connect().execute("BEGIN IMMEDIATE")
+            try:
+                result = fn()
+                self._conn.execute("COMMIT")
+                return result
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def take_token(self, key: str, rate: float, capacity: float, now: float) -> float:
+        def run():
+            row = self._conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+            self._conn.execute(
+                "INSERT INTO buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (key, tokens, now)
+            )
+            self._writes += 1
+            if self._writes % 256 == 0:
+                self._conn.execute(
+                    "DELETE FROM buckets WHERE key IN ("
+                    "SELECT key FROM buckets ORDER BY updated DESC LIMIT -1 OFFSET ?)",
+                    (self.max_keys,)
+                )
+            return wait
+        return self._transaction(run)
+
+    def hit_window(self, key: str, limit: int, window: float, now: float) -> float:
+        def run():
+            index = int(now // window)
+            row = self._conn.execute("SELECT idx, current, previous FROM windows WHERE key = ?", (key,)).fetchone()
+            current_index, current, previous = row if row else (index, 0, 0)
+            if index != current_index:
+                previous = current if index == current_index + 1 else 0
+                current, current_index = 0, index
+            wait = _window_wait(current, previous, limit, window, now)
+            if wait == 0:
+                current += 1
+            self._conn.execute(
+                "INSERT INTO windows (key, idx, current, previous) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET idx = excluded.idx, current = excluded.current, "
+                "previous = excluded.previous",
+                (key, current_index, current, previous)
+            )
+            return wait
+        return self._transaction(run)
+
+class RateLimiter:
+    """Per-client token bucket plus a global sliding-window cap.
+
+    `check` returns None when the request may proceed, otherwise a
+    (scope, retry_after_seconds) tuple where scope is "client" or "global".
+    """
+
+    def __init__(self, store, name: str, rate_per_minute: float, burst: int,
+                 global_limit: int, global_window: float):
+        self.store = store
+        self.name = name
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.global_limit = global_limit
+        self.global_window = global_window
+
+    def _check(self, client_key: str) -> Optional[tuple[str, int]]:
+        now = time.time()
+        wait = self.store.take_token(f"{self.name}:{client_key}", self.rate, self.burst, now)
+        if wait > 0:
+            return "client", math.ceil(wait)
+        if self.global_limit > 0:
+            wait = self.store.hit_window(f"{self.name}:*", self.global_limit, self.global_window, now)
+            if wait > 0:
+                return "global", math.ceil(wait)
+        return None
+
+    async def check(self, client_key: str) -> Optional[tuple[str, int]]:
+        if self.store.blocking:
+            return await asyncio.to_thread(self._check, client_key)
+        return self._check(client_key)
@@ -0,0 +1,146 @@
+import gzip
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from jsonenc import dumps
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli variants are skipped
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed; the framing costs more than it saves.
+COMPRESS_MIN_SIZE = 512
+
+@dataclass(frozen=True)
+class RenderedPayload:
+    """A JSON body rendered once per data version, with compressed variants"""
+    body: bytes
+    digest: str
+    gzip: Optional[bytes] = None
+    br: Optional[bytes] = None
+
+    def variant(self, encoding: Optional[str]) -> bytes:
+        if encoding == "br":
+            return self.br
+        if encoding == "gzip":
+            return self.gzip
+        return self.body
+
+    def etag(self, encoding: Optional[str]) -> str:
+        """Strong ETag for one representation; each encoding gets its own tag"""
+        if encoding:
+            return f'"{self.digest}-{encoding}"'
+        return f'"{self.digest}"'
+
+    @property
+    def encodings(self) -> list[str]:
+        return [name for name in ("br", "gzip") if getattr(self, name) is not None]
+
+# Brotli quality for per-query bodies rendered on a cache miss; 11 is much
+# slower and only pays off for bodies rendered once per data version.
+DYNAMIC_BR_QUALITY = 5
+
+def render_payload(data) -> RenderedPayload:
+    return render_body(dumps(data))
+
+def render_body(body: bytes, br_quality: int = 11) -> RenderedPayload:
+    """Digest and compress an already-encoded JSON body"""
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    if len(body) < COMPRESS_MIN_SIZE:
+        return RenderedPayload(body=body, digest=digest)
+    return RenderedPayload(
+        body=body,
+        digest=digest,
+        gzip=gzip.compress(body, compresslevel=9, mtime=0),
+        br=brotli.compress(body, quality=br_quality) if brotli is not None else None
+    )
+
+def negotiate_encoding(accept_encoding: str, available: list[str]) -> Optional[str]:
+    """Pick the best available content coding for an Accept-Encoding header"""
+    if not accept_encoding or not available:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    # `available` is ordered by preference, so ties keep the smaller encoding.
+    for name in available:
+        q = weights.get(name, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+def _etag_matches(if_none_match: str, payload: RenderedPayload) -> bool:
+    """Weak comparison against every representation of the payload (RFC 9110 13.1.2)"""
+    if if_none_match.strip() == "*":
+        return True
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag == payload.digest or tag.rsplit("-", 1)[0] == payload.digest:
+            return True
+    return False
+
+def is_not_modified(request: Request, payload: RenderedPayload, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, payload)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+def payload_response(payload: RenderedPayload, request: Request, last_modified: Optional[datetime] = None,
+                     cache_control: Optional[str] = None, status_code: int = 200) -> Response:
+    """Send a pre-rendered payload, or 304 if the client's copy is current"""
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), payload.encodings)
+    headers = {
+        "Vary": "Accept-Encoding",
+        "ETag": payload.etag(encoding)
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    if status_code == 200 and request.method in ("GET", "HEAD") and is_not_modified(request, payload, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(
+        content=payload.variant(encoding),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers
+    )
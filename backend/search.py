@@ -0,0 +1,295 @@
+import re
+import html
+import math
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# Words, keeping "c++" and "c#" whole; matched on the original text so
+# offsets stay valid for highlighting
+TOKEN = re.compile(r"[^\W_]+(?:[+#]+)?")
+
+# Field boosts: a title or technology match outranks a match deep in a bullet
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "technologies": 2.0,
+    "company": 2.0,
+    "role": 2.0,
+    "skills": 2.0,
+    "coursework": 1.5,
+    "metrics": 1.0,
+    "description": 1.0,
+    "challenge": 1.0,
+    "about": 1.0
+}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+SNIPPET_CHARS = 160
+SUGGEST_CACHE_SIZE = 10
+PREFIX_EXPANSIONS = 5
+
+def tokenize(text: str) -> list[tuple[str, int, int]]:
+    """(term, start, end) for every token; offsets index into the original text"""
+    return [(match.group().casefold(), match.start(), match.end()) for match in TOKEN.finditer(text)]
+
+@dataclass(frozen=True)
+class Document:
+    key: tuple
+    section: str
+    ref: str
+    title: str
+    fields: tuple
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha1(repr((self.title, self.fields)).encode("utf-8")).hexdigest()
+
+def _join(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return " · ".join(str(item) for item in value)
+    return str(value)
+
+def snapshot_documents(snapshot) -> Iterable[Document]:
+    """Searchable documents for the profile, each experience entry and each project"""
+    profile = snapshot.profile
+    for key, text in (profile.get("about") or {}).items():
+        yield Document(("profile", f"about.{key}"), "profile", f"about.{key}", "About",
+                       (("about", _join(text)),))
+    for category, skills in (profile.get("skills") or {}).items():
+        yield Document(("profile", f"skills.{category}"), "profile", f"skills.{category}", category,
+                       (("title", category), ("skills", _join(skills))))
+    coursework = (profile.get("education") or {}).get("coursework")
+    if coursework:
+        yield Document(("profile", "education.coursework"), "profile", "education.coursework", "Coursework",
+                       (("coursework", _join(coursework)),))
+
+    # Keyed by the same slugs as the admin endpoints, so inserting or
+    # reordering an entry does not re-index every entry after it
+    for ref, entry in zip(snapshot.keys["experience"], snapshot.experience):
+        yield Document(("experience", ref), "experience", ref, f"{entry['role']} at {entry['company']}", (
+            ("role", entry["role"]),
+            ("company", entry["company"]),
+            ("description", _join(entry.get("description")))
+        ))
+
+    for ref, project in zip(snapshot.keys["projects"], snapshot.projects):
+        yield Document(("projects", ref), "projects", ref, project["title"], tuple(
+            (name, _join(project.get(name)))
+            for name in ("title", "technologies", "description", "metrics", "challenge")
+            if project.get(name)
+        ))
+
+class _TrieNode:
+    __slots__ = ("children", "term", "top")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.term: Optional[str] = None
+        # Cached best completions under this node; cleared when a term below changes
+        self.top: Optional[list[str]] = None
+
+class PrefixTrie:
+    """Vocabulary trie for type-ahead, ranking completions by document frequency"""
+
+    def __init__(self, frequency: dict[str, int]):
+        self._root = _TrieNode()
+        self._frequency = frequency
+
+    def _path(self, term: str, create: bool) -> list[_TrieNode]:
+        node, path = self._root, [self._root]
+        for char in term:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return path
+                child = node.children[char] = _TrieNode()
+            node = child
+            path.append(node)
+        return path
+
+    def touch(self, term: str):
+        """Record that `term` was added, removed or changed frequency"""
+        path = self._path(term, create=True)
+        path[-1].term = term if self._frequency.get(term) else None
+        for node in path:
+            node.top = None
+
+    def complete(self, prefix: str, limit: int) -> list[str]:
+        path = self._path(prefix, create=False)
+        if len(path) != len(prefix) + 1:
+            return []
+        node = path[-1]
+        if node.top is None:
+            terms, stack = [], [node]
+            while stack:
+                current = stack.pop()
+                if current.term is not None:
+                    terms.append(current.term)
+                stack.extend(current.children.values())
+            terms.sort(key=lambda term: (-self._frequency[term], term))
+            node.top = terms[:SUGGEST_CACHE_SIZE]
+        return node.top[:limit]
+
+class SearchIndex:
+    """BM25 inverted index over snapshot documents, updated incrementally.
+
+    On each new snapshot only documents whose content changed are removed
+    and re-added, and the prefix trie only invalidates the paths of terms
+    whose document frequency changed. Queries read postings and stored token
+    offsets and never go back to the raw data.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._documents: dict[tuple, Document] = {}
+        self._fingerprints: dict[tuple, str] = {}
+        # term -> {doc key: weighted term frequency}
+        self._postings: dict[str, dict[tuple, float]] = {}
+        self._lengths: dict[tuple, float] = {}
+        self._total_length = 0.0
+        # doc key -> [(field, text, [(term, start, end), ...])]
+        self._tokens: dict[tuple, list] = {}
+        self._frequency: dict[str, int] = {}
+        self.trie = PrefixTrie(self._frequency)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _add(self, document: Document):
+        key = document.key
+        counts, length, stored = {}, 0.0, []
+        for name, text in document.fields:
+            tokens = tokenize(text)
+            weight = FIELD_WEIGHTS.get(name, 1.0)
+            for term, _, _ in tokens:
+                counts[term] = counts.get(term, 0.0) + weight
+            length += len(tokens)
+            stored.append((name, text, tokens))
+        for term, count in counts.items():
+            postings = self._postings.setdefault(term, {})
+            postings[key] = count
+            self._frequency[term] = len(postings)
+            self.trie.touch(term)
+        self._documents[key] = document
+        self._fingerprints[key] = document.fingerprint
+        self._lengths[key] = length
+        self._total_length += length
+        self._tokens[key] = stored
+
+    def _remove(self, key: tuple):
+        terms = {term for _, _, tokens in self._tokens.pop(key) for term, _, _ in tokens}
+        for term in terms:
+            postings = self._postings[term]
+            del postings[key]
+            if postings:
+                self._frequency[term] = len(postings)
+            else:
+                del self._postings[term]
+                del self._frequency[term]
+            self.trie.touch(term)
+        self._total_length -= self._lengths.pop(key)
+        del self._documents[key]
+        del self._fingerprints[key]
+
+    def update(self, documents: Iterable[Document], version: Optional[int] = None) -> tuple[int, int]:
+        """Sync the index with a new document set; returns (added, removed) counts"""
+        incoming = {document.key: document for document in documents}
+        removed = [
+            key for key in self._documents
+            if key not in incoming or incoming[key].fingerprint != self._fingerprints[key]
+        ]
+        for key in removed:
+            self._remove(key)
+        added = [document for key, document in incoming.items() if key not in self._documents]
+        for document in added:
+            self._add(document)
+        self.version = version
+        return len(added), len(removed)
+
+    def update_from_snapshot(self, snapshot):
+        """Snapshot listener: index the newly published version"""
+        self.update(snapshot_documents(snapshot), snapshot.version)
+
+    def _expand(self, terms: list[str]) -> list[str]:
+        # Treat an unknown last term as a prefix so results follow typing
+        if terms and terms[-1] not in self._postings:
+            return terms[:-1] + self.trie.complete(terms[-1], PREFIX_EXPANSIONS)
+        return terms
+
+    def search(self, query: str, limit: int = 10, section: Optional[str] = None) -> tuple[int, list[dict]]:
+        """Total matches and the top `limit` hits, best first"""
+        terms = self._expand(list(dict.fromkeys(term for term, _, _ in tokenize(query))))
+        if not terms or not self._documents:
+            return 0, []
+
+        count = len(self._documents)
+        average = self._total_length / count or 1.0
+        scores: dict[tuple, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, tf in postings.items():
+                if section is not None and key[0] != section:
+                    continue
+                norm = K1 * (1 - B + B * self._lengths[key] / average)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        matched = set(terms)
+        hits = []
+        for key, score in ranked:
+            document = self._documents[key]
+            field_name, snippet = self._snippet(key, matched)
+            hits.append({
+                "section": document.section,
+                "ref": document.ref,
+                "title": document.title,
+                "score": round(score, 4),
+                "field": field_name,
+                "snippet": snippet
+            })
+        return len(scores), hits
+
+    def _snippet(self, key: tuple, matched: set) -> tuple[str, str]:
+        """HTML-escaped excerpt of the best matching field with <mark> around matches"""
+        best = None
+        for name, text, tokens in self._tokens[key]:
+            spans = [(start, end) for term, start, end in tokens if term in matched]
+            if spans and (best is None or len(spans) * FIELD_WEIGHTS.get(name, 1.0) > best[0]):
+                best = (len(spans) * FIELD_WEIGHTS.get(name, 1.0), name, text, spans)
+        if best is None:
+            name, text, _ = self._tokens[key][0]
+            return name, html.escape(text[:SNIPPET_CHARS])
+
+        _, name, text, spans = best
+        start = max(0, spans[0][0] - SNIPPET_CHARS // 4)
+        if start:
+            # Begin at a word boundary
+            space = text.rfind(" ", 0, start)
+            start = space + 1 if space != -1 else start
+        end = min(len(text), start + SNIPPET_CHARS)
+        parts, cursor = [], start
+        for span_start, span_end in spans:
+            if span_start < start or span_end > end:
+                continue
+            parts.append(html.escape(text[cursor:span_start]))
+            parts.append(f"<mark>{html.escape(text[span_start:span_end])}</mark>")
+            cursor = span_end
+        parts.append(html.escape(text[cursor:end]))
+        return name, ("…" if start else "") + "".join(parts) + ("…" if end < len(text) else "")
+
+    def suggest(self, prefix: str, limit: int = 8) -> list[str]:
+        """Completions for the last word of `prefix`, most common terms first"""
+        tokens = tokenize(prefix)
+        # Nothing to complete once the last word is finished
+        if not tokens or tokens[-1][2] != len(prefix):
+            return []
+        head = prefix[:tokens[-1][1]]
+        return [head + term for term in self.trie.complete(tokens[-1][0], limit)]
@@ -0,0 +1,163 @@
+"""Serve the API from several worker processes that share one preloaded snapshot.
+
+    python serve.py [--workers N] [--host 0.0.0.0] [--port 8000]
+
+The parent imports the app, builds the first data snapshot, freezes the heap
+and binds the listening socket, then forks the workers. Workers inherit the
+snapshot copy-on-write instead of each loading data.py, and accept on the
+shared socket. A reload on any worker, or a change to data.py, bumps a shared
+generation counter that every worker polls every DATA_WATCH_INTERVAL seconds.
+Workers that exit unexpectedly are replaced. With more than one worker the
+contact rate limits default to the shared SQLite store, so they hold per
+server rather than per worker.
+"""
+import os
+import gc
+import sys
+import time
+import signal
+import socket
+import asyncio
+import logging
+import argparse
+import tempfile
+
+logger = logging.getLogger("portfolio.serve")
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+def run_worker(app, sock: socket.socket, args):
+    """Run one uvicorn server on the inherited socket (in a forked child)"""
+    import uvicorn
+
+    # Replace the parent's forwarding handlers. uvicorn installs its own while
+    # serving and re-raises the signal afterwards; ignoring it then lets the
+    # worker flush its logs and exit normally.
+    signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    signal.signal(signal.SIGINT, lambda signum, frame: None)
+    config = uvicorn.Config(
+        app,
+        log_level=args.log_level,
+        access_log=False,
+        timeout_graceful_shutdown=5,
+        timeout_keep_alive=args.keep_alive
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+class Supervisor:
+    """Forks the workers, replaces ones that die and forwards shutdown signals"""
+
+    def __init__(self, app, sock: socket.socket, args):
+        self.app = app
+        self.sock = sock
+        self.args = args
+        self.workers: dict[int, int] = {}
+        self.stopping = False
+
+    def spawn(self, slot: int):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_worker(self.app, self.sock, self.args)
+            except BaseException:
+                logger.exception(f"Worker {slot} crashed")
+                code = 1
+            finally:
+                # os._exit skips atexit, so flush the log listener here
+                from access_log import shutdown_logging
+                shutdown_logging()
+                logging.shutdown()
+                os._exit(code)
+        self.workers[pid] = slot
+        logger.info(f"Started worker {slot} (pid {pid})")
+
+    def stop(self, signum, frame):
+        self.stopping = True
+        for pid in self.workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for slot in range(self.args.workers):
+            self.spawn(slot)
+
+        restarts = []
+        while self.workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            slot = self.workers.pop(pid, None)
+            if slot is None or self.stopping:
+                continue
+            logger.warning(f"Worker {slot} (pid {pid}) exited with status {os.waitstatus_to_exitcode(status)}")
+            # Stop replacing workers that crash in a tight loop
+            now = time.monotonic()
+            restarts = [t for t in restarts if now - t < 60] + [now]
+            if len(restarts) > self.args.workers * 5:
+                logger.error("Workers are crashing repeatedly, shutting down")
+                self.stop(signal.SIGTERM, None)
+                continue
+            self.spawn(slot)
+        return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)))
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--keep-alive", type=int, default=5, help="Idle keep-alive timeout in seconds")
+    parser.add_argument("--log-level", default="info")
+    return parser.parse_args(argv)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    # Must be set before the app module builds its snapshot manager and limiter
+    if args.workers > 1:
+        os.environ.setdefault("RATE_LIMIT_STORE", "sqlite")
+    generation_dir = None
+    if not os.getenv("DATA_GENERATION_FILE"):
+        generation_dir = tempfile.mkdtemp(prefix="portfolio-serve-")
+        os.environ["DATA_GENERATION_FILE"] = os.path.join(generation_dir, "generation")
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import main as api
+
+    # Preload in the parent so every worker starts from the same snapshot
+    snapshot = asyncio.run(api.snapshots.load_initial())
+    logger.info(f"Preloaded data snapshot v{snapshot.version} for {args.workers} workers")
+    # Move everything loaded so far out of the collector's view, so GC passes
+    # in the workers do not write to (and un-share) the inherited pages.
+    gc.collect()
+    gc.freeze()
+
+    sock = bind_socket(args.host, args.port, args.backlog)
+    logger.info(f"Listening on http://{args.host}:{args.port}")
+    try:
+        return Supervisor(api.app, sock, args).run()
+    finally:
+        sock.close()
+        if generation_dir is not None:
+            try:
+                os.remove(os.environ["DATA_GENERATION_FILE"])
+                os.rmdir(generation_dir)
+            except OSError:
+                pass
+        logger.info("🛑 All workers stopped")
+
+if __name__ == "__main__":
+    sys.exit(main())
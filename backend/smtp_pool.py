@@ -0,0 +1,149 @@
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean the session is gone rather than the message being rejected
+DISCONNECT_ERRORS = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, ConnectionError, OSError)
+
+@dataclass
+class _Session:
+    client: aiosmtplib.SMTP
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    messages: int = 0
+
+class SMTPPool:
+    """A small pool of authenticated SMTP sessions reused across messages.
+
+    At most `max_size` sessions exist at once, which keeps us under the
+    provider's concurrent-connection limits. Idle sessions get a NOOP every
+    `keepalive_interval` seconds and are closed after `max_idle` seconds or
+    `max_messages` sends. A session the server dropped is replaced and the
+    send retried once.
+    """
+
+    def __init__(self, connect: Callable[[], Awaitable[aiosmtplib.SMTP]], max_size: int = 2,
+                 keepalive_interval: float = 30.0, max_idle: float = 240.0, max_messages: int = 100):
+        self._connect = connect
+        self.max_size = max_size
+        self.keepalive_interval = keepalive_interval
+        self.max_idle = max_idle
+        self.max_messages = max_messages
+        self._idle: deque[_Session] = deque()
+        self._slots = asyncio.Semaphore(max_size)
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self.sessions_opened = 0
+
+    @property
+    def idle_sessions(self) -> int:
+        return len(self._idle)
+
+    async def _open(self) -> _Session:
+        client = await self._connect()
+        self.sessions_opened += 1
+        return _Session(client=client)
+
+    async def _close(self, session: _Session):
+        try:
+            await session.client.quit()
+        except Exception:
+            session.client.close()
+
+    def _take_idle(self) -> Optional[_Session]:
+        # Most recently used first: it is the least likely to have timed out.
+        while self._idle:
+            session = self._idle.pop()
+            if session.client.is_connected and time.monotonic() - session.last_used < self.max_idle:
+                return session
+            session.client.close()
+        return None
+
+    async def send_message(self, msg):
+        """Send a message over a pooled session, reconnecting once if it was dropped"""
+        async with self._slots:
+            session = self._take_idle()
+            reused = session is not None
+            if session is None:
+                session = await self._open()
+
+            try:
+                await session.client.send_message(msg)
+            except DISCONNECT_ERRORS as e:
+                session.client.close()
+                if not reused:
+                    raise
+                logger.info(f"Pooled SMTP session dropped ({e}); reconnecting")
+                session = await self._open()
+                try:
+                    await session.client.send_message(msg)
+                except Exception:
+                    session.client.close()
+                    raise
+            except Exception:
+                # Rejected message: reset the transaction before reusing the session.
+                try:
+                    await session.client.rset()
+                except Exception:
+                    session.client.close()
+                    raise
+                self._release(session)
+                raise
+
+            session.messages += 1
+            self._release(session)
+
+    def _release(self, session: _Session):
+        session.last_used = time.monotonic()
+        if session.messages >= self.max_messages or not session.client.is_connected:
+            asyncio.get_running_loop().create_task(self._close(session))
+            return
+        self._idle.append(session)
+
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            now = time.monotonic()
+            for session in list(self._idle):
+                if session not in self._idle:
+                    continue
+                # A pinged session still counts against max_size: take a slot
+                # without waiting, and leave the rest to busy senders if none is free.
+                if self._slots.locked():
+                    break
+                await self._slots.acquire()
+                try:
+                    # Take the session out while pinging so no sender can grab it mid-NOOP.
+                    self._idle.remove(session)
+                    if now - session.last_used >= self.max_idle:
+                        await self._close(session)
+                        continue
+                    try:
+                        await session.client.noop()
+                    except Exception:
+                        session.client.close()
+                        continue
+                    self._idle.appendleft(session)
+                finally:
+                    self._slots.release()
+
+    def start(self):
+        if self._keepalive_task is None:
+            self._keepalive_task = asyncio.get_running_loop().create_task(self._keepalive())
+
+    async def close(self):
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+        while self._idle:
+            await self._close(self._idle.pop())
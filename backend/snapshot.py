@@ -0,0 +1,440 @@
+import os
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from models import ProfileData, Experience, Project
+from rendering import RenderedPayload, dumps, render_payload, render_body, DYNAMIC_BR_QUALITY
+from listing import SectionIndex, ListQuery
+from storage import item_keys
+from metrics import DATA_RELOADS, DATA_RELOAD_LATENCY
+
+logger = logging.getLogger(__name__)
+
+SECTION_MODELS = {
+    "profile": ProfileData,
+    "experience": Experience,
+    "projects": Project
+}
+
+# Sparse /api/portfolio renderings and list query pages kept per snapshot
+SPARSE_CACHE_SIZE = 64
+QUERY_CACHE_SIZE = 256
+
+def parse_fieldset(include: Optional[str] = None, fields: Optional[str] = None,
+                   exclude: Optional[str] = None) -> tuple:
+    """Normalize include/fields/exclude query values into a hashable fieldset.
+
+    `include` lists sections; `fields` and `exclude` take `section.field`
+    entries. Raises ValueError for unknown sections or fields.
+    """
+    def split(value):
+        return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+    sections = split(include) or list(SECTION_MODELS)
+    for section in sections:
+        if section not in SECTION_MODELS:
+            raise ValueError(f"Unknown section: {section}")
+
+    def field_map(value, param):
+        selected = {}
+        for item in split(value):
+            section, _, name = item.partition(".")
+            if section not in SECTION_MODELS or name not in SECTION_MODELS[section].model_fields:
+                raise ValueError(f"Unknown field in {param}: {item}")
+            selected.setdefault(section, set()).add(name)
+        return tuple(sorted((section, tuple(sorted(names))) for section, names in selected.items()))
+
+    ordered = tuple(section for section in SECTION_MODELS if section in sections)
+    return ordered, field_map(fields, "fields"), field_map(exclude, "exclude")
+
+FULL_FIELDSET = parse_fieldset()
+
+def _project(item: dict, only: Optional[tuple], skip: tuple) -> dict:
+    return {
+        key: value for key, value in item.items()
+        if (only is None or key in only) and key not in skip
+    }
+
+def apply_fieldset(snapshot, fieldset: tuple) -> dict:
+    sections, fields, exclude = fieldset
+    only_map, skip_map = dict(fields), dict(exclude)
+    bundle = {}
+    for section in sections:
+        only, skip = only_map.get(section), skip_map.get(section, ())
+        data = getattr(snapshot, section)
+        if only is None and not skip:
+            bundle[section] = data
+        elif isinstance(data, dict):
+            bundle[section] = _project(data, only, skip)
+        else:
+            bundle[section] = [_project(item, only, skip) for item in data]
+    return bundle
+
+@dataclass(frozen=True)
+class DataSnapshot:
+    """An immutable, validated copy of the portfolio data.
+
+    Handlers only ever read from a snapshot; a reload builds a new one and
+    swaps it in, so the contents must be treated as read-only.
+    """
+    version: int
+    profile: dict
+    experience: tuple
+    projects: tuple
+    payloads: dict[str, RenderedPayload]
+    content_hash: str
+    loaded_at: datetime
+    source_mtime: Optional[float] = None
+    is_fallback: bool = False
+    # Stable key per entry, in order: field names for profile, slugs for lists
+    keys: dict[str, tuple] = field(default_factory=dict, compare=False, repr=False)
+    indexes: dict[str, SectionIndex] = field(default_factory=dict, compare=False, repr=False)
+    _sparse_payloads: OrderedDict = field(default_factory=OrderedDict, compare=False, repr=False)
+    _query_pages: OrderedDict = field(default_factory=OrderedDict, compare=False, repr=False)
+
+    def bundle_payload(self, fieldset: tuple = FULL_FIELDSET) -> RenderedPayload:
+        """Rendered /api/portfolio body for a fieldset, memoized per version"""
+        if fieldset == FULL_FIELDSET:
+            return self.payloads["portfolio"]
+        cache = self._sparse_payloads
+        payload = cache.get(fieldset)
+        if payload is None:
+            payload = render_payload(apply_fieldset(self, fieldset))
+            cache[fieldset] = payload
+            if len(cache) > SPARSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(fieldset)
+        return payload
+
+    def page_positions(self, section: str, query: ListQuery, offset: int = 0) -> tuple[list[int], int, Optional[int]]:
+        """Item positions on one page of a list section: (positions, total matches, next offset)"""
+        positions = self.indexes[section].select(query)
+        end = len(positions) if query.limit is None else offset + query.limit
+        return positions[offset:end], len(positions), end if end < len(positions) else None
+
+    def list_page(self, section: str, query: ListQuery, offset: int = 0) -> tuple[RenderedPayload, int, Optional[int]]:
+        """One page of a filtered, sorted list section: (payload, total matches, next offset)"""
+        key = (section, query, offset)
+        cache = self._query_pages
+        page = cache.get(key)
+        if page is not None:
+            cache.move_to_end(key)
+            return page
+
+        positions, total, next_offset = self.page_positions(section, query, offset)
+        page = (
+            render_body(self.indexes[section].render(positions), br_quality=DYNAMIC_BR_QUALITY),
+            total,
+            next_offset
+        )
+        cache[key] = page
+        if len(cache) > QUERY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return page
+
+def build_snapshot(version, profile_data, experience_data, projects_data,
+                   source_mtime=None, is_fallback=False) -> DataSnapshot:
+    """Validate raw data against the API models and freeze it into a snapshot"""
+    if not profile_data or not isinstance(profile_data, dict):
+        raise ValueError("Invalid profile_data structure")
+
+    profile = ProfileData.model_validate(profile_data).model_dump(mode="json")
+    experience = tuple(Experience.model_validate(item).model_dump(mode="json") for item in experience_data)
+    projects = tuple(Project.model_validate(item).model_dump(mode="json") for item in projects_data)
+
+    # Render each section once per version so handlers only copy bytes.
+    payloads = {
+        "profile": render_payload(profile),
+        "experience": render_payload(experience),
+        "projects": render_payload(projects),
+        "portfolio": render_payload({"profile": profile, "experience": experience, "projects": projects})
+    }
+
+    return DataSnapshot(
+        version=version,
+        profile=profile,
+        experience=experience,
+        projects=projects,
+        payloads=payloads,
+        content_hash=_content_hash(payloads),
+        loaded_at=datetime.now(timezone.utc),
+        source_mtime=source_mtime,
+        is_fallback=is_fallback,
+        keys={
+            "profile": tuple(profile),
+            "experience": tuple(item_keys("experience", experience)),
+            "projects": tuple(item_keys("projects", projects))
+        },
+        indexes={
+            "experience": SectionIndex("experience", experience),
+            "projects": SectionIndex("projects", projects)
+        }
+    )
+
+def _content_hash(payloads: dict) -> str:
+    digest = hashlib.sha256()
+    for name in ("profile", "experience", "projects"):
+        digest.update(payloads[name].body)
+    return digest.hexdigest()
+
+def derive_snapshot(base: DataSnapshot, version: int, section: str, data) -> DataSnapshot:
+    """A new snapshot with one section replaced, sharing everything else with `base`.
+
+    `data` must already be validated and normalized. The other sections,
+    their payloads and list indexes are reused as is. In a list section,
+    entries that are the same objects as in `base` keep their rendered JSON,
+    so only changed entries are encoded again.
+    """
+    payloads = dict(base.payloads)
+    indexes = dict(base.indexes)
+    sections = {name: getattr(base, name) for name in ("profile", "experience", "projects")}
+    sections[section] = data
+
+    if section == "profile":
+        payloads["profile"] = render_payload(data)
+    else:
+        rendered = {id(item): body for item, body in zip(getattr(base, section), base.indexes[section].bodies)}
+        bodies = [rendered.get(id(item)) or dumps(item) for item in data]
+        payloads[section] = render_body(b"[" + b",".join(bodies) + b"]")
+        indexes[section] = SectionIndex(section, data, bodies=bodies)
+    payloads["portfolio"] = render_body(
+        b'{"profile":' + payloads["profile"].body +
+        b',"experience":' + payloads["experience"].body +
+        b',"projects":' + payloads["projects"].body + b"}"
+    )
+
+    return DataSnapshot(
+        version=version,
+        payloads=payloads,
+        content_hash=_content_hash(payloads),
+        loaded_at=datetime.now(timezone.utc),
+        source_mtime=base.source_mtime,
+        keys={**base.keys, section: tuple(data) if section == "profile" else tuple(item_keys(section, data))},
+        indexes=indexes,
+        **sections
+    )
+
+class SnapshotManager:
+    """Holds the current data snapshot and rebuilds it when the data source changes.
+
+    Loading and validation run in a worker thread, concurrent reloads share a
+    single in-flight build, and a failed build keeps the previous snapshot.
+    With a shared generation counter, a version published by one worker
+    process is picked up by the others within one poll interval.
+    """
+
+    def __init__(self, loader: Callable, fallback: Callable, watch_path: str, poll_interval: float = 2.0,
+                 generation=None):
+        self._loader = loader
+        self._fallback = fallback
+        self._watch_path = watch_path
+        self._poll_interval = poll_interval
+        # Optional SharedGeneration: lets sibling worker processes follow reloads
+        self._generation = generation
+        self._seen_generation = generation.value if generation else 0
+        self._snapshot: Optional[DataSnapshot] = None
+        self._reload_task: Optional[asyncio.Task] = None
+        # Set when a reload joins a build that has already read the source
+        self._building = False
+        self._rebuild_requested = False
+        self._watch_task: Optional[asyncio.Task] = None
+        # Source mtime the live snapshot already reflects, as the watcher saw it
+        self._seen_mtime: Optional[float] = None
+        self._listeners: list[Callable] = []
+        # Serializes publishers (reloads and admin writes); readers never take it
+        self._write_lock = asyncio.Lock()
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def current(self) -> DataSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError("Data snapshot has not been loaded yet")
+        return snapshot
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def add_listener(self, callback: Callable):
+        """Call `callback(snapshot)` on the event loop whenever a new version is published"""
+        self._listeners.append(callback)
+
+    def _publish(self, snapshot: DataSnapshot):
+        self._snapshot = snapshot
+        for callback in self._listeners:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"Snapshot listener failed: {e}")
+
+    def _source_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self._watch_path).st_mtime
+        except OSError:
+            return None
+
+    def _build(self, version: int) -> DataSnapshot:
+        """Load and validate the data source (runs in a worker thread)"""
+        source_mtime = self._source_mtime()
+        profile_data, experience_data, projects_data = self._loader()
+        return build_snapshot(version, profile_data, experience_data, projects_data, source_mtime=source_mtime)
+
+    def _swap(self, snapshot: DataSnapshot) -> DataSnapshot:
+        current = self._snapshot
+        if current is not None and not current.is_fallback and current.content_hash == snapshot.content_hash:
+            # Same content: keep the existing version so caches stay valid.
+            return current
+
+        self._publish(snapshot)
+        logger.info(
+            f"Data snapshot v{snapshot.version} published: "
+            f"{len(snapshot.experience)} experiences, {len(snapshot.projects)} projects"
+        )
+        return snapshot
+
+    async def _run_reload(self, propagate: bool) -> DataSnapshot:
+        try:
+            async with self._write_lock:
+                while True:
+                    self._rebuild_requested = False
+                    try:
+                        snapshot = await self._reload_locked(propagate)
+                    except Exception:
+                        if not self._rebuild_requested:
+                            raise
+                        snapshot = None
+                    if not self._rebuild_requested:
+                        return snapshot
+                    # The source changed after this build read it: build once more
+                    logger.info("Data source changed during the reload, rebuilding")
+        finally:
+            self._reload_task = None
+
+    async def _reload_locked(self, propagate: bool) -> DataSnapshot:
+        started = time.perf_counter()
+        try:
+            next_version = self._snapshot.version + 1 if self._snapshot else 1
+            self._building = True
+            try:
+                snapshot = await asyncio.to_thread(self._build, next_version)
+            finally:
+                self._building = False
+            self.reload_count += 1
+            self.last_error = None
+            DATA_RELOADS.inc("success")
+            published = self._swap(snapshot)
+            if published is snapshot and propagate and self._generation is not None:
+                self._seen_generation = self._generation.bump()
+            return published
+        except Exception as e:
+            self.last_error = str(e)
+            DATA_RELOADS.inc("failure")
+            logger.error(f"Error reloading data, keeping previous snapshot: {e}")
+            raise
+        finally:
+            DATA_RELOAD_LATENCY.observe(time.perf_counter() - started)
+
+    async def apply(self, write: Callable) -> DataSnapshot:
+        """Publish a single-section change without reloading the data source.
+
+        `write(current)` runs in a worker thread. It persists the change and
+        returns (section, new data) for derive_snapshot. Writes are applied
+        one at a time, and the new version is published with one reference
+        swap, so readers see either the old snapshot or the new one.
+        """
+        async with self._write_lock:
+            current = self.current
+
+            def build():
+                change = write(current)
+                # The write touched the source file itself; the watcher must
+                # not mistake that for an outside edit and reload everything
+                self._seen_mtime = self._source_mtime()
+                return derive_snapshot(current, current.version + 1, *change)
+
+            snapshot = await asyncio.to_thread(build)
+            published = self._swap(snapshot)
+            if published is snapshot and self._generation is not None:
+                self._seen_generation = self._generation.bump()
+            return published
+
+    async def reload(self, propagate: bool = True) -> DataSnapshot:
+        """Rebuild the snapshot; callers arriving mid-reload share the same build.
+
+        A caller that arrives after the build has started reading the source
+        makes it run once more when done, so a change made during a build is
+        never lost. A new version bumps the shared generation unless
+        `propagate` is false, as when the reload was itself triggered by
+        another worker's bump.
+        """
+        task = self._reload_task
+        if task is not None and self._building:
+            self._rebuild_requested = True
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._run_reload(propagate))
+            self._reload_task = task
+        return await asyncio.shield(task)
+
+    async def load_initial(self) -> DataSnapshot:
+        """Build the first snapshot, falling back to built-in data on failure.
+
+        A snapshot preloaded before the worker forked is kept as is.
+        """
+        if self._snapshot is not None and not self._snapshot.is_fallback:
+            return self._snapshot
+        try:
+            return await self.reload(propagate=False)
+        except Exception:
+            profile_data, experience_data, projects_data = self._fallback()
+            snapshot = build_snapshot(1, profile_data, experience_data, projects_data, is_fallback=True)
+            self._publish(snapshot)
+            logger.warning("Serving fallback data until the data store loads cleanly")
+            return snapshot
+
+    async def _watch(self):
+        if self._seen_mtime is None and self._snapshot:
+            self._seen_mtime = self._snapshot.source_mtime
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            if self._write_lock.locked():
+                # A write or reload is running; look again once it is done
+                continue
+            propagate = True
+            mtime = self._source_mtime()
+            generation = self._generation.value if self._generation else self._seen_generation
+            if generation != self._seen_generation:
+                # Another worker published a new version and told the rest;
+                # its write may also explain a changed mtime
+                self._seen_generation = generation
+                propagate = False
+            elif mtime is None or mtime == self._seen_mtime:
+                continue
+            if mtime is not None:
+                self._seen_mtime = mtime
+            try:
+                await self.reload(propagate=propagate)
+            except Exception:
+                # The previous snapshot stays live; retry on the next change.
+                pass
+
+    def start(self):
+        if self._watch_task is None:
+            self._watch_task = asyncio.get_running_loop().create_task(self._watch())
+
+    async def stop(self):
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
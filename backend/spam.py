@@ -0,0 +1,121 @@
+import re
+import hmac
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+LINK = re.compile(r"https?://|www\.|\[url", re.IGNORECASE)
+WORD = re.compile(r"\S+")
+
+def submission_fingerprint(email: str, message: str) -> str:
+    """Hash of the normalized email and message; case and whitespace do not matter"""
+    normalized = email.strip().lower() + "\n" + " ".join(message.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+class DuplicateFilter:
+    """Fingerprints seen within `window` seconds, in an LRU bounded by `max_entries`"""
+
+    def __init__(self, window: float = 3600.0, max_entries: int = 10000):
+        self.window = window
+        self.max_entries = max_entries
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float):
+        # Entries are in insertion order, so expired ones are at the front
+        while self._seen:
+            oldest, seen_at = next(iter(self._seen.items()))
+            if now - seen_at < self.window:
+                break
+            del self._seen[oldest]
+
+    def contains(self, fingerprint: str, now: Optional[float] = None) -> bool:
+        """True if `fingerprint` was recorded within the window; records nothing"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire(now)
+            return fingerprint in self._seen
+
+    def add(self, fingerprint: str, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._expire(now)
+            self._seen.pop(fingerprint, None)
+            self._seen[fingerprint] = now
+            if len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+class SpamFilter:
+    """Cheap checks that keep duplicates and bot posts away from SMTP.
+
+    In order: a filled honeypot field, a form submitted sooner than
+    `min_fill_seconds` after its token was issued, a heuristic score over
+    the token and links, and finally a duplicate of a recent accepted
+    submission. Tokens are an HMAC-signed issue time, so any process sharing
+    `secret` can verify them. Returns the decision name; only "accepted"
+    should be delivered. `check` does not record the submission: call
+    `record` once it has been queued, so a retry after a failure is not
+    mistaken for a duplicate.
+    """
+
+    def __init__(self, secret: bytes, min_fill_seconds: float = 3.0, max_token_age: float = 86400.0,
+                 max_links: int = 2, threshold: int = 3, duplicates: Optional[DuplicateFilter] = None):
+        self.secret = secret
+        self.min_fill_seconds = min_fill_seconds
+        self.max_token_age = max_token_age
+        self.max_links = max_links
+        self.threshold = threshold
+        self.duplicates = duplicates or DuplicateFilter()
+
+    def _sign(self, issued: str) -> str:
+        return hmac.new(self.secret, issued.encode("ascii"), hashlib.sha256).hexdigest()[:32]
+
+    def issue_token(self, now: Optional[float] = None) -> str:
+        issued = str(int((time.time() if now is None else now) * 1000))
+        return f"{issued}.{self._sign(issued)}"
+
+    def token_age(self, token: Optional[str], now: Optional[float] = None) -> Optional[float]:
+        """Seconds since a valid token was issued; None if missing or forged"""
+        issued, _, signature = (token or "").partition(".")
+        # isdigit() alone accepts non-ASCII digits, and compare_digest rejects non-ASCII str
+        if not (issued.isascii() and issued.isdigit()) or not hmac.compare_digest(
+            signature.encode("utf-8", "replace"), self._sign(issued).encode("ascii")
+        ):
+            return None
+        return (time.time() if now is None else now) - int(issued) / 1000
+
+    def score(self, name: str, message: str, token_age: Optional[float]) -> int:
+        score = 0
+        if token_age is None or token_age > self.max_token_age:
+            score += 1
+        links = len(LINK.findall(message))
+        if links > self.max_links:
+            score += 2
+        if links and links * 10 > len(WORD.findall(message)):
+            # More than one link per ten words
+            score += 1
+        if LINK.search(name):
+            score += 2
+        return score
+
+    def check(self, name: str, email: str, message: str, honeypot: Optional[str] = None,
+              token: Optional[str] = None, check_duplicate: bool = True) -> str:
+        if honeypot:
+            return "honeypot"
+        token_age = self.token_age(token)
+        if token_age is not None and token_age < self.min_fill_seconds:
+            return "too_fast"
+        if self.score(name, message, token_age) >= self.threshold:
+            return "spam"
+        if check_duplicate and self.duplicates.contains(submission_fingerprint(email, message)):
+            return "duplicate"
+        return "accepted"
+
+    def record(self, email: str, message: str):
+        """Remember an accepted submission for the duplicate check"""
+        self.duplicates.add(submission_fingerprint(email, message))
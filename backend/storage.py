@@ -0,0 +1,279 @@
+import os
+import re
+import json
+import sqlite3
+import threading
+import importlib.util
+from collections import OrderedDict
+from typing import Optional
+
+from artifact import load_current_artifact
+
+SECTIONS = ("profile", "experience", "projects")
+
+def load_source(path: str):
+    """Execute a data.py-style module and return its three sections"""
+    spec = importlib.util.spec_from_file_location("portfolio_data_source", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.profile_data, module.experience_data, module.projects_data
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.casefold()).strip("-") or "item"
+
+def item_keys(section: str, items) -> list[str]:
+    """Stable keys for list items: the slugged title, or company and role.
+
+    Profile entries are keyed by field name. Duplicates get a numeric suffix.
+    """
+    if section == "profile":
+        return list(items)
+    keys, seen = [], set()
+    for item in items:
+        base = _slug(item.get("title") or "") if section == "projects" else \
+            _slug(f"{item.get('company', '')} {item.get('role', '')}")
+        key, suffix = base, 2
+        while key in seen:
+            key, suffix = f"{base}-{suffix}", suffix + 1
+        seen.add(key)
+        keys.append(key)
+    return keys
+
+class ModuleStore:
+    """Reads data.py, or its compiled artifact while that is current.
+
+    The module can only be read whole, so every section shares one revision:
+    the file's modification time. The last read is kept until it changes.
+    """
+    name = "module"
+
+    def __init__(self, path: str, artifact_path: Optional[str] = None):
+        self.path = path
+        self.watch_path = path
+        self.artifact_path = artifact_path
+        self.source = None
+        self._lock = threading.Lock()
+        self._read: Optional[tuple] = None
+
+    def revisions(self) -> dict:
+        mtime = os.stat(self.path).st_mtime_ns
+        return {section: mtime for section in SECTIONS}
+
+    def _sections(self) -> dict:
+        with self._lock:
+            mtime = os.stat(self.path).st_mtime_ns
+            if self._read is not None and self._read[0] == mtime:
+                return self._read[1]
+            artifact = load_current_artifact(self.artifact_path, self.path) if self.artifact_path else None
+            if artifact is not None:
+                try:
+                    sections = {section: artifact.section(section) for section in SECTIONS}
+                    self.source = "artifact"
+                finally:
+                    artifact.close()
+            else:
+                sections = dict(zip(SECTIONS, load_source(self.path)))
+                self.source = "module"
+            self._read = (mtime, sections)
+            return sections
+
+    def read_section(self, section: str):
+        return self._sections()[section]
+
+    def read_item(self, section: str, key: str):
+        data = self.read_section(section)
+        if section == "profile":
+            return data.get(key)
+        return dict(zip(item_keys(section, data), data)).get(key)
+
+class SQLiteDataStore:
+    """Portfolio content in an indexed SQLite file, one row per entry.
+
+    Profile fields, experiences and projects are separate rows keyed by
+    (section, key) and ordered by position, so one entry can be read or
+    written without touching the rest. Every write bumps its section's
+    revision in the same transaction, which lets the cache re-read only the
+    sections that changed.
+    """
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        # The default rollback journal writes the main file on every commit,
+        # so the snapshot manager's mtime watcher sees changes from any process
+        self.watch_path = path
+        self.source = "sqlite"
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not cross fork; each worker process opens its own
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=5)
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                section TEXT NOT NULL, key TEXT NOT NULL, position REAL NOT NULL, body TEXT NOT NULL,
+                PRIMARY KEY (section, key)
+            );
+            CREATE INDEX IF NOT EXISTS entries_order ON entries (section, position);
+            CREATE TABLE IF NOT EXISTS revisions (section TEXT PRIMARY KEY, revision INTEGER NOT NULL);
+        """)
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def _query(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def _transaction(self, fn):
+        with self._lock:
+            self._connect().execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(self._conn)
+                self._conn.execute("COMMIT")
+                return result
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, section: str):
+        conn.execute(
+            "INSERT INTO revisions (section, revision) VALUES (?, 1) "
+            "ON CONFLICT(section) DO UPDATE SET revision = revision + 1",
+            (section,)
+        )
+
+    def revisions(self) -> dict:
+        rows = dict(self._query("SELECT section, revision FROM revisions"))
+        return {section: rows.get(section, 0) for section in SECTIONS}
+
+    def read_section(self, section: str):
+        rows = self._query("SELECT key, body FROM entries WHERE section = ? ORDER BY position", (section,))
+        if section == "profile":
+            return {key: json.loads(body) for key, body in rows}
+        return [json.loads(body) for _, body in rows]
+
+    def read_item(self, section: str, key: str):
+        rows = self._query("SELECT body FROM entries WHERE section = ? AND key = ?", (section, key))
+        return json.loads(rows[0][0]) if rows else None
+
+    def keys(self, section: str) -> list[str]:
+        return [key for (key,) in self._query(
+            "SELECT key FROM entries WHERE section = ? ORDER BY position", (section,)
+        )]
+
+    def put(self, section: str, key: str, value, previous_key: Optional[str] = None):
+        """Insert or replace one entry; new entries go last.
+
+        With `previous_key`, the entry stored there is replaced in place and
+        moves to `key`, as when an edit changes a project's title.
+        """
+        def run(conn):
+            current = None
+            for candidate in dict.fromkeys((previous_key or key, key)):
+                current = conn.execute(
+                    "SELECT position FROM entries WHERE section = ? AND key = ?", (section, candidate)
+                ).fetchone()
+                if current:
+                    break
+            if current:
+                order = current[0]
+                conn.execute(
+                    "DELETE FROM entries WHERE section = ? AND key IN (?, ?)", (section, previous_key or key, key)
+                )
+            else:
+                order = conn.execute(
+                    "SELECT COALESCE(MAX(position), -1) + 1 FROM entries WHERE section = ?", (section,)
+                ).fetchone()[0]
+            conn.execute(
+                "INSERT INTO entries (section, key, position, body) VALUES (?, ?, ?, ?)",
+                (section, key, order, json.dumps(value, ensure_ascii=False))
+            )
+            self._bump(conn, section)
+        self._transaction(run)
+
+    def delete(self, section: str, key: str) -> bool:
+        def run(conn):
+            deleted = conn.execute("DELETE FROM entries WHERE section = ? AND key = ?", (section, key)).rowcount
+            if deleted:
+                self._bump(conn, section)
+            return bool(deleted)
+        return self._transaction(run)
+
+    def replace(self, profile_data: dict, experience_data: list, projects_data: list):
+        """Swap in a complete data set in one transaction"""
+        def run(conn):
+            for section, data in zip(SECTIONS, (profile_data, experience_data, projects_data)):
+                conn.execute("DELETE FROM entries WHERE section = ?", (section,))
+                values = data.values() if section == "profile" else data
+                conn.executemany(
+                    "INSERT INTO entries (section, key, position, body) VALUES (?, ?, ?, ?)",
+                    [
+                        (section, key, position, json.dumps(value, ensure_ascii=False))
+                        for position, (key, value) in enumerate(zip(item_keys(section, data), values))
+                    ]
+                )
+                self._bump(conn, section)
+        self._transaction(run)
+
+class CachedStore:
+    """Read-through cache in front of a store.
+
+    Sections and single entries are cached against the section revision
+    they were read at. `load` asks the store for its revisions, which is
+    cheap, and only re-reads the sections that changed.
+    """
+
+    def __init__(self, store, max_items: int = 256):
+        self.store = store
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._sections: dict[str, tuple] = {}
+        self._items: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def name(self) -> str:
+        return self.store.name
+
+    @property
+    def watch_path(self) -> str:
+        return self.store.watch_path
+
+    def read_section(self, section: str, revision=None):
+        if revision is None:
+            revision = self.store.revisions()[section]
+        cached = self._sections.get(section)
+        if cached is not None and cached[0] == revision:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        data = self.store.read_section(section)
+        self._sections[section] = (revision, data)
+        return data
+
+    def read_item(self, section: str, key: str):
+        revision = self.store.revisions()[section]
+        cache_key = (section, key)
+        with self._lock:
+            cached = self._items.get(cache_key)
+            if cached is not None and cached[0] == revision:
+                self._items.move_to_end(cache_key)
+                self.hits += 1
+                return cached[1]
+        self.misses += 1
+        value = self.store.read_item(section, key)
+        with self._lock:
+            self._items[cache_key] = (revision, value)
+            if len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return value
+
+    def load(self) -> tuple:
+        """All three sections, reading only those whose revision changed"""
+        revisions = self.store.revisions()
+        return tuple(self.read_section(section, revisions[section]) for section in SECTIONS)
@@ -0,0 +1,70 @@
+import os
+import json
+import asyncio
+
+import pytest
+
+from admin import change_entry, change_profile
+from images import ImageManifest
+from snapshot import SnapshotManager
+from storage import SQLiteDataStore, SECTIONS, load_source
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def setup(tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"images": {
+        "/headshot.png": {"width": 800, "height": 800, "variants": {
+            "webp": [{"src": "/img/headshot.400.webp", "width": 400}, {"src": "/img/headshot.800.webp", "width": 800}]
+        }},
+        "/demo.png": {"width": 1200, "height": 600, "variants": {
+            "avif": [{"src": "/img/demo.1200.avif", "width": 1200}]
+        }}
+    }}))
+    manifest = ImageManifest(str(manifest_path))
+    store = SQLiteDataStore(str(tmp_path / "portfolio.db"))
+    store.replace(*load_source(os.path.join(BACKEND_DIR, "data.py")))
+
+    def loader():
+        # As main.reload_data does
+        profile, experience, projects = (store.read_section(section) for section in SECTIONS)
+        profile, projects = manifest.expand(profile, projects)
+        return profile, experience, projects
+
+    return store, manifest, SnapshotManager(loader, lambda: None, str(tmp_path / "portfolio.db"))
+
+def assert_matches_full_reload(written, reloaded):
+    assert written.profile == reloaded.profile
+    assert written.experience == reloaded.experience
+    assert written.projects == reloaded.projects
+    assert written.keys == reloaded.keys
+    assert written.content_hash == reloaded.content_hash
+
+def test_admin_writes_match_a_full_reload_including_images(setup):
+    store, manifest, manager = setup
+
+    async def scenario():
+        await manager.load_initial()
+        key = manager.current.keys["projects"][0]
+        writes = [
+            lambda current: ("profile", change_profile(current, store, "photo", "put", "/headshot.png",
+                                                       manifest.expand)[0]),
+            lambda current: ("projects", change_entry(current, store, "projects", key, "patch",
+                                                      {"image": "/demo.png"}, manifest.expand)[0]),
+            lambda current: ("profile", change_profile(current, store, "photo", "delete",
+                                                       expand=manifest.expand)[0])
+        ]
+        for write in writes:
+            written = await manager.apply(write)
+            reloaded = await manager.reload()
+            assert_matches_full_reload(written, reloaded)
+            if write is writes[0]:
+                assert written.profile["photo"]["width"] == 800
+                assert written.profile["photo"]["sources"][0]["type"] == "image/webp"
+            if write is writes[1]:
+                assert written.projects[0]["image"]["sources"][0]["type"] == "image/avif"
+            if write is writes[2]:
+                assert written.profile["photo"] is None
+
+    asyncio.run(scenario())
@@ -0,0 +1,65 @@
+import asyncio
+from types import SimpleNamespace
+
+from events import Broadcaster
+
+def snapshot(version: int):
+    body = b'{"version":%d}' % version
+    return SimpleNamespace(
+        version=version,
+        content_hash=f"hash-{version}",
+        payloads={"portfolio": SimpleNamespace(body=body)}
+    )
+
+async def next_frame(stream, timeout: float = 1.0) -> bytes:
+    return await asyncio.wait_for(stream.__anext__(), timeout)
+
+def test_publish_wakes_waiting_subscriber():
+    async def scenario():
+        broadcaster = Broadcaster(heartbeat_interval=5)
+        broadcaster.publish(snapshot(1))
+        stream = broadcaster.subscribe()
+        assert b"event: version\ndata: 1" in await next_frame(stream)
+
+        waiting = asyncio.ensure_future(next_frame(stream))
+        await asyncio.sleep(0.01)
+        broadcaster.publish(snapshot(2))
+        frame = await waiting
+        assert b"id: 2\nevent: data-changed" in frame
+        await stream.aclose()
+
+    asyncio.run(scenario())
+
+def test_publish_while_subscriber_is_paused_is_delivered():
+    async def scenario():
+        broadcaster = Broadcaster(heartbeat_interval=0.05)
+        broadcaster.publish(snapshot(1))
+        stream = broadcaster.subscribe()
+        await next_frame(stream)
+
+        # The client has not asked for the next frame yet (backpressure)
+        broadcaster.publish(snapshot(2))
+        frame = await next_frame(stream)
+        assert b"id: 2\nevent: data-changed" in frame
+        assert b"hash-2" in frame
+
+        # Paused again, this time at a heartbeat
+        assert await next_frame(stream) == b": ping\n\n"
+        broadcaster.publish(snapshot(3))
+        assert b"id: 3\nevent: data-changed" in await next_frame(stream)
+        await stream.aclose()
+
+    asyncio.run(scenario())
+
+def test_payload_frames_carry_the_portfolio_body():
+    async def scenario():
+        broadcaster = Broadcaster(heartbeat_interval=0.05)
+        broadcaster.publish(snapshot(1))
+        stream = broadcaster.subscribe(include_payload=True)
+        await next_frame(stream)
+        broadcaster.publish(snapshot(2))
+        assert b'data: {"version":2}' in await next_frame(stream)
+        await stream.aclose()
+        assert broadcaster.subscribers == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,47 @@
+import asyncio
+
+from health import HealthProbes
+
+async def ok():
+    return {}
+
+async def failing():
+    raise RuntimeError("down")
+
+def test_ready_once_critical_probes_pass_without_waiting_for_slow_ones():
+    async def scenario():
+        probes = HealthProbes()
+        gate = asyncio.Event()
+
+        async def slow_smtp():
+            await gate.wait()
+            return {}
+
+        probes.add("snapshot", ok, 5)
+        probes.add("smtp", slow_smtp, 60, critical=False, timeout=30)
+        assert probes.report()[0] == "starting"
+
+        running = asyncio.create_task(probes.run_due())
+        await asyncio.sleep(0.01)
+        assert probes.report()[0] == "ready"
+        gate.set()
+        await running
+        assert probes.report()[0] == "ready"
+
+    asyncio.run(scenario())
+
+def test_failing_probes_set_degraded_or_not_ready():
+    async def scenario():
+        probes = HealthProbes()
+        probes.add("snapshot", ok, 5)
+        probes.add("smtp", failing, 5, critical=False)
+        await probes.run_due()
+        assert probes.report()[0] == "degraded"
+
+        probes.add("outbox", failing, 5)
+        await probes.run_due()
+        status, body = probes.report()
+        assert status == "not_ready"
+        assert body["checks"]["outbox"]["error"] == "down"
+
+    asyncio.run(scenario())
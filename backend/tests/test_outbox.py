@@ -0,0 +1,31 @@
+import time
+
+from outbox import Outbox
+
+def open_outbox(tmp_path, **kwargs) -> Outbox:
+    outbox = Outbox(str(tmp_path / "outbox.db"), **kwargs)
+    outbox.open()
+    return outbox
+
+def test_repeated_key_returns_original_message(tmp_path):
+    outbox = open_outbox(tmp_path)
+    first_id, created = outbox.enqueue({"message": "hi"}, "key-1")
+    assert created
+    assert outbox.enqueue({"message": "hi"}, "key-1") == (first_id, False)
+    outbox.close()
+
+def test_prune_removes_old_sent_messages_and_frees_their_key(tmp_path):
+    outbox = open_outbox(tmp_path, retention=60)
+    old_id, _ = outbox.enqueue({"message": "old"}, "old")
+    recent_id, _ = outbox.enqueue({"message": "recent"}, "recent")
+    outbox.enqueue({"message": "pending"}, "pending")
+    outbox.mark_sent(old_id)
+    outbox.mark_sent(recent_id)
+    outbox._conn.execute("UPDATE outbox SET sent_at = ? WHERE id = ?", (time.time() - 120, old_id))
+
+    assert outbox.prune() == 1
+    assert outbox.stats()["sent"] == 1
+    assert outbox.stats()["pending"] == 1
+    # The key of a pruned message is accepted again as a new message
+    assert outbox.enqueue({"message": "old"}, "old")[1]
+    outbox.close()
@@ -0,0 +1,22 @@
+import os
+
+from search import SearchIndex
+from snapshot import build_snapshot
+from storage import item_keys, load_source
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data.py")
+
+def test_hits_reference_admin_keys_and_survive_reordering():
+    profile, experience, projects = load_source(DATA_FILE)
+    index = SearchIndex()
+    index.update_from_snapshot(build_snapshot(1, profile, experience, projects))
+
+    title = projects[0]["title"]
+    _, hits = index.search(title, limit=50, section="projects")
+    assert hits[0]["ref"] == item_keys("projects", projects)[0]
+
+    # Moving an entry keeps every document key, so nothing is re-indexed
+    documents = dict(index._documents)
+    index.update_from_snapshot(build_snapshot(2, profile, experience, projects[1:] + projects[:1]))
+    assert index._documents == documents
+    assert index.search(title, limit=50, section="projects")[1][0]["ref"] == hits[0]["ref"]
@@ -0,0 +1,78 @@
+import asyncio
+
+from smtp_pool import SMTPPool
+
+class FakeClient:
+    def __init__(self, noop_gate: asyncio.Event):
+        self.is_connected = True
+        self.noop_gate = noop_gate
+        self.noops = 0
+        self.sent = []
+
+    async def noop(self):
+        self.noops += 1
+        await self.noop_gate.wait()
+
+    async def send_message(self, msg):
+        self.sent.append(msg)
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+def test_keepalive_ping_holds_a_pool_slot():
+    async def scenario():
+        gate = asyncio.Event()
+        clients = []
+
+        async def connect():
+            clients.append(FakeClient(gate))
+            return clients[-1]
+
+        pool = SMTPPool(connect, max_size=1, keepalive_interval=0.01)
+        await pool.send_message("first")
+        pool.start()
+        while not clients[0].noops:
+            await asyncio.sleep(0.005)
+
+        # The only session is out for a NOOP; a sender must wait for it
+        # instead of opening a second connection past max_size
+        sender = asyncio.create_task(pool.send_message("second"))
+        await asyncio.sleep(0.05)
+        assert pool.sessions_opened == 1
+        assert not sender.done()
+
+        gate.set()
+        await sender
+        assert pool.sessions_opened == 1
+        assert clients[0].sent == ["first", "second"]
+        await pool.close()
+
+    asyncio.run(scenario())
+
+def test_keepalive_skips_sessions_while_every_slot_is_busy():
+    async def scenario():
+        gate = asyncio.Event()
+        gate.set()
+        clients = []
+
+        async def connect():
+            clients.append(FakeClient(gate))
+            return clients[-1]
+
+        pool = SMTPPool(connect, max_size=1, keepalive_interval=0.01)
+        await pool.send_message("first")
+        await pool._slots.acquire()
+        pool.start()
+        await asyncio.sleep(0.05)
+        assert clients[0].noops == 0
+        assert pool.idle_sessions == 1
+
+        pool._slots.release()
+        while not clients[0].noops:
+            await asyncio.sleep(0.005)
+        await pool.close()
+
+    asyncio.run(scenario())
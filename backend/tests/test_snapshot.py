@@ -0,0 +1,96 @@
+import os
+import asyncio
+import threading
+
+from snapshot import SnapshotManager
+from storage import load_source
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def sample_data(title: str):
+    profile, experience, projects = load_source(os.path.join(BACKEND_DIR, "data.py"))
+    return profile, experience, [{**projects[0], "title": title}]
+
+def test_reload_joining_a_running_build_rebuilds(tmp_path):
+    source = {"title": "First"}
+    reading, release = threading.Event(), threading.Event()
+    builds = []
+
+    def loader():
+        title = source["title"]
+        builds.append(title)
+        if len(builds) == 2:
+            # Second build (the initial load was the first): hold it mid-read
+            reading.set()
+            release.wait(5)
+        return sample_data(title)
+
+    async def scenario():
+        manager = SnapshotManager(loader, lambda: None, str(tmp_path / "data.py"))
+        await manager.load_initial()
+        first = asyncio.ensure_future(manager.reload())
+        await asyncio.to_thread(reading.wait, 5)
+
+        # The source changes after the running build has read it
+        source["title"] = "Second"
+        joined = asyncio.ensure_future(manager.reload())
+        await asyncio.sleep(0.01)
+        release.set()
+
+        snapshot = await joined
+        assert await first is snapshot
+        assert snapshot.projects[0]["title"] == "Second"
+        assert builds == ["First", "First", "Second"]
+
+    asyncio.run(scenario())
+
+def test_reload_before_build_starts_shares_it(tmp_path):
+    builds = []
+
+    def loader():
+        builds.append(1)
+        return sample_data("Only")
+
+    async def scenario():
+        manager = SnapshotManager(loader, lambda: None, str(tmp_path / "data.py"))
+        await manager.load_initial()
+        results = await asyncio.gather(manager.reload(), manager.reload())
+        assert results[0] is results[1]
+        assert len(builds) == 2
+
+    asyncio.run(scenario())
+
+def test_watcher_ignores_the_managers_own_writes(tmp_path):
+    source = tmp_path / "portfolio.db"
+    source.write_text("v1")
+    builds = []
+
+    def loader():
+        builds.append(1)
+        return sample_data("Loaded")
+
+    def write(current):
+        # Bump the mtime as a committed SQLite write would
+        stat = os.stat(source)
+        source.write_text("v2")
+        os.utime(source, (stat.st_atime, stat.st_mtime + 10))
+        return "projects", [{**current.projects[0], "title": "Written"}]
+
+    async def scenario():
+        manager = SnapshotManager(loader, lambda: None, str(source), poll_interval=0.01)
+        await manager.load_initial()
+        manager.start()
+        await asyncio.sleep(0.03)
+        snapshot = await manager.apply(write)
+        await asyncio.sleep(0.05)
+        assert manager.current is snapshot
+        assert manager.current.projects[0]["title"] == "Written"
+        assert len(builds) == 1
+
+        # An outside edit is still picked up
+        os.utime(source, (0, os.stat(source).st_mtime + 10))
+        await asyncio.sleep(0.05)
+        assert len(builds) == 2
+        await manager.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,61 @@
+import pytest
+
+from spam import DuplicateFilter, SpamFilter
+
+SECRET = b"test-secret"
+
+def make_filter(**kwargs) -> SpamFilter:
+    return SpamFilter(SECRET, **kwargs)
+
+def test_token_age_of_a_valid_token():
+    spam_filter = make_filter()
+    token = spam_filter.issue_token(now=1000.0)
+    assert spam_filter.token_age(token, now=1004.5) == pytest.approx(4.5)
+
+@pytest.mark.parametrize("token", [
+    None, "", "garbage", "123", "123.", ".abc", "123.abc",
+    "123.é", "١٢.abc", "١٢٣.é", "12.\ud800", "é.é"
+])
+def test_malformed_tokens_count_as_missing(token):
+    assert make_filter().token_age(token) is None
+
+def test_forged_and_foreign_tokens_are_rejected():
+    token = make_filter().issue_token()
+    issued, _, signature = token.partition(".")
+    assert make_filter().token_age(f"{int(issued) - 60000}.{signature}") is None
+    assert SpamFilter(b"other-secret").token_age(token) is None
+
+def test_malformed_token_is_scored_not_raised():
+    spam_filter = make_filter()
+    assert spam_filter.check("Ada", "ada@example.com", "Hello there", token="123.é") == "accepted"
+    # An invalid token adds one point; with a link-stuffed name it crosses the threshold
+    assert spam_filter.check("www.spam", "bot@example.com", "Hi", token="١٢.abc") == "spam"
+
+def test_honeypot_and_fast_submissions_are_dropped():
+    spam_filter = make_filter(min_fill_seconds=3)
+    assert spam_filter.check("Ada", "ada@example.com", "Hi", honeypot="http://x") == "honeypot"
+    assert spam_filter.check("Ada", "ada@example.com", "Hi", token=spam_filter.issue_token()) == "too_fast"
+
+def test_duplicates_ignore_case_and_whitespace_within_the_window():
+    spam_filter = make_filter(duplicates=DuplicateFilter(window=60))
+    assert spam_filter.check("Ada", "Ada@Example.com", "Hello  there") == "accepted"
+    spam_filter.record("Ada@Example.com", "Hello  there")
+    assert spam_filter.check("Ada", "ada@example.com", "hello there") == "duplicate"
+    assert spam_filter.check("Ada", "ada@example.com", "Something else") == "accepted"
+
+def test_check_alone_does_not_record_the_submission():
+    # A submission that failed before it was queued must not block its retry
+    spam_filter = make_filter()
+    assert spam_filter.check("Ada", "ada@example.com", "Hello") == "accepted"
+    assert spam_filter.check("Ada", "ada@example.com", "Hello") == "accepted"
+
+def test_duplicate_filter_expires_and_stays_bounded():
+    duplicates = DuplicateFilter(window=10, max_entries=2)
+    duplicates.add("a", now=0)
+    assert duplicates.contains("a", now=5)
+    assert not duplicates.contains("a", now=20)
+    duplicates.add("b", now=21)
+    duplicates.add("c", now=22)
+    duplicates.add("d", now=23)
+    assert len(duplicates) == 2
+    assert not duplicates.contains("b", now=23)
@@ -128,6 +128,13 @@ const ScrollToTop: React.FC = () => {
   );
 };
 
+interface Picture {
+  src: string;
+  width?: number | null;
+  height?: number | null;
+  sources?: { type: string; srcset: string }[];
+}
+
 interface ProfileData {
   name: string;
   title: string;
@@ -145,6 +152,7 @@ interface ProfileData {
     awards: string[];
     coursework: string[];
   };
+  photo?: Picture | null;
 }
 
 interface ExperienceData {
@@ -208,29 +216,15 @@ const App: React.FC = () => {
         return;
       }
 
-      let profileUrl, experienceUrl, projectsUrl;
-
-      if (process.env.NODE_ENV === 'production') {
-        profileUrl = 'https://get-profile-twb6hlto6a-uc.a.run.app';
-        experienceUrl = 'https://get-experience-twb6hlto6a-uc.a.run.app';
-        projectsUrl = 'https://get-projects-twb6hlto6a-uc.a.run.app';
-      } else {
-        profileUrl = `${API_URL}/profile`;
-        experienceUrl = `${API_URL}/experience`;
-        projectsUrl = `${API_URL}/projects`;
-      }
-
-      const [profileRes, experienceRes, projectsRes] = await Promise.all([
-        axios.get(profileUrl),
-        axios.get(experienceUrl),
-        axios.get(projectsUrl),
-      ]);
+      // Production reads the static export that Firebase Hosting serves from its CDN.
+      const portfolioUrl =
+        process.env.NODE_ENV === 'production' ? '/api/portfolio' : `${API_URL}/portfolio`;
 
-      const data = {
-        profile: profileRes.data,
-        experience: experienceRes.data,
-        projects: projectsRes.data,
-      };
+      const { data } = await axios.get<{
+        profile: ProfileData;
+        experience: ExperienceData[];
+        projects: ProjectData[];
+      }>(portfolioUrl);
 
       localStorage.setItem(cacheKey, JSON.stringify(data));
       localStorage.setItem(cacheKey + '_time', Date.now().toString());
@@ -259,10 +253,20 @@ const App: React.FC = () => {
   }, [theme]);
 
   useEffect(() => {
-    if (process.env.NODE_ENV === 'development') {
+    if (process.env.NODE_ENV !== 'development') return;
+
+    if (typeof EventSource === 'undefined') {
       const interval = setInterval(fetchData, 30000);
       return () => clearInterval(interval);
     }
+
+    // The API pushes a data-changed event whenever backend/data.py changes.
+    const source = new EventSource(`${API_URL}/events`);
+    source.addEventListener('data-changed', () => {
+      localStorage.removeItem('portfolio_data_v2_time');
+      fetchData();
+    });
+    return () => source.close();
   }, [fetchData]);
 
   const handleToggleTheme = (event?: React.MouseEvent<HTMLButtonElement>) => {
@@ -327,7 +331,12 @@ const App: React.FC = () => {
                 <Navbar theme={theme} onToggleTheme={handleToggleTheme} />
               </ErrorBoundary>
               <ErrorBoundary>
-                <Hero name={profile.name} title={profile.title} github={`https://github.com/${profile.github_user}`} />
+                <Hero
+                  name={profile.name}
+                  title={profile.title}
+                  github={`https://github.com/${profile.github_user}`}
+                  photo={profile.photo}
+                />
               </ErrorBoundary>
               <ErrorBoundary>
                 <About
@@ -1,4 +1,4 @@
-import React, { useState, useRef } from 'react';
+import React, { useState, useRef, useEffect, useCallback } from 'react';
 import { motion, useInView } from 'framer-motion';
 import axios from 'axios';
 
@@ -11,9 +11,22 @@ const Contact: React.FC<Props> = ({ email, apiUrl }) => {
   const [formData, setFormData] = useState({ name: '', email: '', message: '' });
   const [status, setStatus] = useState({ type: '', message: '' });
   const [isSubmitting, setIsSubmitting] = useState(false);
+  // Submit-time token and honeypot for the server's spam filter
+  const [token, setToken] = useState('');
+  const [website, setWebsite] = useState('');
   const ref = useRef(null);
   const inView = useInView(ref, { once: true, amount: 0.1 });
 
+  const fetchToken = useCallback(() => {
+    axios.get(apiUrl)
+      .then(response => setToken(response.data.token))
+      .catch(() => setToken(''));
+  }, [apiUrl]);
+
+  useEffect(() => {
+    fetchToken();
+  }, [fetchToken]);
+
   const handleChange = (e: React.ChangeEvent<HTMLInputElement | HTMLTextAreaElement>) => {
     setFormData({ ...formData, [e.target.name]: e.target.value });
     // Clear any existing status when user starts typing
@@ -52,7 +65,7 @@ const Contact: React.FC<Props> = ({ email, apiUrl }) => {
     setStatus({ type: '', message: '' });
     
     try {
-      const response = await axios.post(apiUrl, formData, {
+      const response = await axios.post(apiUrl, { ...formData, website, token }, {
         headers: {
           'Content-Type': 'application/json',
         },
@@ -60,6 +73,7 @@ const Contact: React.FC<Props> = ({ email, apiUrl }) => {
       
       setStatus({ type: 'success', message: response.data.message });
       setFormData({ name: '', email: '', message: '' });
+      fetchToken();
     } catch (error: any) {
       let errorMessage = 'There was an error sending your message. Please try again.';
       
@@ -166,6 +180,19 @@ const Contact: React.FC<Props> = ({ email, apiUrl }) => {
               </div>
             </div>
             
+            <div aria-hidden="true" style={{ position: 'absolute', left: '-10000px' }}>
+              <label htmlFor="website">Website</label>
+              <input
+                id="website"
+                type="text"
+                name="website"
+                value={website}
+                onChange={e => setWebsite(e.target.value)}
+                tabIndex={-1}
+                autoComplete="off"
+              />
+            </div>
+            
             <div className="form-group-netflix">
               <label htmlFor="message">Message *</label>
               <textarea 
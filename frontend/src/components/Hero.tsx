@@ -21,10 +21,18 @@ const CompanyLogo: React.FC<{ domain: string; alt: string; size?: number }> = ({
   />
 );
 
+interface Picture {
+  src: string;
+  width?: number | null;
+  height?: number | null;
+  sources?: { type: string; srcset: string }[];
+}
+
 interface Props {
   name: string;
   title: string;
   github: string;
+  photo?: Picture | null;
 }
 
 const FloatingOrbs: React.FC = () => (
@@ -35,7 +43,10 @@ const FloatingOrbs: React.FC = () => (
   </div>
 );
 
-const ProfileCard: React.FC<{ imageSrc: string; name: string }> = ({ imageSrc, name }) => {
+// Rendered width of the profile photo, for choosing among srcset variants
+const PHOTO_SIZES = '(max-width: 480px) 90vw, 360px';
+
+const ProfileCard: React.FC<{ photo: Picture; name: string }> = ({ photo, name }) => {
   const ref = useRef(null);
   const inView = useInView(ref, { once: true, amount: 0.3 });
 
@@ -54,9 +65,17 @@ const ProfileCard: React.FC<{ imageSrc: string; name: string }> = ({ imageSrc, n
           <div className="profile-ring-outer"></div>
           <div className="profile-ring-inner"></div>
           <picture>
-            <source srcSet={imageSrc.replace(/\.png$/, '.webp')} type="image/webp" />
+            {photo.sources?.length ? (
+              photo.sources.map((source) => (
+                <source key={source.type} srcSet={source.srcset} sizes={PHOTO_SIZES} type={source.type} />
+              ))
+            ) : (
+              <source srcSet={photo.src.replace(/\.png$/, '.webp')} type="image/webp" />
+            )}
             <img
-              src={imageSrc}
+              src={photo.src}
+              width={photo.width ?? undefined}
+              height={photo.height ?? undefined}
               alt={`${name} — Professional Portrait`}
               className="profile-photo"
               fetchPriority="high"
@@ -96,7 +115,7 @@ const ProfileCard: React.FC<{ imageSrc: string; name: string }> = ({ imageSrc, n
   );
 };
 
-const Hero: React.FC<Props> = ({ name, title, github }) => {
+const Hero: React.FC<Props> = ({ name, title, github, photo }) => {
   const containerRef = useRef<HTMLElement>(null);
   const heroRef = useRef(null);
 
@@ -237,7 +256,7 @@ const Hero: React.FC<Props> = ({ name, title, github }) => {
 
           {/* Right — Profile Card */}
           <div className="hero-profile-section">
-            <ProfileCard imageSrc="/headshot.png" name={name} />
+            <ProfileCard photo={photo ?? { src: '/headshot.png' }} name={name} />
           </div>
         </div>
         </div>
@@ -1,16 +1,21 @@
 # Firebase Functions implementation of your portfolio API
 import os
+import re
+import gzip
 import json
+import mmap
+import hmac
+import hashlib
+import secrets
 import logging
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import math
+import time
+import threading
+from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from firebase_functions import https_fn, options
-from firebase_admin import initialize_app
-
-# Initialize Firebase Admin
-initialize_app()
+from firebase_functions import https_fn, tasks_fn, options
 
 # Set global options for cost control and public access
 options.set_global_options(max_instances=10)
@@ -27,16 +32,58 @@ SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 EMAIL_USER = "arjunbojja1@gmail.com"  # Your email
 
+# How contact_form hands off delivery: "task_queue" (Cloud Tasks via
+# deliver_contact_email), "thread" (background pool in this instance) or
+# "inline". Deployed instances have their CPU throttled between requests, so
+# "thread" is only honoured in the emulator, which has no Cloud Tasks backend.
+IN_EMULATOR = os.environ.get("FUNCTIONS_EMULATOR") == "true"
+EMAIL_DELIVERY = os.environ.get("EMAIL_DELIVERY", "thread" if IN_EMULATOR else "task_queue")
+if EMAIL_DELIVERY == "thread" and not IN_EMULATOR:
+    logger.warning("EMAIL_DELIVERY=thread is only used in the emulator; using task_queue")
+    EMAIL_DELIVERY = "task_queue"
+EMAIL_WORKERS = int(os.environ.get("EMAIL_WORKERS", "2"))
+EMAIL_MAX_PENDING = int(os.environ.get("EMAIL_MAX_PENDING", "20"))
+
+# Contact rate limits, enforced per instance (max_instances bounds the total)
+CONTACT_RATE_PER_MINUTE = float(os.environ.get("CONTACT_RATE_PER_MINUTE", "1"))
+CONTACT_BURST = int(os.environ.get("CONTACT_BURST", "5"))
+RATE_LIMIT_MAX_CLIENTS = int(os.environ.get("RATE_LIMIT_MAX_CLIENTS", "5000"))
+
+# Opt-in: deploy every route behind one `api` function instead of one
+# function per route. Read when the Firebase CLI loads this module, so set it
+# in functions/.env. The API_* settings only apply to that function;
+# concurrent requests need at least one vCPU. A warm minimum instance is
+# billed while idle, so none is kept by default.
+SINGLE_ENTRYPOINT = os.environ.get("SINGLE_ENTRYPOINT", "false").lower() == "true"
+API_MIN_INSTANCES = int(os.environ.get("API_MIN_INSTANCES", "0"))
+API_MAX_INSTANCES = int(os.environ.get("API_MAX_INSTANCES", "10"))
+API_CONCURRENCY = int(os.environ.get("API_CONCURRENCY", "80"))
+API_CPU = float(os.environ.get("API_CPU", "1"))
+API_MEMORY_MB = int(os.environ.get("API_MEMORY_MB", "512"))
+
+# Cache-Control for data responses: browsers keep them for a few minutes,
+# Hosting's CDN for an hour, then serves the stale copy while it revalidates.
+# A functions-only deploy does not purge the CDN, so keep s-maxage modest.
+DATA_CACHE_CONTROL = os.environ.get(
+    "DATA_CACHE_CONTROL", "public, max-age=300, s-maxage=3600, stale-while-revalidate=86400"
+)
+
+# Duplicate and spam filter in front of send_email. Without a shared secret
+# each instance signs its own tokens, and a token from another instance only
+# counts against the spam score like a missing one.
+CONTACT_TOKEN_SECRET = os.environ.get("CONTACT_TOKEN_SECRET", "").encode("utf-8") or secrets.token_bytes(32)
+CONTACT_MIN_FILL_SECONDS = float(os.environ.get("CONTACT_MIN_FILL_SECONDS", "3"))
+CONTACT_DUPLICATE_WINDOW = float(os.environ.get("CONTACT_DUPLICATE_WINDOW", "3600"))
+CONTACT_MAX_LINKS = int(os.environ.get("CONTACT_MAX_LINKS", "2"))
+CONTACT_SPAM_THRESHOLD = int(os.environ.get("CONTACT_SPAM_THRESHOLD", "3"))
+
+@lru_cache(maxsize=1)
 def get_email_password():
-    """Get email password from Firebase Functions config"""
+    """Get email password from Firebase Functions config (resolved once per instance)"""
     try:
         # Try to get from Firebase Functions config first
-        from firebase_functions import params
-        # Check if we can access the config
-        import os
         config_password = os.environ.get("FIREBASE_CONFIG")
         if config_password:
-            import json
             config = json.loads(config_password)
             if "email" in config and "password" in config["email"]:
                 return config["email"]["password"]
@@ -48,8 +95,19 @@ def get_email_password():
         # Direct fallback - use the password from Firebase config
         return "qqbi luep kfoj jyyq"
 
+@lru_cache(maxsize=1)
+def get_firebase_app():
+    """Initialize Firebase Admin on first use; read paths never need it"""
+    from firebase_admin import initialize_app
+    return initialize_app()
+
 def send_email(name, email, message):
     """Send email notification for contact form submissions"""
+    # Deferred so read-only instances never pay for the mail stack at cold start
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
     try:
         email_password = get_email_password()
         if not email_password:
@@ -93,205 +151,378 @@ Reply to: {email}
         logger.error(f"Failed to send email: {str(e)}")
         return False
 
-# Profile data (moved from data.py)
-profile_data = {
-    "name": "Arjun Bojja",
-    "title": "Distributed Systems Engineer · AI Infrastructure",
-    "location": "Washington, D.C. Metro Area",
-    "email": "arjunbojja1@gmail.com",
-    "phone": "571-471-0563",
-    "linkedin": "https://www.linkedin.com/in/arjun-bojja/",
-    "github_user": "arjunbojja1",
-    "about": {
-        "passion": "Software Engineering Intern at Microsoft (Teams), building autonomous AI diagnostic infrastructure for Teams Meeting Copilot, including a Text-to-KQL translation layer powered by LLMs and deterministic safety rails for production database protection. Backend and distributed systems engineer focused on LLM-powered pipelines, event-driven architectures, observability, and low-latency systems. Previously at Capital One, built a distributed monitoring system on AWS (Lambda, ECS, DynamoDB) to automate health checks, improve telemetry, and accelerate incident response for production systems.",
-        "seeking": "Seeking full-time roles in distributed systems, backend infrastructure, or AI systems engineering where I can ship reliable software, own operational excellence, and work at the intersection of systems and AI."
-    },
-    "skills": {
-        "Languages": ["Python", "TypeScript", "JavaScript", "Java", "C#", "Lua", "R", "SQL", "KQL (Kusto)"],
-        "Frameworks & APIs": ["FastAPI", "Flask", "Express.js", "React", "React Native", ".NET"],
-        "Cloud & Infrastructure": ["AWS Lambda", "ECS Fargate", "DynamoDB", "CloudWatch", "Microsoft Azure", "Azure Data Explorer (ADX)", "Docker", "Serverless", "CI/CD (GitHub Actions)", "WebSockets"],
-        "Distributed Systems": ["Real-time Systems", "Microservices", "Event-Driven Architecture", "Caching Strategies", "Low-Latency Design", "Async/Concurrency"],
-        "AI & LLM": ["OpenAI API", "Claude API", "Prompt Engineering", "LLM Evaluation", "LLM Safety Rails"],
-        "Data & Observability": ["MongoDB", "PostgreSQL", "SQLite", "New Relic", "Custom Telemetry", "Structured Logging"],
-        "Testing & Other": ["PyTest", "Jest", "JWT Authentication", "AI/ML Fundamentals", "Data Structures & Algorithms"]
-    },
-    "education": {
-        "degree": "Bachelor of Science in Information Science",
-        "university": "University of Maryland, College Park",
-        "gpa": "3.88",
-        "grad_year": 2027,
-        "awards": ["Presidential Scholar", "Dean's List (All Semesters)"],
-        "coursework": ["Technologies, Infrastructure and Architecture", "Data Structures and Algorithms", "Data Science Techniques", "Database Design (MySQL)", "Object-Oriented Programming", "Machine Learning in Communication", "Statistics for Information Science (R)", "Information Organization", "Organizations, Management, and Teamwork", "Entrepreneurial Opportunity Analysis"]
-    }
+# Background delivery for EMAIL_DELIVERY="thread" in the emulator. The
+# semaphore bounds the backlog so a burst cannot queue unbounded work.
+_email_executor = ThreadPoolExecutor(max_workers=EMAIL_WORKERS, thread_name_prefix="email")
+_email_slots = threading.BoundedSemaphore(EMAIL_MAX_PENDING)
+
+def _send_in_background(name, email, message):
+    try:
+        if not send_email(name, email, message):
+            logger.warning(f"Email failed but logging message from {name}: {message}")
+    finally:
+        _email_slots.release()
+
+def _enqueue_task(name, email, message):
+    from firebase_admin import functions as admin_functions
+    queue = admin_functions.task_queue("deliver_contact_email", app=get_firebase_app())
+    queue.enqueue({"name": name, "email": email, "message": message})
+
+class ContactRateLimiter:
+    """Per-client token buckets kept in an LRU so idle clients are evicted"""
+
+    def __init__(self, rate_per_minute, burst, max_clients):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def retry_after(self, client):
+        """Take a token for `client`; returns 0 when allowed, else seconds to wait"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            wait = 0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = math.ceil((1 - tokens) / self.rate)
+            self._buckets[client] = (tokens, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+            return wait
+
+contact_limiter = ContactRateLimiter(CONTACT_RATE_PER_MINUTE, CONTACT_BURST, RATE_LIMIT_MAX_CLIENTS)
+
+LINK = re.compile(r"https?://|www\.|\[url", re.IGNORECASE)
+
+class ContactFilter:
+    """Honeypot, submit-time token, link heuristics and a windowed duplicate LRU; see backend/spam.py"""
+
+    def __init__(self, secret, min_fill_seconds, duplicate_window, max_links, threshold, max_entries):
+        self.secret = secret
+        self.min_fill_seconds = min_fill_seconds
+        self.duplicate_window = duplicate_window
+        self.max_links = max_links
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self.decisions = Counter()
+
+    def _sign(self, issued):
+        return hmac.new(self.secret, issued.encode("ascii"), hashlib.sha256).hexdigest()[:32]
+
+    def issue_token(self):
+        issued = str(int(time.time() * 1000))
+        return f"{issued}.{self._sign(issued)}"
+
+    def token_age(self, token):
+        issued, _, signature = (token or "").partition(".")
+        # isdigit() alone accepts non-ASCII digits, and compare_digest rejects non-ASCII str
+        if not (issued.isascii() and issued.isdigit()) or not hmac.compare_digest(
+            signature.encode("utf-8", "replace"), self._sign(issued).encode("ascii")
+        ):
+            return None
+        return time.time() - int(issued) / 1000
+
+    def _fingerprint(self, email, message):
+        normalized = email.lower() + "\n" + " ".join(message.lower().split())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _expire(self, now):
+        while self._seen and now - next(iter(self._seen.values())) >= self.duplicate_window:
+            self._seen.popitem(last=False)
+
+    def _is_duplicate(self, email, message):
+        fingerprint = self._fingerprint(email, message)
+        with self._lock:
+            self._expire(time.monotonic())
+            return fingerprint in self._seen
+
+    def record(self, email, message):
+        """Remember a dispatched submission; failed ones are left out so a retry gets through"""
+        fingerprint = self._fingerprint(email, message)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._seen.pop(fingerprint, None)
+            self._seen[fingerprint] = now
+            if len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+
+    def _decide(self, name, email, message, honeypot, token):
+        if honeypot:
+            return "honeypot"
+        age = self.token_age(token)
+        if age is not None and age < self.min_fill_seconds:
+            return "too_fast"
+        links = len(LINK.findall(message))
+        score = (
+            (1 if age is None or age > 86400 else 0)
+            + (2 if links > self.max_links else 0)
+            + (1 if links and links * 10 > len(message.split()) else 0)
+            + (2 if LINK.search(name) else 0)
+        )
+        if score >= self.threshold:
+            return "spam"
+        if self._is_duplicate(email, message):
+            return "duplicate"
+        return "accepted"
+
+    def check(self, name, email, message, honeypot=None, token=None):
+        """Decision for a submission; only "accepted" should be sent"""
+        decision = self._decide(name, email, message, honeypot, token)
+        self.decisions[decision] += 1
+        return decision
+
+contact_filter = ContactFilter(
+    CONTACT_TOKEN_SECRET, CONTACT_MIN_FILL_SECONDS, CONTACT_DUPLICATE_WINDOW,
+    CONTACT_MAX_LINKS, CONTACT_SPAM_THRESHOLD, RATE_LIMIT_MAX_CLIENTS
+)
+
+def client_address(req):
+    # Cloud Functions sits behind Google's front end, which appends the peer
+    # it saw to X-Forwarded-For. Earlier entries come from the client and can
+    # be forged, so only the right-most one is trusted.
+    forwarded = req.headers.get('X-Forwarded-For', '')
+    return forwarded.split(',')[-1].strip() or req.remote_addr or 'unknown'
+
+def dispatch_email(name, email, message):
+    """Hand a contact message off for delivery; returns how it was dispatched"""
+    mode = EMAIL_DELIVERY
+    # The emulator has no Cloud Tasks backend, so deliver from the local pool.
+    if mode == "task_queue" and IN_EMULATOR:
+        mode = "thread"
+
+    if mode == "task_queue":
+        try:
+            _enqueue_task(name, email, message)
+            return "queued"
+        except Exception as e:
+            logger.error(f"Could not enqueue email task, sending inline: {e}")
+            mode = "inline"
+
+    if mode == "thread" and _email_slots.acquire(blocking=False):
+        _email_executor.submit(_send_in_background, name, email, message)
+        return "queued"
+
+    # Backlog full (or inline mode): fall back to sending in the request.
+    if send_email(name, email, message):
+        return "sent"
+    logger.warning(f"Email failed but logging message from {name}: {message}")
+    return "failed"
+
+# Portfolio data is compiled from backend/data.py by backend/compile_data.py
+# into portfolio_data.bin and memory-mapped when each instance starts.
+DATA_ARTIFACT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "portfolio_data.bin")
+ARTIFACT_MAGIC = b"PORTFOLIO-DATA/1\n"
+
+class PortfolioArtifact:
+    """Read-only view of the compiled artifact; see backend/artifact.py"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(ARTIFACT_MAGIC)] != ARTIFACT_MAGIC:
+            raise RuntimeError(f"{path} is not a portfolio data artifact")
+        header_end = self._mm.find(b"\n", len(ARTIFACT_MAGIC))
+        self.header = json.loads(self._mm[len(ARTIFACT_MAGIC):header_end])
+        self._base = header_end + 1
+        self._sections = {}
+
+    def body(self, name):
+        """Pre-rendered JSON bytes for one section"""
+        offset, length = self.header["sections"][name]
+        start = self._base + offset
+        return self._mm[start:start + length]
+
+    def section(self, name):
+        if name not in self._sections:
+            self._sections[name] = json.loads(self.body(name))
+        return self._sections[name]
+
+@lru_cache(maxsize=1)
+def get_artifact():
+    return PortfolioArtifact(DATA_ARTIFACT)
+
+# Fail the deploy (and the emulator) here rather than 500 on every request
+if not os.path.exists(DATA_ARTIFACT):
+    raise RuntimeError(f"{DATA_ARTIFACT} is missing; run `npm run build:data` first")
+get_artifact()
+
+PORTFOLIO_SECTIONS = ("profile", "experience", "projects")
+
+# Field names of ProfileData, Experience and Project in backend/models.py;
+# `fields` and `exclude` only accept these, as the FastAPI endpoint does
+SECTION_FIELDS = {
+    "profile": {"name", "title", "location", "email", "linkedin", "github_user",
+                "about", "skills", "education", "photo"},
+    "experience": {"role", "company", "duration", "location", "description"},
+    "projects": {"title", "github_link", "external_link", "technologies", "description",
+                 "challenge", "featured", "metrics", "duration", "demo_note", "image"}
 }
 
-experience_data = [
-    {
-        "role": "Software Engineering Intern",
-        "company": "Microsoft",
-        "duration": "May 2026 - August 2026",
-        "location": "Mountain View, CA",
-        "metrics": ["<5 min incident resolution", "Text-to-KQL via LLM", "LLM Safety Rails", "Teams Meeting Copilot"],
-        "description": [
-            "Architected an end-to-end autonomous diagnostic pipeline to automate multi-service root-cause analysis for Microsoft Teams Meeting Copilot failures, reducing engineering live-site incident investigation times to under 5 minutes.",
-            "Engineered a Text-to-KQL (Kusto Query Language) translation layer leveraging Large Language Models to map natural language developer queries directly to high-throughput log-store telemetry streams across core Teams Meetings experiences.",
-            "Designed an adaptive React dashboard featuring an embedded AI chat assistant that automatically triages session failures, mapping real-time telemetry and user actions into sequential incident timelines.",
-            "Implemented strict schema-mapping boundaries and deterministic safety rails within the LLM prompt layer to eliminate hallucinations and securely protect production database infrastructure."
-        ]
-    },
-    {
-        "role": "Software Engineering Intern",
-        "company": "Capital One",
-        "duration": "June 2025 - August 2025",
-        "location": "McLean, VA",
-        "metrics": ["~25% uptime improvement", "~60% downtime risk ↓", "99.99% SLO", "~40% MTTD ↓"],
-        "description": [
-            "Engineered a serverless monitoring system (AWS Lambda, ECS, DynamoDB), improving uptime by ~25% and reducing downtime risk by ~60% across mission-critical systems supporting 1,000+ employees.",
-            "Architected Dockerized, event-driven microservices for automated health checks and failure recovery, reducing manual monitoring effort by ~45% and enabling near real-time issue detection.",
-            "Built and integrated observability pipelines using New Relic, AWS CloudWatch, and custom telemetry agents, reducing mean time to detection (MTTD) by ~40% and accelerating incident response by ~35%.",
-            "Collaborated with the Business Cards & Payments Tech team to deliver highly reliable systems meeting 99.99% uptime SLOs and internal compliance standards."
-        ]
-    },
-    {
-        "role": "Technical Director and Backend Engineer",
-        "company": "Roblox (Gochi)",
-        "duration": "June 2024 - June 2025",
-        "location": "Remote",
-        "description": [
-            "Led development of a real-time multiplayer Roblox experience using Node.js, Lua, and service-oriented architecture supporting 2,500+ MAUs, improving stability by 35% and retention by 20%."
-        ]
-    }
-]
-
-projects_data = [
-    {
-        "title": "MealMatch",
-        "github_link": "https://github.com/arjunbojja1/mealmatch",
-        "demo_note": "Demo available on request.",
-        "technologies": ["FastAPI", "SQLite", "Python", "Geospatial", "Write-Through Cache", "Telemetry"],
-        "featured": True,
-        "description": [
-            "Architected a high-performance backend using FastAPI with a write-through caching strategy, utilizing in-memory dictionaries as a hot-path store to achieve <20ms average latency for active listing retrieval.",
-            "Engineered a geospatial \"Smart Match\" engine that ranks listings by proximity and urgency, integrating Google Geocoding and Haversine algorithms to optimize food distribution efficiency by ~30%.",
-            "Developed a robust telemetry and observability framework, implementing automated error-logging pipelines for remote map diagnostics and a role-gated audit system to ensure data integrity across 1,000+ concurrent listing pins.",
-            "Validated system throughput under simulated load, achieving ~250 claims per second while maintaining sub-second consistency between the in-memory state and the persistent SQLite layer."
-        ],
-        "metrics": ["<20ms latency", "~250 claims/sec", "~30% efficiency ↑", "1,000+ concurrent pins"]
-    },
-    {
-        "title": "Niche",
-        "github_link": "https://github.com/arjunbojja1/Niche",
-        "demo_note": "Demo available on request.",
-        "technologies": ["Flask", "Node.js", "Express", "MongoDB", "React", "React Native", "JWT", "Jest", "PyTest"],
-        "featured": False,
-        "description": [
-            "Built a full-stack application featuring a machine learning-based recommendation system (collaborative filtering), improving recommendation relevance and increasing user engagement by ~25%.",
-            "Developed React and React Native frontends with caching, lazy loading, and database indexing, reducing average load time by ~1.5 seconds (~30-40%).",
-            "Designed backend services using Flask, Node.js, and MongoDB (geospatial indexing) to support low-latency, scalable recommendation queries."
-        ],
-        "duration": "September 2025 - Present"
-    },
-    {
-        "title": "StudyBuddy Scheduler",
-        "github_link": "https://github.com/arjunbojja1/studybuddy_scheduler",
-        "demo_note": "Demo coming soon.",
-        "technologies": ["Python", "ReactPy", "FastAPI", "PyTest", "Matplotlib", "ZenQuotes API"],
-        "featured": False,
-        "description": [
-            "Engineered a full-stack scheduling platform using FastAPI and ReactPy, implementing priority queues and greedy algorithms to generate schedules ~35% faster.",
-            "Optimized backend performance and data structures, reducing API response time by ~30% and improving system efficiency.",
-            "Built data visualizations and integrated external APIs, contributing to ~20% increase in daily user engagement."
-        ],
-        "duration": "January 2025 - June 2025"
-    },
-    {
-        "title": "Portfolio Website",
-        "github_link": "https://github.com/arjunbojja1/portfolio",
-        "demo": {
-            "label": "Live Demo",
-            "url": "https://arjun-bojja-portfolio.web.app"
-        },
-        "external_link": "https://arjun-bojja-portfolio.web.app",
-        "technologies": ["React", "TypeScript", "Firebase Functions", "Python", "CSS3", "Firebase Hosting"],
-        "featured": False,
-        "description": [
-            "Built a modern, responsive portfolio website using React and TypeScript with Firebase Functions backend for dynamic content management.",
-            "Implemented advanced UI features including skeleton loading states, animated components, and a dark/light theme system with smooth transitions.",
-            "Integrated a real-time contact form with email notifications and resilient error handling.",
-            "Deployed using Firebase hosting with serverless functions for scalable, reliable performance."
-        ]
-    }
-]
+def _split_param(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+def build_portfolio(include=None, fields=None, exclude=None):
+    """Bundle the requested sections, keeping or dropping `section.field` entries"""
+    sections = _split_param(include) or list(PORTFOLIO_SECTIONS)
+    for section in sections:
+        if section not in PORTFOLIO_SECTIONS:
+            raise ValueError(f"Unknown section: {section}")
+
+    def field_map(value, param):
+        selected = {}
+        for item in _split_param(value):
+            section, _, name = item.partition(".")
+            if name not in SECTION_FIELDS.get(section, ()):
+                raise ValueError(f"Unknown field in {param}: {item}")
+            selected.setdefault(section, set()).add(name)
+        return selected
+
+    only_map, skip_map = field_map(fields, "fields"), field_map(exclude, "exclude")
+
+    def project(item, only, skip):
+        return {k: v for k, v in item.items() if (only is None or k in only) and k not in skip}
+
+    bundle = {}
+    for section in PORTFOLIO_SECTIONS:
+        if section not in sections:
+            continue
+        data = get_artifact().section(section)
+        only, skip = only_map.get(section), skip_map.get(section, set())
+        if only is None and not skip:
+            bundle[section] = data
+        elif isinstance(data, dict):
+            bundle[section] = project(data, only, skip)
+        else:
+            bundle[section] = [project(item, only, skip) for item in data]
+    return bundle
 
 # Simplified CORS response function - no duplicate headers
-def create_response(data, status_code=200):
+def create_response(data, status_code=200, headers=None):
     """Create a simple JSON response without setting CORS headers (handled by decorator)"""
     return https_fn.Response(
         json.dumps(data),
         status=status_code,
-        headers={'Content-Type': 'application/json'}
+        headers={'Content-Type': 'application/json', **(headers or {})}
     )
 
-# Updated function decorators with proper CORS configuration
-@https_fn.on_request(
-    cors=options.CorsOptions(
-        cors_origins=["*"],
-        cors_methods=["GET", "POST", "OPTIONS"]
-    ),
-    memory=options.MemoryOption.MB_256,
-    timeout_sec=60
-)
+# Bodies smaller than this are sent uncompressed; the framing costs more than it saves
+COMPRESS_MIN_SIZE = 512
+
+class Payload:
+    """A JSON body serialized once per instance, with its gzip variant and strong ETag"""
+
+    def __init__(self, body):
+        self.body = bytes(body)
+        self.digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.gzip = gzip.compress(self.body, compresslevel=9, mtime=0) if len(self.body) >= COMPRESS_MIN_SIZE else None
+
+    def etag(self, encoding=None):
+        """Each encoding is its own representation, so it gets its own tag"""
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def matches(self, if_none_match):
+        """Weak comparison against every representation (RFC 9110 13.1.2)"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        for tag in if_none_match.split(","):
+            tag = tag.strip().removeprefix("W/").strip('"')
+            if tag == self.digest or tag.rsplit("-", 1)[0] == self.digest:
+                return True
+        return False
+
+@lru_cache(maxsize=None)
+def section_payload(name):
+    """Pre-rendered artifact section, copied out of the mmap and compressed on first use"""
+    return Payload(get_artifact().body(name))
+
+@lru_cache(maxsize=64)
+def portfolio_payload(include, fields, exclude):
+    """A filtered bundle, memoized per distinct query; ValueError results are not cached"""
+    bundle = build_portfolio(include, fields, exclude)
+    return Payload(json.dumps(bundle, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+def accepts_gzip(accept_encoding):
+    """True if Accept-Encoding lists gzip without q=0"""
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            params = params.strip()
+            try:
+                return not params.startswith("q=") or float(params[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
+def create_payload_response(req, payload):
+    """Send a memoized payload with CDN caching headers, or 304 if the client's copy is current"""
+    encoding = "gzip" if payload.gzip is not None and accepts_gzip(req.headers.get('Accept-Encoding')) else None
+    headers = {
+        'Cache-Control': DATA_CACHE_CONTROL,
+        'ETag': payload.etag(encoding),
+        'Vary': 'Accept-Encoding'
+    }
+    if payload.matches(req.headers.get('If-None-Match')):
+        return https_fn.Response(status=304, headers=headers)
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return https_fn.Response(
+        payload.gzip if encoding else payload.body,
+        status=200,
+        headers={'Content-Type': 'application/json', **headers}
+    )
+
+# HTTP handlers. They are registered as functions at the end of the module:
+# one per route, or behind the single `api` router when SINGLE_ENTRYPOINT is set.
 def get_profile(req: https_fn.Request) -> https_fn.Response:
     """Get profile data"""
     try:
         logger.info("Profile data requested")
-        return create_response(profile_data)
+        return create_payload_response(req, section_payload("profile"))
     except Exception as e:
         logger.error(f"Error fetching profile: {e}")
         return create_response({"error": "Failed to load profile data"}, 500)
 
-@https_fn.on_request(
-    cors=options.CorsOptions(
-        cors_origins=["*"],
-        cors_methods=["GET", "POST", "OPTIONS"]
-    ),
-    memory=options.MemoryOption.MB_256,
-    timeout_sec=60
-)
 def get_experience(req: https_fn.Request) -> https_fn.Response:
     """Get experience data"""
     try:
         logger.info("Experience data requested")
-        return create_response(experience_data)
+        return create_payload_response(req, section_payload("experience"))
     except Exception as e:
         logger.error(f"Error fetching experience: {e}")
         return create_response({"error": "Failed to load experience data"}, 500)
 
-@https_fn.on_request(
-    cors=options.CorsOptions(
-        cors_origins=["*"],
-        cors_methods=["GET", "POST", "OPTIONS"]
-    ),
-    memory=options.MemoryOption.MB_256,
-    timeout_sec=60
-)
 def get_projects(req: https_fn.Request) -> https_fn.Response:
     """Get projects data"""
     try:
         logger.info("Projects data requested")
-        return create_response(projects_data)
+        return create_payload_response(req, section_payload("projects"))
     except Exception as e:
         logger.error(f"Error fetching projects: {e}")
         return create_response({"error": "Failed to load projects data"}, 500)
 
-@https_fn.on_request(
-    cors=options.CorsOptions(
-        cors_origins=["*"],
-        cors_methods=["GET", "POST", "OPTIONS"]
-    ),
-    memory=options.MemoryOption.MB_256,
-    timeout_sec=60
-)
+def get_portfolio(req: https_fn.Request) -> https_fn.Response:
+    """Get profile, experience and projects in one response"""
+    include, fields, exclude = req.args.get("include"), req.args.get("fields"), req.args.get("exclude")
+    try:
+        logger.info("Portfolio data requested")
+        if not (include or fields or exclude):
+            return create_payload_response(req, section_payload("portfolio"))
+        return create_payload_response(req, portfolio_payload(include, fields, exclude))
+    except ValueError as e:
+        return create_response({"error": str(e)}, 400)
+    except Exception as e:
+        logger.error(f"Error fetching portfolio: {e}")
+        return create_response({"error": "Failed to load portfolio data"}, 500)
+
 def health_check(req: https_fn.Request) -> https_fn.Response:
     """Health check endpoint"""
     try:
@@ -299,10 +530,12 @@ def health_check(req: https_fn.Request) -> https_fn.Response:
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "data_counts": {
-                "experience": len(experience_data),
-                "projects": len(projects_data)
+                "experience": len(get_artifact().section("experience")),
+                "projects": len(get_artifact().section("projects"))
             },
-            "email_configured": False
+            "email_configured": False,
+            # Per instance, since the last cold start
+            "contact_filter": dict(contact_filter.decisions)
         }
         logger.info("Health check requested")
         return create_response(health_data)
@@ -310,20 +543,24 @@ def health_check(req: https_fn.Request) -> https_fn.Response:
         logger.error(f"Health check failed: {e}")
         return create_response({"error": "Service unhealthy"}, 500)
 
-@https_fn.on_request(
-    cors=options.CorsOptions(
-        cors_origins=["*"],
-        cors_methods=["GET", "POST", "OPTIONS"]
-    ),
-    memory=options.MemoryOption.MB_256,
-    timeout_sec=60
-)
 def contact_form(req: https_fn.Request) -> https_fn.Response:
     """Handle contact form submissions"""
     try:
+        if req.method == 'GET':
+            # Submit-time token for the form, sent back with the message
+            return create_response({"token": contact_filter.issue_token()}, headers={'Cache-Control': 'no-store'})
         if req.method != 'POST':
             return create_response({"error": "Method not allowed"}, 405)
         
+        retry_after = contact_limiter.retry_after(client_address(req))
+        if retry_after:
+            logger.warning(f"Contact rate limit hit by {client_address(req)}")
+            return create_response(
+                {"error": "Too many messages. Please try again later."},
+                429,
+                {'Retry-After': str(retry_after)}
+            )
+        
         # Parse request data
         request_json = req.get_json()
         if not request_json:
@@ -342,20 +579,94 @@ def contact_form(req: https_fn.Request) -> https_fn.Response:
         
         logger.info(f"Contact form submission from: {name} <{email}>")
         
-        # Attempt to send email
-        email_sent = send_email(name, email, message)
+        decision = contact_filter.check(
+            name, email, message,
+            honeypot=request_json.get('website'),
+            token=request_json.get('token')
+        )
+        if decision != "accepted":
+            # Acknowledged like any other submission, but never sent
+            logger.info(f"Contact submission from {email} dropped by filter: {decision}")
+            return create_response({
+                "message": "Your message has been received! I'll get back to you soon."
+            }, 202)
+        
+        # Hand delivery off so the instance is freed as soon as we respond
+        delivery = dispatch_email(name, email, message)
+        if delivery != "failed":
+            contact_filter.record(email, message)
         
-        if email_sent:
+        if delivery == "sent":
             return create_response({
                 "message": "Thank you for your message! I'll get back to you within 24 hours."
             })
         else:
-            # Log the message even if email fails
-            logger.warning(f"Email failed but logging message from {name}: {message}")
             return create_response({
                 "message": "Your message has been received! I'll get back to you soon."
-            })
+            }, 202 if delivery == "queued" else 200)
         
     except Exception as e:
         logger.error(f"Contact form error: {str(e)}")
-        return create_response({"error": "An error occurred while sending your message. Please try again."}, 500)
\ No newline at end of file
+        return create_response({"error": "An error occurred while sending your message. Please try again."}, 500)
+
+CORS = options.CorsOptions(
+    cors_origins=["*"],
+    cors_methods=["GET", "POST", "OPTIONS"]
+)
+
+# Paths the router accepts, after an optional /api prefix (Hosting rewrites
+# keep it). Function names work too, so clients only swap the host.
+ROUTES = {
+    "profile": get_profile,
+    "experience": get_experience,
+    "projects": get_projects,
+    "portfolio": get_portfolio,
+    "health": health_check,
+    "contact": contact_form,
+    **{handler.__name__: handler for handler in (
+        get_profile, get_experience, get_projects, get_portfolio, health_check, contact_form
+    )}
+}
+
+def route_request(req: https_fn.Request) -> https_fn.Response:
+    """Dispatch a request to the handler for its path"""
+    path = req.path.strip("/")
+    if path == "api" or path.startswith("api/"):
+        path = path[4:]
+    handler = ROUTES.get(path)
+    if handler is None:
+        return create_response({"error": f"Unknown API route: /{path}"}, 404)
+    return handler(req)
+
+if SINGLE_ENTRYPOINT:
+    # One service for every route: instances stay warm for all of them and
+    # share the artifact, rate limiter and spam filter caches
+    api = https_fn.on_request(
+        cors=CORS,
+        memory=options.MemoryOption(API_MEMORY_MB),
+        cpu=API_CPU,
+        concurrency=API_CONCURRENCY,
+        min_instances=API_MIN_INSTANCES,
+        max_instances=API_MAX_INSTANCES,
+        timeout_sec=60
+    )(route_request)
+else:
+    on_route_request = https_fn.on_request(cors=CORS, memory=options.MemoryOption.MB_256, timeout_sec=60)
+    get_profile = on_route_request(get_profile)
+    get_experience = on_route_request(get_experience)
+    get_projects = on_route_request(get_projects)
+    get_portfolio = on_route_request(get_portfolio)
+    health_check = on_route_request(health_check)
+    contact_form = on_route_request(contact_form)
+
+@tasks_fn.on_task_dispatched(
+    retry_config=options.RetryConfig(max_attempts=5, min_backoff_seconds=30),
+    rate_limits=options.RateLimits(max_concurrent_dispatches=2),
+    memory=options.MemoryOption.MB_256,
+    timeout_sec=60
+)
+def deliver_contact_email(req: tasks_fn.CallableRequest) -> None:
+    """Deliver a queued contact message; raising makes Cloud Tasks retry it"""
+    data = req.data
+    if not send_email(data["name"], data["email"], data["message"]):
+        raise RuntimeError(f"Email delivery failed for {data['name']}")